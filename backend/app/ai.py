@@ -1,51 +1,261 @@
+import asyncio
 import json
 import logging
+from typing import AsyncIterator
+import httpx
 import openai
 from app import config
 from app.models.board import ChatMessage
+from app.prompt import PromptBoard, encode_board, expand_operations
 
 logger = logging.getLogger(__name__)
 
-_client = openai.OpenAI(
-    base_url="https://openrouter.ai/api/v1",
+# One pooled HTTP client per worker; the semaphore caps in-flight LLM calls so a
+# burst of chats queues here instead of opening unbounded upstream connections.
+_http_client = httpx.AsyncClient(
+    limits=httpx.Limits(
+        max_connections=config.AI_MAX_CONCURRENCY,
+        max_keepalive_connections=config.AI_MAX_CONCURRENCY,
+    ),
+    timeout=httpx.Timeout(config.AI_TIMEOUT_SECONDS, connect=10.0),
+)
+
+_client = openai.AsyncOpenAI(
+    base_url=config.AI_BASE_URL,
     api_key=config.OPENROUTER_API_KEY,
+    http_client=_http_client,
+    timeout=config.AI_TIMEOUT_SECONDS,
+    max_retries=1,
 )
 
+_concurrency = asyncio.Semaphore(config.AI_MAX_CONCURRENCY)
 
-def call_ai(board: dict, messages: list[ChatMessage]) -> dict:
-    if not config.OPENROUTER_API_KEY:
-        logger.error("OPENROUTER_API_KEY is not configured")
-        return {
-            "message": "AI is not configured. Please set OPENROUTER_API_KEY in your .env file.",
-            "board_update": None,
-        }
 
+def _build_messages(prompt: PromptBoard, messages: list[ChatMessage]) -> list[dict]:
     system_prompt = (
         "You are an AI assistant helping manage a Kanban board. "
-        "The current board state is provided as JSON below.\n\n"
-        f"Board: {json.dumps(board)}\n\n"
+        "The current board is listed below, one section per column in board order. "
+        'Each column header is "## <column id> <title>" and each card row is '
+        '"<card id> | <title> | <details> | @<assignee>". Long details end in "…".\n\n'
+        f"{prompt.text}\n\n"
         "Respond with a JSON object containing:\n"
         '  "message": a string response to the user\n'
-        '  "board_update": an updated BoardData object if changes are needed, or null\n'
+        '  "operations": a list of changes to make to the board, or [] if none. Each is one of:\n'
+        '    {"op": "add_card", "column_id", "title", "details"?, "index"?}\n'
+        '    {"op": "edit_card", "card_id", "title"?, "details"?}\n'
+        '    {"op": "move_card", "card_id", "column_id", "index"?}\n'
+        '    {"op": "delete_card", "card_id"}\n'
+        '    {"op": "add_column", "title", "index"?}\n'
+        '    {"op": "rename_column", "column_id", "title"}\n'
+        '    {"op": "move_column", "column_id", "index"}\n'
+        '    {"op": "delete_column", "column_id"}\n'
+        "  Use the ids shown above. index is the 0-based position in the target column "
+        "(or in the column list); leave it out to append. Fields marked ? are optional.\n"
         "Return only valid JSON."
     )
-
-    openai_messages = [{"role": "system", "content": system_prompt}] + [
+    return [{"role": "system", "content": system_prompt}] + [
         {"role": m.role, "content": m.content} for m in messages
     ]
 
-    response = _client.chat.completions.create(
-        model="openai/gpt-oss-120b",
-        messages=openai_messages,
-        response_format={"type": "json_object"},
-    )
 
-    content = response.choices[0].message.content
+def _encode(board: dict, messages: list[ChatMessage]) -> PromptBoard:
+    query = next((m.content for m in reversed(messages) if m.role == "user"), "")
+    return encode_board(board, query)
+
+
+def _not_configured() -> dict:
+    logger.error("OPENROUTER_API_KEY is not configured")
+    return {
+        "message": "AI is not configured. Please set OPENROUTER_API_KEY in your .env file.",
+        "operations": [],
+    }
+
+
+def _unavailable(exc: Exception) -> dict:
+    logger.error("AI request failed: %s", exc)
+    return {
+        "message": "The AI service is unavailable right now. Please try again.",
+        "operations": [],
+    }
+
+
+def _parse_content(content: str | None, board: dict, prompt: PromptBoard) -> dict:
     try:
-        return json.loads(content)
+        result = json.loads(content)
     except (json.JSONDecodeError, TypeError) as exc:
         logger.error("AI response was not valid JSON: %s | raw=%r", exc, content)
         return {
             "message": "I encountered an error processing my response. Please try again.",
-            "board_update": None,
+            "operations": [],
         }
+    if isinstance(result, dict) and isinstance(result.get("operations"), list):
+        result["operations"] = expand_operations(result["operations"], board, prompt)
+    return result
+
+
+async def call_ai(board: dict, messages: list[ChatMessage]) -> dict:
+    if not config.OPENROUTER_API_KEY:
+        return _not_configured()
+
+    prompt = _encode(board, messages)
+    try:
+        async with _concurrency:
+            response = await _client.chat.completions.create(
+                model=config.AI_MODEL,
+                messages=_build_messages(prompt, messages),
+                response_format={"type": "json_object"},
+            )
+    except openai.APIError as exc:
+        return _unavailable(exc)
+
+    return _parse_content(response.choices[0].message.content, board, prompt)
+
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class MessageStreamParser:
+    """Incrementally decodes the top-level "message" string of a JSON object as it streams in.
+
+    feed() returns the part of the message value decoded from the new chunk; the
+    complete response is still parsed with json.loads once the stream ends.
+    """
+
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string: str | None = None
+        self._expect_message = False
+        self._in_message = False
+
+    def feed(self, chunk: str) -> str:
+        self._buf += chunk
+        out = []
+        buf = self._buf
+        while self._pos < len(buf):
+            ch = buf[self._pos]
+            if self._in_message:
+                if ch == '"':
+                    self._in_message = False
+                    self._pos += 1
+                elif ch == "\\":
+                    decoded, consumed = self._decode_escape(buf, self._pos)
+                    if consumed == 0:
+                        break  # escape sequence split across chunks
+                    out.append(decoded)
+                    self._pos += consumed
+                else:
+                    out.append(ch)
+                    self._pos += 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = buf[self._string_start:self._pos]
+            elif ch.isspace():
+                pass
+            elif self._expect_message:
+                self._expect_message = False
+                if ch == '"':
+                    self._in_message = True
+                    self._pos += 1
+                    continue
+                continue  # re-scan the non-string value normally
+            elif ch == '"':
+                self._in_string = True
+                self._string_start = self._pos + 1
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+            elif ch == ":" and self._depth == 1:
+                self._expect_message = self._last_string == "message"
+            elif ch == ",":
+                self._last_string = None
+            self._pos += 1
+        return "".join(out)
+
+    @staticmethod
+    def _decode_escape(buf: str, pos: int) -> tuple[str, int]:
+        """(text, chars consumed) for the escape at pos, or ("", 0) if it is not complete yet.
+
+        Malformed \\u escapes and unpaired surrogates decode to U+FFFD rather
+        than raising; the final json.loads reports the bad document.
+        """
+        if pos + 1 >= len(buf):
+            return "", 0
+        kind = buf[pos + 1]
+        if kind != "u":
+            return _ESCAPES.get(kind, kind), 2
+        if pos + 6 > len(buf):
+            return "", 0
+        code = _hex4(buf[pos + 2:pos + 6])
+        if code is None:
+            return "\ufffd", 2
+        if 0xD800 <= code < 0xDC00:
+            if pos + 12 > len(buf):
+                return "", 0
+            low = _hex4(buf[pos + 8:pos + 12]) if buf[pos + 6:pos + 8] == "\\u" else None
+            if low is None or not 0xDC00 <= low < 0xE000:
+                return "\ufffd", 6
+            return chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)), 12
+        if 0xDC00 <= code < 0xE000:
+            return "\ufffd", 6
+        return chr(code), 6
+
+
+def _hex4(digits: str) -> int | None:
+    if len(digits) != 4 or any(ch not in "0123456789abcdefABCDEF" for ch in digits):
+        return None
+    return int(digits, 16)
+
+
+async def stream_ai(board: dict, messages: list[ChatMessage]) -> AsyncIterator[tuple[str, object]]:
+    """Stream a chat completion.
+
+    Yields ("token", text) for each decoded piece of the "message" field as it
+    arrives, then a single ("result", dict) with the fully parsed response.
+    """
+    if not config.OPENROUTER_API_KEY:
+        yield "result", _not_configured()
+        return
+
+    prompt = _encode(board, messages)
+    parser = MessageStreamParser()
+    content = []
+    try:
+        async with _concurrency:
+            stream = await _client.chat.completions.create(
+                model=config.AI_MODEL,
+                messages=_build_messages(prompt, messages),
+                response_format={"type": "json_object"},
+                stream=True,
+            )
+            # Closing the stream releases its pooled connection even when the client goes away mid-stream
+            async with stream:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if not delta:
+                        continue
+                    content.append(delta)
+                    text = parser.feed(delta)
+                    if text:
+                        yield "token", text
+    except (openai.APIError, httpx.HTTPError) as exc:
+        # httpx errors raised while iterating the stream are not wrapped in APIError
+        yield "result", _unavailable(exc)
+        return
+
+    yield "result", _parse_content("".join(content), board, prompt)
@@ -0,0 +1,45 @@
+"""Board membership and ownership checks, cached per (board_id, user_id).
+
+A miss costs one query that reads the owner and the caller's membership
+together; a hit is a dictionary lookup. Routes that add or remove members or
+delete boards must call forget_board_access() once they commit.
+"""
+from dataclasses import dataclass
+
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import board_access_cache
+from app.models.board import Board, BoardMember
+
+
+@dataclass(frozen=True)
+class BoardAccess:
+    member: bool
+    owner: bool
+
+
+async def board_access(session: AsyncSession, board_id: str, user_id: str) -> BoardAccess | None:
+    """The user's access to the board, or None if the board does not exist (which is not cached)."""
+    access = board_access_cache.get((board_id, user_id))
+    if access is not None:
+        return access
+    row = (await session.execute(
+        select(Board.owner_id, BoardMember.user_id)
+        .outerjoin(BoardMember, and_(BoardMember.board_id == Board.id, BoardMember.user_id == user_id))
+        .where(Board.id == board_id)
+    )).first()
+    if row is None:
+        return None
+    owner_id, member = row
+    access = BoardAccess(member=member is not None, owner=member is not None and owner_id == user_id)
+    board_access_cache.put((board_id, user_id), access)
+    return access
+
+
+def forget_board_access(board_id: str, user_id: str | None = None) -> None:
+    """Invalidate one user's cached access to the board, or everyone's."""
+    if user_id is None:
+        board_access_cache.discard_prefix(board_id)
+    else:
+        board_access_cache.discard((board_id, user_id))
@@ -0,0 +1,68 @@
+"""Password hashing with scrypt, run off the event loop.
+
+Hashes are stored as `scrypt$<n>$<r>$<p>$<salt>$<hash>` (salt and hash base64).
+scrypt is deliberately CPU- and memory-hard, so the async helpers run it in a
+small thread pool (hashlib releases the GIL while it works); a burst of logins
+then queues for PASSWORD_HASH_WORKERS threads instead of blocking board requests.
+Passwords stored before hashing was introduced are plaintext and still verify,
+and needs_rehash() tells the caller to upgrade them.
+"""
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from app import config
+
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+_PREFIX = "scrypt"
+
+# Hash of a random throwaway password; logins for unknown usernames verify against it
+# so they take as long as logins with a wrong password.
+DUMMY_HASH = "scrypt$16384$8$1$Wm1lvr6N/A+D7X2Mdn4ASQ==$V8OhXm1XPpuqSmurN3D1gTZgdSie4A+x7tEpr62bJjY="
+
+_executor = ThreadPoolExecutor(max_workers=config.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=256 * n * r + 1024 * 1024, dklen=32)
+
+
+def hash_password(password: str) -> str:
+    salt = os.urandom(16)
+    digest = _scrypt(password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+    encoded = [base64.b64encode(part).decode("ascii") for part in (salt, digest)]
+    return "$".join([_PREFIX, str(SCRYPT_N), str(SCRYPT_R), str(SCRYPT_P), *encoded])
+
+
+def verify_password(password: str, stored: str) -> bool:
+    if not stored.startswith(_PREFIX + "$"):
+        return hmac.compare_digest(password.encode(), stored.encode())  # legacy plaintext
+    try:
+        _, n, r, p, salt, digest = stored.split("$")
+        expected = base64.b64decode(digest)
+        actual = _scrypt(password, base64.b64decode(salt), int(n), int(r), int(p))
+    except ValueError:
+        return False
+    return hmac.compare_digest(actual, expected)
+
+
+def needs_rehash(stored: str) -> bool:
+    """True for plaintext passwords and hashes made with other scrypt parameters."""
+    return not stored.startswith(f"{_PREFIX}${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}$")
+
+
+async def _offload(fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(_executor, fn, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    return await _offload(hash_password, password)
+
+
+async def verify_password_async(password: str, stored: str) -> bool:
+    return await _offload(verify_password, password, stored)
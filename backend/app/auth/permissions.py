@@ -1,43 +1,97 @@
+import asyncio
+import logging
 import time
-from dataclasses import dataclass
 from uuid import uuid4
 from fastapi import Depends, Header, HTTPException
 
+from app import config
+from app.auth.sessions import MemorySessionStore, SessionData, SessionStore, build_session_store
+from app.auth.tokens import sign_token, verify_token
+
+logger = logging.getLogger(__name__)
+
 TOKEN_TTL_SECONDS = 3600  # 1 hour
 
+_store: SessionStore = build_session_store(config.SESSION_BACKEND, config.REDIS_URL, config.SESSION_MAX_COUNT)
+
+# token → SessionData for the in-memory backend; empty when another backend is configured
+_sessions: dict[str, SessionData] = _store.sessions if isinstance(_store, MemorySessionStore) else {}
+
+# A random per-process secret would stop tokens verifying after a restart or on any other worker
+if config.AUTH_TOKEN_MODE == "signed" and not config.AUTH_SECRET:
+    raise ValueError("AUTH_TOKEN_MODE=signed requires AUTH_SECRET")
 
-@dataclass
-class SessionData:
-    token: str
-    user_id: str
-    username: str
-    expiry: float
 
+def _signing_secret() -> bytes:
+    return config.AUTH_SECRET.encode()
 
-_sessions: dict[str, SessionData] = {}  # token → SessionData
 
+def get_session_store() -> SessionStore:
+    return _store
 
-def issue_token(user_id: str, username: str) -> str:
+
+def set_session_store(store: SessionStore) -> None:
+    global _store
+    _store = store
+
+
+async def issue_token(user_id: str, username: str) -> str:
+    if config.AUTH_TOKEN_MODE == "signed":
+        return sign_token(user_id, username, time.time() + TOKEN_TTL_SECONDS, _signing_secret())
     token = str(uuid4())
-    _sessions[token] = SessionData(
+    await _store.put(SessionData(
         token=token,
         user_id=user_id,
         username=username,
         expiry=time.time() + TOKEN_TTL_SECONDS,
-    )
+    ))
     return token
 
 
-def revoke_token(token: str) -> None:
-    _sessions.pop(token, None)
+async def revoke_token(token: str) -> None:
+    if config.AUTH_TOKEN_MODE == "signed":
+        session = verify_token(token, _signing_secret())
+        if session is not None:
+            await _store.revoke(token, session.expiry)  # shared, so every worker sees the logout
+        return
+    await _store.delete(token)
+
+
+async def authenticate_token(token: str) -> SessionData | None:
+    """The session for a bearer token, or None if it is unknown, expired or revoked."""
+    if config.AUTH_TOKEN_MODE == "signed":
+        session = verify_token(token, _signing_secret())
+        if session is None or time.time() > session.expiry or await _store.is_revoked(token):
+            return None
+        return session
+    session = await _store.get(token)
+    if session is None or time.time() > session.expiry:
+        await _store.delete(token)
+        return None
+    return session
 
 
 async def require_auth(authorization: str | None = Header(default=None)) -> SessionData:
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Unauthorized")
-    token = authorization.removeprefix("Bearer ")
-    session = _sessions.get(token)
-    if session is None or time.time() > session.expiry:
-        _sessions.pop(token, None)
+    session = await authenticate_token(authorization.removeprefix("Bearer "))
+    if session is None:
         raise HTTPException(status_code=401, detail="Unauthorized")
     return session
+
+
+async def sweep_expired_sessions() -> int:
+    return await _store.sweep(time.time())
+
+
+async def run_session_sweeper(interval: float) -> None:
+    """Remove expired sessions every `interval` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            removed = await sweep_expired_sessions()
+        except Exception:
+            logger.exception("Session sweep failed")
+            continue
+        if removed:
+            logger.info("Swept %d expired sessions", removed)
@@ -0,0 +1,238 @@
+"""Session storage backends for bearer tokens.
+
+The in-memory store is per process, so it only works with a single uvicorn
+worker; it is capped at a maximum size and evicts the least recently used
+session when full. The SQLite and Redis stores keep sessions where every worker can see
+them. Each store also keeps the signed tokens that were logged out, until they
+would have expired anyway, so a logout is seen by every worker sharing it. FakeRedis implements the small subset of the redis.asyncio client that
+RedisSessionStore uses and stands in for a server in tests and benchmarks.
+"""
+import json
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from sqlalchemy import Column as SAColumn, Float, String, delete, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.database import Base
+
+
+@dataclass
+class SessionData:
+    token: str
+    user_id: str
+    username: str
+    expiry: float
+
+
+class SessionStore(ABC):
+    backend = ""
+
+    @abstractmethod
+    async def put(self, session: SessionData) -> None: ...
+
+    @abstractmethod
+    async def get(self, token: str) -> SessionData | None: ...
+
+    @abstractmethod
+    async def delete(self, token: str) -> None: ...
+
+    @abstractmethod
+    async def revoke(self, token: str, expiry: float) -> None:
+        """Record a logged-out signed token; it can be forgotten once `expiry` has passed."""
+
+    @abstractmethod
+    async def is_revoked(self, token: str) -> bool: ...
+
+    async def sweep(self, now: float) -> int:
+        """Remove sessions that expired before `now`, and revocations with them; returns how many sessions were removed."""
+        return 0
+
+    async def stats(self) -> dict:
+        return {"backend": self.backend, "sessions": None, "bytes": None}
+
+
+class MemorySessionStore(SessionStore):
+    backend = "memory"
+
+    def __init__(self, max_sessions: int | None = None):
+        self.sessions: OrderedDict[str, SessionData] = OrderedDict()  # least recently used first
+        self.revoked: dict[str, float] = {}  # token → expiry; never evicted, only swept
+        self.max_sessions = max_sessions
+        self.evicted = 0
+
+    async def put(self, session: SessionData) -> None:
+        self.sessions[session.token] = session
+        self.sessions.move_to_end(session.token)
+        while self.max_sessions is not None and len(self.sessions) > self.max_sessions:
+            self.sessions.popitem(last=False)
+            self.evicted += 1
+
+    async def get(self, token: str) -> SessionData | None:
+        session = self.sessions.get(token)
+        if session is not None:
+            self.sessions.move_to_end(token)
+        return session
+
+    async def delete(self, token: str) -> None:
+        self.sessions.pop(token, None)
+
+    async def revoke(self, token: str, expiry: float) -> None:
+        self.revoked[token] = expiry
+
+    async def is_revoked(self, token: str) -> bool:
+        return token in self.revoked
+
+    async def sweep(self, now: float) -> int:
+        for token in [token for token, expiry in self.revoked.items() if expiry < now]:
+            del self.revoked[token]
+        expired = [token for token, session in self.sessions.items() if session.expiry < now]
+        for token in expired:
+            del self.sessions[token]
+        return len(expired)
+
+    async def stats(self) -> dict:
+        # Shallow sizes of the dict, keys, dataclasses and their field values
+        size = sys.getsizeof(self.sessions) + sum(
+            sys.getsizeof(token) + sys.getsizeof(session) + sum(sys.getsizeof(v) for v in vars(session).values())
+            for token, session in self.sessions.items()
+        )
+        return {
+            "backend": self.backend,
+            "sessions": len(self.sessions),
+            "bytes": size,
+            "max_sessions": self.max_sessions,
+            "evicted": self.evicted,
+        }
+
+
+class AuthSession(Base):
+    __tablename__ = "auth_sessions"
+
+    token = SAColumn(String, primary_key=True)
+    user_id = SAColumn(String, nullable=False)
+    username = SAColumn(String, nullable=False)
+    expiry = SAColumn(Float, nullable=False, index=True)
+
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+
+    token = SAColumn(String, primary_key=True)
+    expiry = SAColumn(Float, nullable=False, index=True)
+
+
+class SqliteSessionStore(SessionStore):
+    backend = "sqlite"
+
+    def __init__(self, session_maker: async_sessionmaker):
+        self._session_maker = session_maker
+
+    async def put(self, session: SessionData) -> None:
+        async with self._session_maker() as db:
+            db.add(AuthSession(**asdict(session)))
+            await db.commit()
+
+    async def get(self, token: str) -> SessionData | None:
+        async with self._session_maker() as db:
+            row = await db.get(AuthSession, token)
+        if row is None:
+            return None
+        return SessionData(token=row.token, user_id=row.user_id, username=row.username, expiry=row.expiry)
+
+    async def delete(self, token: str) -> None:
+        async with self._session_maker() as db:
+            await db.execute(delete(AuthSession).where(AuthSession.token == token))
+            await db.commit()
+
+    async def revoke(self, token: str, expiry: float) -> None:
+        async with self._session_maker() as db:
+            await db.merge(RevokedToken(token=token, expiry=expiry))
+            await db.commit()
+
+    async def is_revoked(self, token: str) -> bool:
+        async with self._session_maker() as db:
+            return await db.get(RevokedToken, token) is not None
+
+    async def sweep(self, now: float) -> int:
+        async with self._session_maker() as db:
+            result = await db.execute(delete(AuthSession).where(AuthSession.expiry < now))
+            await db.execute(delete(RevokedToken).where(RevokedToken.expiry < now))
+            await db.commit()
+        return result.rowcount
+
+    async def stats(self) -> dict:
+        async with self._session_maker() as db:
+            count = (await db.execute(select(func.count()).select_from(AuthSession))).scalar_one()
+        return {"backend": self.backend, "sessions": count, "bytes": None}
+
+
+class RedisSessionStore(SessionStore):
+    """Sessions as JSON strings under `session:<token>` and revocations under
+    `revoked:<token>`, both expired by Redis itself."""
+
+    backend = "redis"
+
+    def __init__(self, client, prefix: str = "session:", revoked_prefix: str = "revoked:"):
+        self._client = client
+        self._prefix = prefix
+        self._revoked_prefix = revoked_prefix
+
+    async def put(self, session: SessionData) -> None:
+        ttl = max(1, int(session.expiry - time.time()))
+        await self._client.set(self._prefix + session.token, json.dumps(asdict(session)), ex=ttl)
+
+    async def get(self, token: str) -> SessionData | None:
+        raw = await self._client.get(self._prefix + token)
+        if raw is None:
+            return None
+        return SessionData(**json.loads(raw))
+
+    async def delete(self, token: str) -> None:
+        await self._client.delete(self._prefix + token)
+
+    async def revoke(self, token: str, expiry: float) -> None:
+        await self._client.set(self._revoked_prefix + token, "1", ex=max(1, int(expiry - time.time())))
+
+    async def is_revoked(self, token: str) -> bool:
+        return await self._client.get(self._revoked_prefix + token) is not None
+
+
+class FakeRedis:
+    """In-process stand-in for the redis.asyncio client (get/set with ex/delete only)."""
+
+    def __init__(self):
+        self._data: dict[str, tuple[str, float | None]] = {}
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> bool:
+        self._data[key] = (value, time.time() + ex if ex is not None else None)
+        return True
+
+    async def get(self, key: str) -> str | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and time.time() >= expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self._data.pop(key, None) is not None for key in keys)
+
+
+def build_session_store(backend: str, redis_url: str = "", max_sessions: int | None = None) -> SessionStore:
+    if backend == "memory":
+        return MemorySessionStore(max_sessions)
+    if backend == "sqlite":
+        from app.database import async_session_maker
+        return SqliteSessionStore(async_session_maker)
+    if backend == "redis":
+        if not redis_url:
+            raise ValueError("SESSION_BACKEND=redis requires REDIS_URL")
+        import redis.asyncio  # optional dependency, only needed for a real Redis server
+        return RedisSessionStore(redis.asyncio.from_url(redis_url, decode_responses=True))
+    raise ValueError(f"Unknown SESSION_BACKEND: {backend!r}")
@@ -0,0 +1,48 @@
+"""HMAC-signed bearer tokens.
+
+A signed token carries the user id, username and expiry itself, so checking it
+needs no session lookup: `<payload>.<signature>`, both base64url without
+padding, where the payload is compact JSON and the signature is HMAC-SHA256 of
+the encoded payload. A random `jti` keeps tokens from the same user and second
+distinct so they can be revoked individually.
+"""
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+
+from app.auth.sessions import SessionData
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _signature(payload: str, secret: bytes) -> str:
+    return _b64encode(hmac.new(secret, payload.encode("ascii"), hashlib.sha256).digest())
+
+
+def sign_token(user_id: str, username: str, expiry: float, secret: bytes) -> str:
+    claims = {"sub": user_id, "name": username, "exp": int(expiry), "jti": secrets.token_urlsafe(8)}
+    payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+    return f"{payload}.{_signature(payload, secret)}"
+
+
+def verify_token(token: str, secret: bytes) -> SessionData | None:
+    """Decode a signed token, or None if it is malformed or the signature does not match.
+
+    Expiry is left to the caller, which compares SessionData.expiry with the clock.
+    """
+    payload, sep, signature = token.partition(".")
+    if not sep or not token.isascii() or not hmac.compare_digest(signature, _signature(payload, secret)):
+        return None
+    try:
+        claims = json.loads(_b64decode(payload))
+        return SessionData(token=token, user_id=claims["sub"], username=claims["name"], expiry=float(claims["exp"]))
+    except (ValueError, KeyError, TypeError):
+        return None
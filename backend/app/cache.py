@@ -0,0 +1,98 @@
+"""In-process caches.
+
+board_cache holds GET /boards/{id} payloads keyed by (board_id, version).
+Every write to a board bumps its version, so entries never need explicit
+invalidation: stale versions are simply never asked for again and age out.
+
+board_access_cache holds membership and ownership keyed by (board_id,
+user_id). Membership changes invalidate it in the worker that made them;
+the TTL bounds how long other workers can act on a stale answer.
+"""
+import time
+from collections import OrderedDict
+
+from app import config
+
+
+class LRUCache:
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, bytes] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> bytes | None:
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: tuple, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old)
+        self._entries[key] = value
+        self._bytes += len(value)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "bytes": self._bytes, "hits": self.hits, "misses": self.misses}
+
+
+class TTLCache:
+    """LRU mapping whose entries also expire `ttl` seconds after they were stored."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple, tuple[float, object]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple, default=None):
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: tuple, value) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: tuple) -> None:
+        self._entries.pop(key, None)
+
+    def discard_prefix(self, *prefix) -> None:
+        """Drop every key that starts with `prefix`, e.g. all users of one board."""
+        for key in [key for key in self._entries if key[:len(prefix)] == prefix]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+board_cache = LRUCache(config.BOARD_CACHE_MAX_ENTRIES, config.BOARD_CACHE_MAX_BYTES)
+board_access_cache = TTLCache(config.BOARD_ACCESS_CACHE_MAX_ENTRIES, config.BOARD_ACCESS_CACHE_TTL_SECONDS)
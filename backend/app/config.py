@@ -5,7 +5,60 @@ from dotenv import load_dotenv
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), "../../.env"))
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./board.db")
+
+# SQLite connection pragmas. WAL lets readers proceed while a write commits; NORMAL sync is durable
+# in WAL mode except for the last transactions on power loss. Cache size is in KiB when negative.
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))  # 64 MiB per connection
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_TEMP_STORE = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "")
 
+AI_BASE_URL = os.getenv("AI_BASE_URL", "https://openrouter.ai/api/v1")
+AI_MODEL = os.getenv("AI_MODEL", "openai/gpt-oss-120b")
+AI_TIMEOUT_SECONDS = float(os.getenv("AI_TIMEOUT_SECONDS", "60"))
+AI_MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "16"))  # in-flight LLM calls per worker
+AI_PROMPT_MAX_CARDS = int(os.getenv("AI_PROMPT_MAX_CARDS", "300"))  # larger boards send the most relevant cards
+AI_PROMPT_DETAILS_CHARS = int(os.getenv("AI_PROMPT_DETAILS_CHARS", "160"))
+
+# Serialized GET /boards/{id} payloads kept per worker, keyed by (board_id, version)
+BOARD_CACHE_MAX_ENTRIES = int(os.getenv("BOARD_CACHE_MAX_ENTRIES", "512"))
+BOARD_CACHE_MAX_BYTES = int(os.getenv("BOARD_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# (board_id, user_id) -> membership/ownership per worker. Another worker's membership change
+# is seen here only once the entry expires, so keep the TTL short when running several workers.
+BOARD_ACCESS_CACHE_MAX_ENTRIES = int(os.getenv("BOARD_ACCESS_CACHE_MAX_ENTRIES", "100000"))
+BOARD_ACCESS_CACHE_TTL_SECONDS = float(os.getenv("BOARD_ACCESS_CACHE_TTL_SECONDS", "30"))
+
+# Cards per column in GET /boards/{id}/window and each page of GET /boards/{id}/columns/{column_id}/cards
+BOARD_PAGE_SIZE = int(os.getenv("BOARD_PAGE_SIZE", "50"))
+BOARD_PAGE_MAX_SIZE = int(os.getenv("BOARD_PAGE_MAX_SIZE", "500"))
+SEARCH_PAGE_SIZE = int(os.getenv("SEARCH_PAGE_SIZE", "20"))  # GET /api/search results when no limit is given
+
+# Cards left unchanged this long in a board's last column move to the archive; 0 disables the archiver.
+# Every worker starts the archiver, but a lease row in worker_leases lets only one of them sweep at a time.
+ARCHIVE_AFTER_DAYS = float(os.getenv("ARCHIVE_AFTER_DAYS", "0"))
+ARCHIVE_SWEEP_INTERVAL_SECONDS = float(os.getenv("ARCHIVE_SWEEP_INTERVAL_SECONDS", "3600"))
+
+# Rows per chunk of GET /boards/{id}/export, and cards per committed batch of POST /boards/import
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "5000"))
+IMPORT_MAX_LINE_BYTES = int(os.getenv("IMPORT_MAX_LINE_BYTES", str(1 << 20)))  # longer lines are rejected with a 400
+
+WS_QUEUE_SIZE = int(os.getenv("WS_QUEUE_SIZE", "64"))  # pending board events per WebSocket before it is dropped
+
+# "memory" keeps sessions in-process (single worker only); "sqlite" and "redis" are shared across workers
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "memory")
+REDIS_URL = os.getenv("REDIS_URL", "")
+SESSION_MAX_COUNT = int(os.getenv("SESSION_MAX_COUNT", "100000"))  # memory backend only; least recently used is evicted
+SESSION_SWEEP_INTERVAL_SECONDS = float(os.getenv("SESSION_SWEEP_INTERVAL_SECONDS", "60"))
+
+# "session" looks tokens up in the session store; "signed" issues HMAC-signed tokens checked without a lookup
+AUTH_TOKEN_MODE = os.getenv("AUTH_TOKEN_MODE", "session")
+AUTH_SECRET = os.getenv("AUTH_SECRET", "")  # required for "signed"; startup fails without it
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))  # scrypt threads per worker
+
 if not OPENROUTER_API_KEY:
     logging.warning("OPENROUTER_API_KEY is not set — AI chat will not function")
@@ -1,10 +1,12 @@
-from sqlalchemy import event
+import time
+
+from sqlalchemy import event, inspect
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
-from app.config import DATABASE_URL
+from app import config
 
-engine = create_async_engine(DATABASE_URL, echo=False)
+engine = create_async_engine(config.DATABASE_URL, echo=False)
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -12,6 +14,12 @@ async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_
 def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute(f"PRAGMA busy_timeout={int(config.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.execute(f"PRAGMA journal_mode={config.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={config.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA cache_size={int(config.SQLITE_CACHE_SIZE)}")
+    cursor.execute(f"PRAGMA mmap_size={int(config.SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA temp_store={config.SQLITE_TEMP_STORE}")
     cursor.close()
 
 Base = declarative_base()
@@ -22,9 +30,89 @@ async def get_session():
         yield session
 
 
+def _add_board_version(conn):
+    conn.exec_driver_sql("ALTER TABLE boards ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+
+
+def _spread_positions(conn):
+    from app.models.ranking import RANK_GAP
+    for table in ("kanban_columns", "kanban_cards"):
+        conn.exec_driver_sql(f"UPDATE {table} SET position = (position + 1) * {RANK_GAP}")
+
+
+def _hash_passwords(conn):
+    from app.auth.passwords import hash_password
+    rows = conn.exec_driver_sql("SELECT id, password FROM users WHERE password NOT LIKE 'scrypt$%'").all()
+    for user_id, password in rows:
+        conn.exec_driver_sql("UPDATE users SET password = ? WHERE id = ?", (hash_password(password), user_id))
+
+
+def _add_indexes(conn):
+    # create_all only creates missing tables, so indexes declared on existing tables are added here
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+def _add_card_updated_at(conn):
+    # Existing cards count as changed now, so none of them is archived as stale straight away
+    if "updated_at" not in {col["name"] for col in inspect(conn).get_columns("kanban_cards")}:
+        conn.exec_driver_sql("ALTER TABLE kanban_cards ADD COLUMN updated_at FLOAT NOT NULL DEFAULT 0")
+        conn.exec_driver_sql("UPDATE kanban_cards SET updated_at = ?", (time.time(),))
+
+
+def _add_card_search(conn):
+    from app.models.board import CARD_SEARCH_DDL
+    if "seq" not in {col["name"] for col in inspect(conn).get_columns("kanban_cards")}:
+        return  # _add_card_seq creates the index along with the rebuilt table
+    for statement in CARD_SEARCH_DDL:
+        conn.exec_driver_sql(statement)
+    conn.exec_driver_sql("INSERT INTO kanban_cards_fts (kanban_cards_fts) VALUES ('rebuild')")
+
+
+def _add_card_seq(conn):
+    """Rebuild kanban_cards around an INTEGER PRIMARY KEY so the FTS index's rowids survive VACUUM."""
+    from app.models.board import KanbanCard
+    if "seq" in {col["name"] for col in inspect(conn).get_columns("kanban_cards")}:
+        return
+    conn.exec_driver_sql("DROP TABLE IF EXISTS kanban_cards_fts")
+    # Index and trigger names are global, so free them before the new table claims them
+    for kind, name in conn.exec_driver_sql(
+        "SELECT type, name FROM sqlite_master WHERE tbl_name = 'kanban_cards' AND type IN ('index', 'trigger') AND sql IS NOT NULL"
+    ).all():
+        conn.exec_driver_sql(f'DROP {kind.upper()} "{name}"')
+    conn.exec_driver_sql("ALTER TABLE kanban_cards RENAME TO kanban_cards_old")
+    KanbanCard.__table__.create(conn)  # with its indexes, FTS table and sync triggers
+    columns = "id, title, details, column_id, position, created_by_id, assigned_to_id, updated_at"
+    conn.exec_driver_sql(f"INSERT INTO kanban_cards ({columns}) SELECT {columns} FROM kanban_cards_old ORDER BY rowid")
+    conn.exec_driver_sql("DROP TABLE kanban_cards_old")
+
+
+# Schema changes for databases created by an older release, applied in order.
+# PRAGMA user_version records how many have run; fresh databases skip them all.
+MIGRATIONS = [
+    _add_board_version,
+    _spread_positions,
+    _hash_passwords,
+    _add_indexes,
+    _add_card_updated_at,
+    _add_card_search,
+    _add_card_seq,
+]
+
+
+def run_migrations(conn):
+    fresh = not inspect(conn).has_table("boards")
+    Base.metadata.create_all(conn)
+    applied = len(MIGRATIONS) if fresh else conn.exec_driver_sql("PRAGMA user_version").scalar()
+    for migration in MIGRATIONS[applied:]:
+        migration(conn)
+    conn.exec_driver_sql(f"PRAGMA user_version = {len(MIGRATIONS)}")
+
+
 async def init_db():
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(run_migrations)
     async with async_session_maker() as session:
         from sqlalchemy import select, func
         from app.models.board import User
@@ -38,10 +126,13 @@ async def seed_db(session: AsyncSession):
     _logger = logging.getLogger(__name__)
 
     from app.models.board import User, Board, BoardMember, KanbanColumn, KanbanCard
+    from app.models.ranking import RANK_GAP
 
-    user = User(id="user-1", username="user", password="password")
-    alice = User(id="user-2", username="alice", password="password")
-    bob = User(id="user-3", username="bob", password="password")
+    # Every seeded user's password is "password", pre-hashed so seeding stays fast
+    password = "scrypt$16384$8$1$qLXYtLgFwXP/Uzz7ER4f/w==$g4nfi74rbOIr3+eTyzBVFFrmX6u6Lb4E9AQcIX0iLWs="
+    user = User(id="user-1", username="user", password=password)
+    alice = User(id="user-2", username="alice", password=password)
+    bob = User(id="user-3", username="bob", password=password)
     for u in [user, alice, bob]:
         session.add(u)
 
@@ -52,24 +143,24 @@ async def seed_db(session: AsyncSession):
         session.add(BoardMember(board_id="board-1", user_id=uid))
 
     columns = [
-        KanbanColumn(id="col-backlog", title="Backlog", position=0, board_id="board-1"),
-        KanbanColumn(id="col-discovery", title="Discovery", position=1, board_id="board-1"),
-        KanbanColumn(id="col-progress", title="In Progress", position=2, board_id="board-1"),
-        KanbanColumn(id="col-review", title="Review", position=3, board_id="board-1"),
-        KanbanColumn(id="col-done", title="Done", position=4, board_id="board-1"),
+        KanbanColumn(id="col-backlog", title="Backlog", position=RANK_GAP, board_id="board-1"),
+        KanbanColumn(id="col-discovery", title="Discovery", position=2 * RANK_GAP, board_id="board-1"),
+        KanbanColumn(id="col-progress", title="In Progress", position=3 * RANK_GAP, board_id="board-1"),
+        KanbanColumn(id="col-review", title="Review", position=4 * RANK_GAP, board_id="board-1"),
+        KanbanColumn(id="col-done", title="Done", position=5 * RANK_GAP, board_id="board-1"),
     ]
     for col in columns:
         session.add(col)
 
     cards = [
-        KanbanCard(id="card-1", title="Align roadmap themes", details="Draft quarterly themes with impact statements and metrics.", column_id="col-backlog", position=0, created_by_id="user-1"),
-        KanbanCard(id="card-2", title="Gather customer signals", details="Review support tags, sales notes, and churn feedback.", column_id="col-backlog", position=1, created_by_id="user-1"),
-        KanbanCard(id="card-3", title="Prototype analytics view", details="Sketch initial dashboard layout and key drill-downs.", column_id="col-discovery", position=0, created_by_id="user-1"),
-        KanbanCard(id="card-4", title="Refine status language", details="Standardize column labels and tone across the board.", column_id="col-progress", position=0, created_by_id="user-1"),
-        KanbanCard(id="card-5", title="Design card layout", details="Add hierarchy and spacing for scanning dense lists.", column_id="col-progress", position=1, created_by_id="user-1"),
-        KanbanCard(id="card-6", title="QA micro-interactions", details="Verify hover, focus, and loading states.", column_id="col-review", position=0, created_by_id="user-1"),
-        KanbanCard(id="card-7", title="Ship marketing page", details="Final copy approved and asset pack delivered.", column_id="col-done", position=0, created_by_id="user-1"),
-        KanbanCard(id="card-8", title="Close onboarding sprint", details="Document release notes and share internally.", column_id="col-done", position=1, created_by_id="user-1"),
+        KanbanCard(id="card-1", title="Align roadmap themes", details="Draft quarterly themes with impact statements and metrics.", column_id="col-backlog", position=RANK_GAP, created_by_id="user-1"),
+        KanbanCard(id="card-2", title="Gather customer signals", details="Review support tags, sales notes, and churn feedback.", column_id="col-backlog", position=2 * RANK_GAP, created_by_id="user-1"),
+        KanbanCard(id="card-3", title="Prototype analytics view", details="Sketch initial dashboard layout and key drill-downs.", column_id="col-discovery", position=RANK_GAP, created_by_id="user-1"),
+        KanbanCard(id="card-4", title="Refine status language", details="Standardize column labels and tone across the board.", column_id="col-progress", position=RANK_GAP, created_by_id="user-1"),
+        KanbanCard(id="card-5", title="Design card layout", details="Add hierarchy and spacing for scanning dense lists.", column_id="col-progress", position=2 * RANK_GAP, created_by_id="user-1"),
+        KanbanCard(id="card-6", title="QA micro-interactions", details="Verify hover, focus, and loading states.", column_id="col-review", position=RANK_GAP, created_by_id="user-1"),
+        KanbanCard(id="card-7", title="Ship marketing page", details="Final copy approved and asset pack delivered.", column_id="col-done", position=RANK_GAP, created_by_id="user-1"),
+        KanbanCard(id="card-8", title="Close onboarding sprint", details="Document release notes and share internally.", column_id="col-done", position=2 * RANK_GAP, created_by_id="user-1"),
     ]
     for card in cards:
         session.add(card)
@@ -1,14 +1,21 @@
+import asyncio
 import logging
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 
+from app import config
+from app.auth.permissions import get_session_store, run_session_sweeper
+from app.cache import board_access_cache, board_cache
+from app.realtime import board_hub
 from app.database import init_db
+from app.models.archive import run_card_archiver
 from app.routes.auth import router as auth_router
 from app.routes.boards import router as boards_router
 from app.routes.chat import router as chat_router
+from app.routes.search import router as search_router
 
 logging.basicConfig(
     level=logging.INFO,
@@ -22,7 +29,16 @@ async def lifespan(app: FastAPI):
     logger.info("Starting up — initialising database")
     await init_db()
     logger.info("Database ready")
+    tasks = [asyncio.create_task(run_session_sweeper(config.SESSION_SWEEP_INTERVAL_SECONDS))]
+    if config.ARCHIVE_AFTER_DAYS > 0:
+        tasks.append(asyncio.create_task(
+            run_card_archiver(config.ARCHIVE_SWEEP_INTERVAL_SECONDS, config.ARCHIVE_AFTER_DAYS)
+        ))
     yield
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
 
 
 app = FastAPI(lifespan=lifespan)
@@ -30,6 +46,7 @@ app = FastAPI(lifespan=lifespan)
 app.include_router(auth_router, prefix="/api")
 app.include_router(boards_router, prefix="/api")
 app.include_router(chat_router, prefix="/api")
+app.include_router(search_router, prefix="/api")
 
 
 @app.get("/api/health")
@@ -37,6 +54,16 @@ async def health():
     return {"status": "ok"}
 
 
+@app.get("/api/metrics")
+async def metrics():
+    return {
+        "sessions": await get_session_store().stats(),
+        "board_cache": board_cache.stats(),
+        "board_access_cache": board_access_cache.stats(),
+        "websockets": board_hub.stats(),
+    }
+
+
 FRONTEND_OUT = os.path.join(os.path.dirname(__file__), "../../frontend/out")
 
 if os.path.isdir(FRONTEND_OUT):
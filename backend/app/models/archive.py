@@ -0,0 +1,329 @@
+"""Moving cards between kanban_cards and the archived_cards cold table.
+
+Archived cards leave the hot table entirely, so board reads, board_to_db diffs
+and the board snapshot sent to the assistant only ever see active work. Both
+directions are set-based: one INSERT ... SELECT and one DELETE per call,
+inside the board's write transaction.
+"""
+import asyncio
+import logging
+import time
+from uuid import uuid4
+
+from pydantic import BaseModel
+from sqlalchemy import Column as SAColumn, Float, String, and_, delete, func, literal, or_, select, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.database import Base
+from app.models.board import (
+    ArchivedCard, BoardNotFound, CardSchema, KanbanCard, KanbanColumn, User, bump_board_version,
+)
+from app.models.ops import BoardOpError
+from app.models.ranking import RANK_GAP
+
+logger = logging.getLogger(__name__)
+
+_ARCHIVED_FIELDS = [
+    "id", "board_id", "column_id", "column_title", "title", "details", "position",
+    "created_by_id", "assigned_to_id", "updated_at", "archived_at",
+]
+
+
+class WorkerLease(Base):
+    """A background job that only one worker at a time should run, and which worker holds it until when."""
+
+    __tablename__ = "worker_leases"
+
+    name = SAColumn(String, primary_key=True)
+    holder = SAColumn(String, nullable=False)
+    expires_at = SAColumn(Float, nullable=False)
+
+
+class ArchiveConflict(BoardOpError):
+    """Card ids that another board's archive, or a live card, already holds."""
+
+
+class ArchiveRequest(BaseModel):
+    column_id: str | None = None
+    card_ids: list[str] | None = None
+    older_than_days: float | None = None  # only cards unchanged for at least this long
+    expected_version: int | None = None
+
+
+class RestoreRequest(BaseModel):
+    card_ids: list[str]
+    expected_version: int | None = None
+
+
+class ArchiveResult(BaseModel):
+    version: int
+    count: int
+
+
+class ArchivedCardSchema(CardSchema):
+    column_id: str
+    column_title: str
+    archived_at: float
+
+
+class ArchivePage(BaseModel):
+    cards: list[ArchivedCardSchema]
+    nextCursor: str | None = None
+
+
+async def archive_cards(
+    session: AsyncSession,
+    board_id: str,
+    column_id: str | None = None,
+    card_ids: list[str] | None = None,
+    older_than: float | None = None,
+    expected_version: int | None = None,
+) -> ArchiveResult:
+    """Move the board's cards matching every given filter into the archive.
+
+    older_than is a Unix time; cards updated after it stay. When nothing
+    matches the transaction is rolled back and the version left alone.
+    Raises BoardVersionConflict if expected_version is given and stale, and
+    ArchiveConflict if another board's archive holds one of the ids.
+    """
+    if column_id is None and card_ids is None:
+        raise BoardOpError("Give a column_id or card_ids to archive")
+    version = await bump_board_version(session, board_id, expected_version)
+
+    conditions = [KanbanColumn.board_id == board_id]
+    if column_id is not None:
+        conditions.append(KanbanCard.column_id == column_id)
+    if card_ids is not None:
+        conditions.append(KanbanCard.id.in_(card_ids))
+    if older_than is not None:
+        conditions.append(KanbanCard.updated_at < older_than)
+    matching = select(KanbanCard.id).join(KanbanColumn, KanbanColumn.id == KanbanCard.column_id).where(*conditions)
+    taken = (await session.execute(
+        select(ArchivedCard.id).where(ArchivedCard.id.in_(matching), ArchivedCard.board_id != board_id)
+    )).scalars().all()
+    if taken:
+        await session.rollback()
+        raise ArchiveConflict(f"Archived on another board: {', '.join(sorted(taken))}")
+
+    stmt = sqlite_insert(ArchivedCard).from_select(
+        _ARCHIVED_FIELDS,
+        select(
+            KanbanCard.id, literal(board_id), KanbanCard.column_id, KanbanColumn.title, KanbanCard.title,
+            KanbanCard.details, KanbanCard.position, KanbanCard.created_by_id, KanbanCard.assigned_to_id,
+            KanbanCard.updated_at, literal(time.time()),
+        )
+        .join(KanbanColumn, KanbanColumn.id == KanbanCard.column_id)
+        .where(*conditions),
+    )
+    # A card re-created under an archived id (e.g. by a stale PATCH) replaces the older copy of the same board
+    await session.execute(stmt.on_conflict_do_update(
+        index_elements=[ArchivedCard.id],
+        set_={name: stmt.excluded[name] for name in _ARCHIVED_FIELDS if name != "id"},
+        where=ArchivedCard.board_id == stmt.excluded.board_id,
+    ))
+    count = (await session.execute(delete(KanbanCard).where(KanbanCard.id.in_(matching)))).rowcount
+    if not count:
+        await session.rollback()
+        return ArchiveResult(version=version - 1, count=0)
+    await session.commit()
+    return ArchiveResult(version=version, count=count)
+
+
+async def restore_cards(
+    session: AsyncSession,
+    board_id: str,
+    card_ids: list[str],
+    expected_version: int | None = None,
+) -> ArchiveResult:
+    """Move archived cards back to the end of their column, or of the first column if theirs is gone.
+
+    Raises BoardOpError if the board has no columns left to restore into, and
+    ArchiveConflict, restoring nothing, if a live card already has one of the ids.
+    """
+    version = await bump_board_version(session, board_id, expected_version)
+    archived = (await session.execute(
+        select(ArchivedCard)
+        .where(ArchivedCard.board_id == board_id, ArchivedCard.id.in_(card_ids))
+        .order_by(ArchivedCard.column_id, ArchivedCard.position)
+    )).scalars().all()
+    if not archived:
+        await session.rollback()
+        return ArchiveResult(version=version - 1, count=0)
+
+    columns = (await session.execute(
+        select(KanbanColumn.id, func.max(KanbanCard.position))
+        .outerjoin(KanbanCard, KanbanCard.column_id == KanbanColumn.id)
+        .where(KanbanColumn.board_id == board_id)
+        .group_by(KanbanColumn.id)
+        .order_by(KanbanColumn.position)
+    )).all()
+    if not columns:
+        await session.rollback()
+        raise BoardOpError("Board has no columns to restore cards into")
+    last_rank = {col_id: max_position or 0 for col_id, max_position in columns}
+    fallback = columns[0][0]
+
+    now = time.time()
+    rows = []
+    for card in archived:
+        column_id = card.column_id if card.column_id in last_rank else fallback
+        last_rank[column_id] += RANK_GAP
+        rows.append({
+            "id": card.id,
+            "title": card.title,
+            "details": card.details,
+            "column_id": column_id,
+            "position": last_rank[column_id],
+            "created_by_id": card.created_by_id,
+            "assigned_to_id": card.assigned_to_id,
+            "updated_at": now,
+        })
+    # Card ids are global, so a live card on any board may have taken one since it was archived
+    inserted = set((await session.execute(
+        sqlite_insert(KanbanCard).on_conflict_do_nothing(index_elements=[KanbanCard.id]).returning(KanbanCard.id),
+        rows,
+    )).scalars().all())
+    if len(inserted) < len(rows):
+        await session.rollback()
+        taken = sorted(row["id"] for row in rows if row["id"] not in inserted)
+        raise ArchiveConflict(f"Cards already exist: {', '.join(taken)}")
+    await session.execute(delete(ArchivedCard).where(ArchivedCard.id.in_(inserted)))
+    await session.commit()
+    return ArchiveResult(version=version, count=len(archived))
+
+
+def encode_archive_cursor(archived_at: float, card_id: str) -> str:
+    return f"{archived_at!r}:{card_id}"
+
+
+def decode_archive_cursor(cursor: str) -> tuple[float, str]:
+    """Inverse of encode_archive_cursor; raises ValueError for anything it did not produce."""
+    archived_at, sep, card_id = cursor.partition(":")
+    if not sep or not card_id:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return float(archived_at), card_id
+
+
+async def list_archived_cards(
+    session: AsyncSession,
+    board_id: str,
+    limit: int,
+    after: tuple[float, str] | None = None,
+    column_id: str | None = None,
+    query: str | None = None,
+) -> ArchivePage:
+    """Most recently archived first, keyset-paginated on (archived_at, id).
+
+    query is a case-insensitive substring of the title or details.
+    """
+    creator = aliased(User)
+    assignee = aliased(User)
+    stmt = (
+        select(ArchivedCard, creator.username, assignee.username)
+        .outerjoin(creator, ArchivedCard.created_by_id == creator.id)
+        .outerjoin(assignee, ArchivedCard.assigned_to_id == assignee.id)
+        .where(ArchivedCard.board_id == board_id)
+        .order_by(ArchivedCard.archived_at.desc(), ArchivedCard.id.desc())
+        .limit(limit + 1)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(ArchivedCard.archived_at, ArchivedCard.id) < tuple_(*after))
+    if column_id is not None:
+        stmt = stmt.where(ArchivedCard.column_id == column_id)
+    if query:
+        pattern = f"%{query}%"
+        stmt = stmt.where(ArchivedCard.title.ilike(pattern) | ArchivedCard.details.ilike(pattern))
+    rows = (await session.execute(stmt)).all()
+
+    cards = [
+        ArchivedCardSchema(
+            id=card.id, title=card.title, details=card.details or "",
+            created_by=created_by, assigned_to=assigned_to,
+            column_id=card.column_id, column_title=card.column_title, archived_at=card.archived_at,
+        )
+        for card, created_by, assigned_to in rows[:limit]
+    ]
+    next_cursor = encode_archive_cursor(cards[-1].archived_at, cards[-1].id) if len(rows) > limit else None
+    return ArchivePage(cards=cards, nextCursor=next_cursor)
+
+
+async def archive_stale_done_cards(session: AsyncSession, after_days: float) -> list[tuple[str, ArchiveResult]]:
+    """Archive cards left untouched for after_days in the last column of every board.
+
+    Returns (board_id, result) for each board that lost cards.
+    """
+    cutoff = time.time() - after_days * 86400
+    last_column = (
+        select(
+            KanbanColumn.board_id,
+            KanbanColumn.id,
+            func.row_number().over(
+                partition_by=KanbanColumn.board_id, order_by=(KanbanColumn.position.desc(), KanbanColumn.id.desc()),
+            ).label("rank"),
+        )
+        .subquery()
+    )
+    targets = (await session.execute(
+        select(last_column.c.board_id, last_column.c.id)
+        .where(last_column.c.rank == 1)
+        .where(
+            select(KanbanCard.id)
+            .where(and_(KanbanCard.column_id == last_column.c.id, KanbanCard.updated_at < cutoff))
+            .exists()
+        )
+    )).all()
+    archived = []
+    for board_id, column_id in targets:
+        try:
+            result = await archive_cards(session, board_id, column_id=column_id, older_than=cutoff)
+        except BoardNotFound:
+            continue  # deleted since the sweep query
+        if result.count:
+            archived.append((board_id, result))
+    return archived
+
+
+async def hold_lease(session: AsyncSession, name: str, holder: str, ttl: float) -> bool:
+    """Take or renew the named lease for `ttl` seconds; False while another holder's lease is current.
+
+    One upsert under SQLite's write lock, so two workers can never both win.
+    """
+    now = time.time()
+    stmt = sqlite_insert(WorkerLease).values(name=name, holder=holder, expires_at=now + ttl)
+    await session.execute(stmt.on_conflict_do_update(
+        index_elements=[WorkerLease.name],
+        set_={"holder": stmt.excluded.holder, "expires_at": stmt.excluded.expires_at},
+        where=or_(WorkerLease.holder == holder, WorkerLease.expires_at < now),
+    ))
+    current = (await session.execute(select(WorkerLease.holder).where(WorkerLease.name == name))).scalar_one()
+    await session.commit()
+    return current == holder
+
+
+async def run_card_archiver(interval: float, after_days: float) -> None:
+    """Archive stale cards from each board's last column every `interval` seconds until cancelled.
+
+    Every worker runs this loop, but only the one holding the "card_archiver"
+    lease sweeps. It renews the lease on each pass; if it stops, another
+    worker takes over once the lease lapses after two intervals.
+    """
+    from app.database import async_session_maker
+    from app.realtime import publish_board_change
+
+    holder = uuid4().hex
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with async_session_maker() as session:
+                if not await hold_lease(session, "card_archiver", holder, 2 * interval):
+                    continue
+                archived = await archive_stale_done_cards(session, after_days)
+        except Exception:
+            logger.exception("Card archiving failed")
+            continue
+        for board_id, result in archived:
+            publish_board_change(board_id, result.version, "archive")
+        if archived:
+            logger.info("Archived %d stale cards on %d boards", sum(r.count for _, r in archived), len(archived))
@@ -0,0 +1,95 @@
+"""Assigning many cards in one board write.
+
+One query resolves the usernames, one checks that every card is on the board
+(and reads what the response needs), and one UPDATE applies the assignments,
+all inside the board's write transaction. Each statement takes at most
+ASSIGN_CHUNK_SIZE cards, so a large request runs a few of each.
+"""
+import time
+
+from pydantic import BaseModel
+from sqlalchemy import case, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.board import CardSchema, KanbanCard, KanbanColumn, User, bump_board_version
+from app.models.ops import BoardOpError, BoardOpNotFound
+
+# The UPDATE binds three parameters per card (two in its CASE, one in its IN list);
+# this keeps every statement under SQLite's historical 999-variable default
+ASSIGN_CHUNK_SIZE = 300
+
+
+def _chunks(items: list) -> list[list]:
+    return [items[start:start + ASSIGN_CHUNK_SIZE] for start in range(0, len(items), ASSIGN_CHUNK_SIZE)]
+
+
+class CardAssignment(BaseModel):
+    card_id: str
+    username: str | None  # None unassigns
+
+
+class BulkAssignRequest(BaseModel):
+    assignments: list[CardAssignment]
+    expected_version: int | None = None
+
+
+class BulkAssignResult(BaseModel):
+    version: int
+    cards: list[CardSchema]
+
+
+async def assign_cards(
+    session: AsyncSession,
+    board_id: str,
+    assignments: list[CardAssignment],
+    expected_version: int | None = None,
+) -> BulkAssignResult:
+    """Set the assignee of each card; a card listed twice gets its last assignment.
+
+    All or nothing: raises BoardOpNotFound naming the cards not on this board
+    or the usernames that do not exist, and BoardVersionConflict if
+    expected_version is given and stale.
+    """
+    if not assignments:
+        raise BoardOpError("No assignments given")
+    wanted = {a.card_id: a.username for a in assignments}
+    version = await bump_board_version(session, board_id, expected_version)
+
+    usernames = sorted({name for name in wanted.values() if name is not None})
+    user_ids = {}
+    for names in _chunks(usernames):
+        user_ids.update((await session.execute(select(User.username, User.id).where(User.username.in_(names)))).all())
+    unknown = set(usernames) - user_ids.keys()
+    if unknown:
+        await session.rollback()
+        raise BoardOpNotFound(f"User not found: {', '.join(sorted(unknown))}")
+
+    creator = aliased(User)
+    cards = []
+    for card_ids in _chunks(list(wanted)):
+        cards += (await session.execute(
+            select(KanbanCard.id, KanbanCard.title, KanbanCard.details, creator.username)
+            .join(KanbanColumn, KanbanColumn.id == KanbanCard.column_id)
+            .outerjoin(creator, KanbanCard.created_by_id == creator.id)
+            .where(KanbanColumn.board_id == board_id, KanbanCard.id.in_(card_ids))
+        )).all()
+    missing = wanted.keys() - {card_id for card_id, *_ in cards}
+    if missing:
+        await session.rollback()
+        raise BoardOpNotFound(f"Card not found: {', '.join(sorted(missing))}")
+
+    now = time.time()
+    for card_ids in _chunks(list(wanted)):
+        assignee_ids = {card_id: user_ids.get(wanted[card_id]) for card_id in card_ids}
+        await session.execute(
+            update(KanbanCard)
+            .where(KanbanCard.id.in_(card_ids))
+            .values(assigned_to_id=case(assignee_ids, value=KanbanCard.id), updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+    await session.commit()
+    return BulkAssignResult(version=version, cards=[
+        CardSchema(id=card_id, title=title, details=details or "", created_by=created_by, assigned_to=wanted[card_id])
+        for card_id, title, details, created_by in cards
+    ])
@@ -1,10 +1,22 @@
+import json
+import time
 from typing import Literal
-from sqlalchemy import Column as SAColumn, String, Integer, ForeignKey, delete, select
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    DDL, Column as SAColumn, Float, String, Integer, ForeignKey, Index,
+    and_, delete, event, func, select, tuple_, union_all, update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import aliased, relationship
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
 from app.database import Base
+from app.models.ranking import assign_ranks
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; the stdlib encoder produces the same bytes
+    orjson = None
 
 
 class User(Base):
@@ -20,10 +32,12 @@ class User(Base):
 
 class Board(Base):
     __tablename__ = "boards"
+    __table_args__ = (Index("ix_boards_owner_id", "owner_id"),)
 
     id = SAColumn(String, primary_key=True)
     title = SAColumn(String, nullable=False)
     owner_id = SAColumn(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    version = SAColumn(Integer, nullable=False, default=0, server_default="0")
 
     owner = relationship("User", back_populates="owned_boards")
     members = relationship("BoardMember", back_populates="board", cascade="all, delete-orphan")
@@ -32,6 +46,8 @@ class Board(Base):
 
 class BoardMember(Base):
     __tablename__ = "board_members"
+    # The primary key covers lookups by board; list_boards looks up by user
+    __table_args__ = (Index("ix_board_members_user_id", "user_id"),)
 
     board_id = SAColumn(String, ForeignKey("boards.id", ondelete="CASCADE"), primary_key=True)
     user_id = SAColumn(String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
@@ -42,6 +58,7 @@ class BoardMember(Base):
 
 class KanbanColumn(Base):
     __tablename__ = "kanban_columns"
+    __table_args__ = (Index("ix_kanban_columns_board_position", "board_id", "position"),)
 
     id = SAColumn(String, primary_key=True)
     title = SAColumn(String, nullable=False)
@@ -53,20 +70,71 @@ class KanbanColumn(Base):
 
 class KanbanCard(Base):
     __tablename__ = "kanban_cards"
+    __table_args__ = (
+        Index("ix_kanban_cards_column_position", "column_id", "position"),
+        Index("ix_kanban_cards_assigned_to_id", "assigned_to_id"),
+        Index("ix_kanban_cards_created_by_id", "created_by_id"),
+    )
 
-    id = SAColumn(String, primary_key=True)
+    # INTEGER PRIMARY KEY makes this the rowid itself, which VACUUM never renumbers; the FTS
+    # index refers to cards by it. Everything else addresses cards by their string id.
+    seq = SAColumn(Integer, primary_key=True)
+    id = SAColumn(String, nullable=False, unique=True)
     title = SAColumn(String, nullable=False)
     details = SAColumn(String, default="")
     column_id = SAColumn(String, ForeignKey("kanban_columns.id", ondelete="CASCADE"), nullable=False)
     position = SAColumn(Integer, nullable=False)
     created_by_id = SAColumn(String, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     assigned_to_id = SAColumn(String, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    # Unix time of the last insert or update; upserts must set it explicitly
+    updated_at = SAColumn(Float, nullable=False, default=time.time, onupdate=time.time, server_default="0")
 
     column = relationship("KanbanColumn", back_populates="cards")
     created_by = relationship("User", foreign_keys=[created_by_id])
     assigned_to = relationship("User", foreign_keys=[assigned_to_id])
 
 
+# Full-text index over card titles and details. External content: the FTS table
+# stores only the index and reads the text back from kanban_cards by seq, and
+# triggers keep it in step with every insert, delete and text change.
+CARD_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS kanban_cards_fts USING fts5("
+    "title, details, content='kanban_cards', content_rowid='seq', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS kanban_cards_fts_insert AFTER INSERT ON kanban_cards BEGIN "
+    "INSERT INTO kanban_cards_fts (rowid, title, details) VALUES (new.seq, new.title, new.details); END",
+    "CREATE TRIGGER IF NOT EXISTS kanban_cards_fts_delete AFTER DELETE ON kanban_cards BEGIN "
+    "INSERT INTO kanban_cards_fts (kanban_cards_fts, rowid, title, details) "
+    "VALUES ('delete', old.seq, old.title, old.details); END",
+    # Moves rewrite title and details too (board_to_db upserts whole rows), so only reindex real text changes
+    "CREATE TRIGGER IF NOT EXISTS kanban_cards_fts_update AFTER UPDATE OF title, details ON kanban_cards "
+    "WHEN old.title IS NOT new.title OR old.details IS NOT new.details BEGIN "
+    "INSERT INTO kanban_cards_fts (kanban_cards_fts, rowid, title, details) "
+    "VALUES ('delete', old.seq, old.title, old.details); "
+    "INSERT INTO kanban_cards_fts (rowid, title, details) VALUES (new.seq, new.title, new.details); END",
+]
+for _statement in CARD_SEARCH_DDL:
+    event.listen(KanbanCard.__table__, "after_create", DDL(_statement))
+
+
+class ArchivedCard(Base):
+    """A card moved out of kanban_cards. Board reads never touch this table."""
+    __tablename__ = "archived_cards"
+    __table_args__ = (Index("ix_archived_cards_board_archived_at", "board_id", "archived_at"),)
+
+    id = SAColumn(String, primary_key=True)
+    board_id = SAColumn(String, ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
+    # No foreign key: the column may be deleted while its cards sit in the archive
+    column_id = SAColumn(String, nullable=False)
+    column_title = SAColumn(String, nullable=False)
+    title = SAColumn(String, nullable=False)
+    details = SAColumn(String, default="")
+    position = SAColumn(Integer, nullable=False)
+    created_by_id = SAColumn(String, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    assigned_to_id = SAColumn(String, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    updated_at = SAColumn(Float, nullable=False)
+    archived_at = SAColumn(Float, nullable=False)
+
+
 class CardSchema(BaseModel):
     id: str
     title: str
@@ -86,6 +154,24 @@ class BoardData(BaseModel):
     cards: dict[str, CardSchema]
 
 
+class WindowColumnSchema(ColumnSchema):
+    cardCount: int                   # cards in the column, loaded or not
+    nextCursor: str | None = None    # pass as `after` to fetch the cards following cardIds
+
+
+class BoardWindow(BaseModel):
+    version: int
+    columns: list[WindowColumnSchema]
+    cards: dict[str, CardSchema]
+
+
+class CardPage(BaseModel):
+    version: int
+    cardIds: list[str]
+    cards: dict[str, CardSchema]
+    nextCursor: str | None = None
+
+
 class BoardSummary(BaseModel):
     id: str
     title: str
@@ -106,132 +192,383 @@ class ChatRequest(BaseModel):
     messages: list[ChatMessage]
     board: BoardData
     board_id: str
+    board_version: int | None = None  # version of `board`; AI changes are dropped if the board moved on
+
+
+class BoardOpsResult(BaseModel):
+    version: int
+    columns: list[ColumnSchema] = []          # touched columns with their full card order
+    cards: dict[str, CardSchema] = {}         # created or edited cards
+    deleted_card_ids: list[str] = []
+    deleted_column_ids: list[str] = []
+    column_order: list[str] | None = None     # set when columns were added, moved or deleted
 
 
 class ChatResponse(BaseModel):
     message: str
-    board_update: BoardData | None = None
+    changes: BoardOpsResult | None = None
+
+
+def board_read_query(board_id: str, user_id: str):
+    """One query for a board view: membership, version, columns, cards and usernames.
+
+    Yields no rows when the board does not exist, and a single row with a NULL
+    member when the user is not a member. Otherwise the member is set on every
+    row and there is one row per card, plus one with NULL card fields for each
+    empty column, ordered by column then card position.
+    """
+    creator = aliased(User)
+    assignee = aliased(User)
+    return (
+        select(
+            BoardMember.user_id,
+            Board.version,
+            KanbanColumn.id,
+            KanbanColumn.title,
+            KanbanCard.id,
+            KanbanCard.title,
+            KanbanCard.details,
+            creator.username,
+            assignee.username,
+        )
+        .select_from(Board)
+        .outerjoin(BoardMember, and_(BoardMember.board_id == Board.id, BoardMember.user_id == user_id))
+        .outerjoin(KanbanColumn, and_(KanbanColumn.board_id == Board.id, BoardMember.user_id.is_not(None)))
+        .outerjoin(KanbanCard, KanbanCard.column_id == KanbanColumn.id)
+        .outerjoin(creator, KanbanCard.created_by_id == creator.id)
+        .outerjoin(assignee, KanbanCard.assigned_to_id == assignee.id)
+        .where(Board.id == board_id)
+        .order_by(KanbanColumn.position, KanbanColumn.id, KanbanCard.position, KanbanCard.id)
+    )
 
 
-async def db_to_board(session: AsyncSession, board_id: str) -> BoardData:
-    result = await session.execute(
-        select(KanbanColumn)
+def rows_to_board(rows) -> BoardData:
+    """Build BoardData from board_read_query rows."""
+    columns: dict[str, ColumnSchema] = {}
+    cards: dict[str, CardSchema] = {}
+    for _, _, col_id, col_title, card_id, title, details, created_by, assigned_to in rows:
+        if col_id is None:
+            continue
+        column = columns.get(col_id)
+        if column is None:
+            column = columns[col_id] = ColumnSchema(id=col_id, title=col_title, cardIds=[])
+        if card_id is not None:
+            column.cardIds.append(card_id)
+            cards[card_id] = CardSchema(
+                id=card_id, title=title, details=details or "", created_by=created_by, assigned_to=assigned_to,
+            )
+    return BoardData(columns=list(columns.values()), cards=cards)
+
+
+def _dumps(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def rows_to_board_json(rows) -> bytes:
+    """Serialize board_read_query rows straight to BoardData JSON.
+
+    Produces the same bytes as rows_to_board(rows).model_dump_json() without
+    building CardSchema/BoardData models, which dominates the cost on large boards.
+    """
+    columns: dict[str, dict] = {}
+    cards: dict[str, dict] = {}
+    for _, _, col_id, col_title, card_id, title, details, created_by, assigned_to in rows:
+        if col_id is None:
+            continue
+        column = columns.get(col_id)
+        if column is None:
+            column = columns[col_id] = {"id": col_id, "title": col_title, "cardIds": []}
+        if card_id is not None:
+            column["cardIds"].append(card_id)
+            cards[card_id] = {
+                "id": card_id,
+                "title": title,
+                "details": details or "",
+                "created_by": created_by,
+                "assigned_to": assigned_to,
+            }
+    return _dumps({"columns": list(columns.values()), "cards": cards})
+
+
+def board_columns_query(board_id: str, user_id: str):
+    """Membership, version, columns and per-column card counts, without any cards.
+
+    Rows follow board_read_query's conventions: none when the board does not
+    exist, a single row with a NULL member for non-members, otherwise one row
+    per column (or one with a NULL column for a board without columns).
+    """
+    counts = (
+        select(KanbanCard.column_id, func.count().label("card_count"))
+        .join(KanbanColumn, KanbanColumn.id == KanbanCard.column_id)
         .where(KanbanColumn.board_id == board_id)
-        .order_by(KanbanColumn.position)
+        .group_by(KanbanCard.column_id)
+        .subquery()
+    )
+    return (
+        select(
+            BoardMember.user_id,
+            Board.version,
+            KanbanColumn.id,
+            KanbanColumn.title,
+            func.coalesce(counts.c.card_count, 0),
+        )
+        .select_from(Board)
+        .outerjoin(BoardMember, and_(BoardMember.board_id == Board.id, BoardMember.user_id == user_id))
+        .outerjoin(KanbanColumn, and_(KanbanColumn.board_id == Board.id, BoardMember.user_id.is_not(None)))
+        .outerjoin(counts, counts.c.column_id == KanbanColumn.id)
+        .where(Board.id == board_id)
+        .order_by(KanbanColumn.position, KanbanColumn.id)
     )
-    cols = result.scalars().all()
 
-    col_ids = [col.id for col in cols]
-    if not col_ids:
-        return BoardData(columns=[], cards={})
 
-    cards_result = await session.execute(
-        select(KanbanCard)
-        .where(KanbanCard.column_id.in_(col_ids))
-        .order_by(KanbanCard.position)
-    )
-    all_cards = cards_result.scalars().all()
-
-    # Collect user IDs to resolve usernames
-    user_ids = set()
-    for card in all_cards:
-        if card.created_by_id:
-            user_ids.add(card.created_by_id)
-        if card.assigned_to_id:
-            user_ids.add(card.assigned_to_id)
-
-    username_map: dict[str, str] = {}
-    if user_ids:
-        users_result = await session.execute(
-            select(User).where(User.id.in_(user_ids))
-        )
-        for user in users_result.scalars().all():
-            username_map[user.id] = user.username
-
-    cards_by_col: dict[str, list[KanbanCard]] = {}
-    for card in all_cards:
-        cards_by_col.setdefault(card.column_id, []).append(card)
-
-    columns = []
-    for col in cols:
-        col_cards = sorted(cards_by_col.get(col.id, []), key=lambda c: c.position)
-        columns.append(ColumnSchema(id=col.id, title=col.title, cardIds=[c.id for c in col_cards]))
-
-    cards_dict = {
-        c.id: CardSchema(
-            id=c.id,
-            title=c.title,
-            details=c.details or "",
-            created_by=username_map.get(c.created_by_id) if c.created_by_id else None,
-            assigned_to=username_map.get(c.assigned_to_id) if c.assigned_to_id else None,
-        )
-        for c in all_cards
-    }
+def encode_card_cursor(position: int, card_id: str) -> str:
+    return f"{position}:{card_id}"
 
-    return BoardData(columns=columns, cards=cards_dict)
 
+def decode_card_cursor(cursor: str) -> tuple[int, str]:
+    """Inverse of encode_card_cursor; raises ValueError for anything it did not produce."""
+    position, sep, card_id = cursor.partition(":")
+    if not sep or not card_id:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return int(position), card_id
 
-async def board_to_db(session: AsyncSession, board_id: str, board: BoardData, created_by_id: str | None = None) -> None:
-    existing_col_ids = set(
-        (await session.execute(
-            select(KanbanColumn.id).where(KanbanColumn.board_id == board_id)
-        )).scalars().all()
-    )
 
-    col_ids_in_board = [col.id for col in board.columns]
-    existing_card_ids = set()
-    if col_ids_in_board:
-        existing_card_ids = set(
-            (await session.execute(
-                select(KanbanCard.id).where(KanbanCard.column_id.in_(col_ids_in_board))
-            )).scalars().all()
+# SQLite's default SQLITE_MAX_COMPOUND_SELECT: the most UNION ALL terms one statement may hold
+COLUMN_CARDS_MAX_COLUMNS = 500
+
+
+def column_cards_query(column_ids: list[str], limit: int, after: tuple[int, str] | None = None):
+    """The first `limit` cards of each column, after the (position, id) cursor if given.
+
+    Each column is a separate LIMITed range scan of ix_kanban_cards_column_position
+    glued together with UNION ALL, so the cost depends on `limit`, not on
+    how many cards the columns hold. Rows are (column id, position, card id,
+    title, details, creator username, assignee username), ordered by column
+    then (position, id). Pass at most COLUMN_CARDS_MAX_COLUMNS columns per
+    statement.
+    """
+    per_column = []
+    for column_id in column_ids:
+        stmt = (
+            select(
+                KanbanCard.column_id, KanbanCard.position, KanbanCard.id, KanbanCard.title,
+                KanbanCard.details, KanbanCard.created_by_id, KanbanCard.assigned_to_id,
+            )
+            .where(KanbanCard.column_id == column_id)
+            .order_by(KanbanCard.position, KanbanCard.id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(KanbanCard.position, KanbanCard.id) > tuple_(*after))
+        per_column.append(select(stmt.subquery()))
+    window = union_all(*per_column).subquery()
+    creator = aliased(User)
+    assignee = aliased(User)
+    return (
+        select(
+            window.c.column_id, window.c.position, window.c.id, window.c.title,
+            window.c.details, creator.username, assignee.username,
         )
+        .outerjoin(creator, window.c.created_by_id == creator.id)
+        .outerjoin(assignee, window.c.assigned_to_id == assignee.id)
+        .order_by(window.c.column_id, window.c.position, window.c.id)
+    )
 
-    new_col_ids = {col.id for col in board.columns}
-    new_card_ids = set(board.cards.keys())
 
-    # Delete removed columns (cascade deletes their cards)
-    removed_cols = existing_col_ids - new_col_ids
-    if removed_cols:
-        await session.execute(delete(KanbanColumn).where(KanbanColumn.id.in_(removed_cols)))
+def rows_to_card_pages(rows, limit: int) -> tuple[dict[str, list[str]], dict[str, str], dict[str, CardSchema]]:
+    """Group column_cards_query rows, fetched with limit + 1, into pages of `limit`.
+
+    Returns the card ids per column, the cursor for each column that has more
+    cards than its page (the extra row is only used to tell), and the cards.
+    """
+    card_ids: dict[str, list[str]] = {}
+    cursors: dict[str, str] = {}
+    cards: dict[str, CardSchema] = {}
+    last: dict[str, tuple[int, str]] = {}
+    for column_id, position, card_id, title, details, created_by, assigned_to in rows:
+        page = card_ids.setdefault(column_id, [])
+        if len(page) == limit:
+            cursors[column_id] = encode_card_cursor(*last[column_id])
+            continue
+        page.append(card_id)
+        last[column_id] = (position, card_id)
+        cards[card_id] = CardSchema(
+            id=card_id, title=title, details=details or "", created_by=created_by, assigned_to=assigned_to,
+        )
+    return card_ids, cursors, cards
+
+
+class BoardNotFound(Exception):
+    """The board was deleted, e.g. by another worker after this one checked access."""
+
+    def __init__(self, board_id: str):
+        super().__init__(f"Board not found: {board_id}")
+        self.board_id = board_id
+
+
+class BoardIdConflict(Exception):
+    """New column or card ids that already belong to another board."""
+
+    def __init__(self, detail: str):
+        super().__init__(detail)
+        self.detail = detail
+
+
+class BoardVersionConflict(Exception):
+    """The board's version no longer matches the version the client last saw."""
+
+    def __init__(self, board_id: str, current_version: int):
+        super().__init__(f"Board {board_id} is at version {current_version}")
+        self.board_id = board_id
+        self.current_version = current_version
+
+
+async def bump_board_version(session: AsyncSession, board_id: str, expected_version: int | None = None) -> int:
+    """Increment the board version and return it.
+
+    With expected_version, the increment only happens if the board is still at
+    that version; otherwise the transaction is rolled back and
+    BoardVersionConflict is raised. Callers that bump first take SQLite's write
+    lock before reading, so nothing can change between their read and write.
+    Raises BoardNotFound, after rolling back, if the board no longer exists.
+    """
+    stmt = update(Board).where(Board.id == board_id).values(version=Board.version + 1).returning(Board.version)
+    if expected_version is not None:
+        stmt = stmt.where(Board.version == expected_version)
+    version = (await session.execute(stmt)).scalar_one_or_none()
+    if version is None:
+        await session.rollback()
+        current = (await session.execute(select(Board.version).where(Board.id == board_id))).scalar_one_or_none()
+        if current is None:
+            raise BoardNotFound(board_id)
+        raise BoardVersionConflict(board_id, current)
+    return version
+
+
+async def _insert_new(session: AsyncSession, model, rows: list[dict]) -> None:
+    """Insert rows whose ids are new to the board; roll back and raise BoardIdConflict if any id is taken."""
+    if not rows:
+        return
+    inserted = set((await session.execute(
+        sqlite_insert(model).on_conflict_do_nothing(index_elements=[model.id]).returning(model.id), rows,
+    )).scalars().all())
+    if len(inserted) < len(rows):
+        await session.rollback()
+        taken = sorted(row["id"] for row in rows if row["id"] not in inserted)
+        raise BoardIdConflict(f"Ids already used by another board: {', '.join(taken)}")
+
+
+async def board_to_db(
+    session: AsyncSession,
+    board_id: str,
+    board: BoardData,
+    created_by_id: str | None = None,
+    expected_version: int | None = None,
+) -> int:
+    """Write the board and return its new version.
+
+    Raises BoardVersionConflict if expected_version is given and stale, and
+    BoardIdConflict, writing nothing, if a new column or card id is already
+    taken by another board.
+    """
+    version = await bump_board_version(session, board_id, expected_version)
+
+    # Load every existing column and card of the board in a single query
+    rows = (await session.execute(
+        select(
+            KanbanColumn.id, KanbanColumn.title, KanbanColumn.position,
+            KanbanCard.id, KanbanCard.title, KanbanCard.details, KanbanCard.column_id, KanbanCard.position,
+        )
+        .outerjoin(KanbanCard, KanbanCard.column_id == KanbanColumn.id)
+        .where(KanbanColumn.board_id == board_id)
+    )).all()
+
+    existing_cols: dict[str, tuple] = {}
+    existing_cards: dict[str, tuple] = {}
+    for col_id, col_title, col_pos, card_id, title, details, column_id, pos in rows:
+        existing_cols[col_id] = (col_title, col_pos)
+        if card_id is not None:
+            existing_cards[card_id] = (title, details or "", column_id, pos)
+
+    # Keep existing ranks wherever the order is unchanged so a move rewrites one row
+    col_ranks = assign_ranks([
+        existing_cols[col.id][1] if col.id in existing_cols else None for col in board.columns
+    ])
+    col_rows = []
+    for rank, col in zip(col_ranks, board.columns):
+        if existing_cols.get(col.id) != (col.title, rank):
+            col_rows.append({"id": col.id, "title": col.title, "position": rank, "board_id": board_id})
+
+    card_rows = []
+    placed_card_ids = set()
+    for col in board.columns:
+        col_card_ids = []
+        for card_id in col.cardIds:
+            if card_id in board.cards and card_id not in placed_card_ids:
+                placed_card_ids.add(card_id)
+                col_card_ids.append(card_id)
+        card_ranks = assign_ranks([
+            existing_cards[card_id][3]
+            if card_id in existing_cards and existing_cards[card_id][2] == col.id else None
+            for card_id in col_card_ids
+        ])
+        for rank, card_id in zip(card_ranks, col_card_ids):
+            card_data = board.cards[card_id]
+            if existing_cards.get(card_id) == (card_data.title, card_data.details, col.id, rank):
+                continue
+            card_rows.append({
+                "id": card_id,
+                "title": card_data.title,
+                "details": card_data.details,
+                "column_id": col.id,
+                "position": rank,
+                "created_by_id": created_by_id,
+            })
+
+    # Write only new or changed rows, one executemany per table and kind. Ids are global, so rows
+    # that are not already on this board are insert-only and must never update another board's rows.
+    await _insert_new(session, KanbanColumn, [row for row in col_rows if row["id"] not in existing_cols])
+    col_updates = [row for row in col_rows if row["id"] in existing_cols]
+    if col_updates:
+        stmt = sqlite_insert(KanbanColumn)
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[KanbanColumn.id],
+                set_={"title": stmt.excluded.title, "position": stmt.excluded.position},
+            ),
+            col_updates,
+        )
+
+    await _insert_new(session, KanbanCard, [row for row in card_rows if row["id"] not in existing_cards])
+    card_updates = [row for row in card_rows if row["id"] in existing_cards]
+    if card_updates:
+        # created_by_id is only set on insert; assigned_to_id is managed by the assignee endpoint
+        stmt = sqlite_insert(KanbanCard)
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[KanbanCard.id],
+                set_={
+                    "title": stmt.excluded.title,
+                    "details": stmt.excluded.details,
+                    "column_id": stmt.excluded.column_id,
+                    "position": stmt.excluded.position,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            ),
+            card_updates,
+        )
 
     # Delete removed cards
-    removed_cards = existing_card_ids - new_card_ids
+    removed_cards = existing_cards.keys() - placed_card_ids
     if removed_cards:
         await session.execute(delete(KanbanCard).where(KanbanCard.id.in_(removed_cards)))
 
-    # Upsert columns
-    for pos, col in enumerate(board.columns):
-        existing = await session.get(KanbanColumn, col.id)
-        if existing:
-            existing.title = col.title
-            existing.position = pos
-        else:
-            session.add(KanbanColumn(id=col.id, title=col.title, position=pos, board_id=board_id))
-
-    # Upsert cards
-    for col in board.columns:
-        for pos, card_id in enumerate(col.cardIds):
-            card_data = board.cards.get(card_id)
-            if card_data is None:
-                continue
-            existing = await session.get(KanbanCard, card_id)
-            if existing:
-                existing.title = card_data.title
-                existing.details = card_data.details
-                existing.column_id = col.id
-                existing.position = pos
-                # Only update assigned_to if provided in card_data
-                if card_data.assigned_to is not None:
-                    pass  # assigned_to is resolved via separate endpoint
-            else:
-                session.add(KanbanCard(
-                    id=card_id,
-                    title=card_data.title,
-                    details=card_data.details,
-                    column_id=col.id,
-                    position=pos,
-                    created_by_id=created_by_id,
-                ))
+    # Delete removed columns last so cards moved out of them survive the cascade
+    removed_cols = existing_cols.keys() - {col.id for col in board.columns}
+    if removed_cols:
+        await session.execute(delete(KanbanColumn).where(KanbanColumn.id.in_(removed_cols)))
 
     await session.commit()
+    return version
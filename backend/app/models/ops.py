@@ -0,0 +1,328 @@
+from typing import Annotated, Literal, Union
+from uuid import uuid4
+from pydantic import BaseModel, Field
+from sqlalchemy import bindparam, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.board import (
+    KanbanCard, KanbanColumn, User,
+    BoardOpsResult, CardSchema, ColumnSchema,
+    bump_board_version,
+)
+from app.models.ranking import rank_between, spaced_ranks
+
+
+class AddCardOp(BaseModel):
+    op: Literal["add_card"]
+    column_id: str
+    title: str
+    details: str = ""
+    card_id: str | None = None
+    index: int | None = None  # None appends to the end of the column
+
+
+class EditCardOp(BaseModel):
+    op: Literal["edit_card"]
+    card_id: str
+    title: str | None = None
+    details: str | None = None
+
+
+class MoveCardOp(BaseModel):
+    op: Literal["move_card"]
+    card_id: str
+    column_id: str
+    index: int | None = None
+
+
+class DeleteCardOp(BaseModel):
+    op: Literal["delete_card"]
+    card_id: str
+
+
+class AddColumnOp(BaseModel):
+    op: Literal["add_column"]
+    title: str
+    column_id: str | None = None
+    index: int | None = None
+
+
+class RenameColumnOp(BaseModel):
+    op: Literal["rename_column"]
+    column_id: str
+    title: str
+
+
+class MoveColumnOp(BaseModel):
+    op: Literal["move_column"]
+    column_id: str
+    index: int
+
+
+class DeleteColumnOp(BaseModel):
+    op: Literal["delete_column"]
+    column_id: str
+
+
+BoardOp = Annotated[
+    Union[
+        AddCardOp, EditCardOp, MoveCardOp, DeleteCardOp,
+        AddColumnOp, RenameColumnOp, MoveColumnOp, DeleteColumnOp,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class BoardOpsRequest(BaseModel):
+    ops: list[BoardOp]
+    expected_version: int | None = None  # reject with 409 if the board has moved past this version
+
+
+class BoardOpError(Exception):
+    def __init__(self, detail: str):
+        super().__init__(detail)
+        self.detail = detail
+
+
+class BoardOpNotFound(BoardOpError):
+    pass
+
+
+async def _card_location(session: AsyncSession, board_id: str, card_id: str) -> tuple[str, int]:
+    row = (await session.execute(
+        select(KanbanCard.column_id, KanbanCard.position)
+        .join(KanbanColumn, KanbanCard.column_id == KanbanColumn.id)
+        .where(KanbanCard.id == card_id, KanbanColumn.board_id == board_id)
+    )).first()
+    if row is None:
+        raise BoardOpNotFound(f"Card not found: {card_id}")
+    return row.column_id, row.position
+
+
+async def _column_position(session: AsyncSession, board_id: str, column_id: str) -> int:
+    position = (await session.execute(
+        select(KanbanColumn.position)
+        .where(KanbanColumn.id == column_id, KanbanColumn.board_id == board_id)
+    )).scalar_one_or_none()
+    if position is None:
+        raise BoardOpNotFound(f"Column not found: {column_id}")
+    return position
+
+
+async def _rank_for_index(session: AsyncSession, model, scope, index: int | None, exclude_id: str | None = None) -> int:
+    """Rank that places an item at `index` among its siblings (None appends).
+
+    Normally a single neighbour lookup; respaces the siblings when the gap is exhausted.
+    Siblings are ordered by (position, id), the same order every read uses, so
+    an index means the same place even where two items share a rank.
+    """
+    siblings = select(model.id, model.position).where(scope)
+    if exclude_id is not None:
+        siblings = siblings.where(model.id != exclude_id)
+
+    before = after = None
+    if index is not None and index <= 0:
+        first = (await session.execute(siblings.order_by(model.position, model.id).limit(1))).first()
+        after = first.position if first else None
+    elif index is not None:
+        rows = (await session.execute(siblings.order_by(model.position, model.id).offset(index - 1).limit(2))).all()
+        if rows:
+            before = rows[0].position
+            after = rows[1].position if len(rows) > 1 else None
+    if index is None or (index > 0 and before is None):
+        before = (await session.execute(
+            select(func.max(siblings.subquery().c.position))
+        )).scalar_one_or_none()
+
+    rank = rank_between(before, after)
+    if rank is not None:
+        return rank
+
+    ordered = list((await session.execute(siblings.order_by(model.position, model.id))).scalars().all())
+    slot = len(ordered) if index is None else min(max(index, 0), len(ordered))
+    ranks = spaced_ranks(len(ordered) + 1)
+    rank = ranks.pop(slot)
+    table = model.__table__
+    # Only the rank changes, so updated_at is written back as is rather than refreshed by its onupdate
+    unchanged = {"updated_at": table.c.updated_at} if "updated_at" in table.c else {}
+    await session.execute(
+        update(table).where(table.c.id == bindparam("item_id")).values(position=bindparam("rank"), **unchanged),
+        [{"item_id": item_id, "rank": r} for item_id, r in zip(ordered, ranks)],
+    )
+    return rank
+
+
+async def apply_ops(
+    session: AsyncSession,
+    board_id: str,
+    ops: list[BoardOp],
+    created_by_id: str | None = None,
+    expected_version: int | None = None,
+) -> BoardOpsResult:
+    """Apply a batch of board operations in one transaction, touching only the affected rows.
+
+    Raises BoardOpError (after rolling back) if any operation is invalid, and
+    BoardVersionConflict if expected_version is given and stale.
+    """
+    touched_cols: set[str] = set()
+    touched_cards: set[str] = set()
+    deleted_cards: set[str] = set()
+    deleted_cols: set[str] = set()
+    column_order_changed = False
+
+    version = await bump_board_version(session, board_id, expected_version)
+    try:
+        for op in ops:
+            if isinstance(op, AddCardOp):
+                await _column_position(session, board_id, op.column_id)
+                card_id = op.card_id or f"card-{uuid4()}"
+                if (await session.execute(select(KanbanCard.id).where(KanbanCard.id == card_id))).first() is not None:
+                    raise BoardOpError(f"Card already exists: {card_id}")
+                pos = await _rank_for_index(session, KanbanCard, KanbanCard.column_id == op.column_id, op.index)
+                session.add(KanbanCard(
+                    id=card_id,
+                    title=op.title,
+                    details=op.details,
+                    column_id=op.column_id,
+                    position=pos,
+                    created_by_id=created_by_id,
+                ))
+                await session.flush()
+                touched_cols.add(op.column_id)
+                touched_cards.add(card_id)
+                deleted_cards.discard(card_id)
+
+            elif isinstance(op, EditCardOp):
+                await _card_location(session, board_id, op.card_id)
+                values = {}
+                if op.title is not None:
+                    values["title"] = op.title
+                if op.details is not None:
+                    values["details"] = op.details
+                if values:
+                    await session.execute(update(KanbanCard).where(KanbanCard.id == op.card_id).values(**values))
+                touched_cards.add(op.card_id)
+
+            elif isinstance(op, MoveCardOp):
+                src_col, _ = await _card_location(session, board_id, op.card_id)
+                await _column_position(session, board_id, op.column_id)
+                pos = await _rank_for_index(
+                    session, KanbanCard, KanbanCard.column_id == op.column_id, op.index, exclude_id=op.card_id
+                )
+                await session.execute(
+                    update(KanbanCard)
+                    .where(KanbanCard.id == op.card_id)
+                    .values(column_id=op.column_id, position=pos)
+                )
+                touched_cols.update((src_col, op.column_id))
+
+            elif isinstance(op, DeleteCardOp):
+                col_id, _ = await _card_location(session, board_id, op.card_id)
+                await session.execute(delete(KanbanCard).where(KanbanCard.id == op.card_id))
+                touched_cols.add(col_id)
+                touched_cards.discard(op.card_id)
+                deleted_cards.add(op.card_id)
+
+            elif isinstance(op, AddColumnOp):
+                column_id = op.column_id or f"col-{uuid4()}"
+                if await session.get(KanbanColumn, column_id) is not None:
+                    raise BoardOpError(f"Column already exists: {column_id}")
+                pos = await _rank_for_index(session, KanbanColumn, KanbanColumn.board_id == board_id, op.index)
+                session.add(KanbanColumn(id=column_id, title=op.title, position=pos, board_id=board_id))
+                await session.flush()
+                touched_cols.add(column_id)
+                deleted_cols.discard(column_id)
+                column_order_changed = True
+
+            elif isinstance(op, RenameColumnOp):
+                await _column_position(session, board_id, op.column_id)
+                await session.execute(
+                    update(KanbanColumn).where(KanbanColumn.id == op.column_id).values(title=op.title)
+                )
+                touched_cols.add(op.column_id)
+
+            elif isinstance(op, MoveColumnOp):
+                await _column_position(session, board_id, op.column_id)
+                pos = await _rank_for_index(
+                    session, KanbanColumn, KanbanColumn.board_id == board_id, op.index, exclude_id=op.column_id
+                )
+                await session.execute(
+                    update(KanbanColumn).where(KanbanColumn.id == op.column_id).values(position=pos)
+                )
+                column_order_changed = True
+
+            elif isinstance(op, DeleteColumnOp):
+                await _column_position(session, board_id, op.column_id)
+                card_ids = (await session.execute(
+                    select(KanbanCard.id).where(KanbanCard.column_id == op.column_id)
+                )).scalars().all()
+                await session.execute(delete(KanbanColumn).where(KanbanColumn.id == op.column_id))
+                touched_cols.discard(op.column_id)
+                deleted_cols.add(op.column_id)
+                deleted_cards.update(card_ids)
+                touched_cards.difference_update(card_ids)
+                column_order_changed = True
+
+        result = await _collect_fragments(
+            session, board_id, touched_cols, touched_cards, column_order_changed
+        )
+        await session.commit()
+    except BoardOpError:
+        await session.rollback()
+        raise
+
+    result.version = version
+    result.deleted_card_ids = sorted(deleted_cards)
+    result.deleted_column_ids = sorted(deleted_cols)
+    return result
+
+
+async def _collect_fragments(
+    session: AsyncSession,
+    board_id: str,
+    col_ids: set[str],
+    card_ids: set[str],
+    column_order_changed: bool,
+) -> BoardOpsResult:
+    columns = []
+    if col_ids:
+        col_rows = (await session.execute(
+            select(KanbanColumn.id, KanbanColumn.title)
+            .where(KanbanColumn.id.in_(col_ids))
+            .order_by(KanbanColumn.position, KanbanColumn.id)
+        )).all()
+        card_rows = (await session.execute(
+            select(KanbanCard.column_id, KanbanCard.id)
+            .where(KanbanCard.column_id.in_(col_ids))
+            .order_by(KanbanCard.position, KanbanCard.id)
+        )).all()
+        order: dict[str, list[str]] = {}
+        for column_id, card_id in card_rows:
+            order.setdefault(column_id, []).append(card_id)
+        columns = [ColumnSchema(id=cid, title=title, cardIds=order.get(cid, [])) for cid, title in col_rows]
+
+    cards = {}
+    if card_ids:
+        creator = aliased(User)
+        assignee = aliased(User)
+        rows = (await session.execute(
+            select(KanbanCard.id, KanbanCard.title, KanbanCard.details, creator.username, assignee.username)
+            .outerjoin(creator, KanbanCard.created_by_id == creator.id)
+            .outerjoin(assignee, KanbanCard.assigned_to_id == assignee.id)
+            .where(KanbanCard.id.in_(card_ids))
+        )).all()
+        cards = {
+            cid: CardSchema(id=cid, title=title, details=details or "", created_by=created_by, assigned_to=assigned_to)
+            for cid, title, details, created_by, assigned_to in rows
+        }
+
+    column_order = None
+    if column_order_changed:
+        column_order = list((await session.execute(
+            select(KanbanColumn.id)
+            .where(KanbanColumn.board_id == board_id)
+            .order_by(KanbanColumn.position, KanbanColumn.id)
+        )).scalars().all())
+
+    return BoardOpsResult(version=0, columns=columns, cards=cards, column_order=column_order)
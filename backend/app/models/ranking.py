@@ -0,0 +1,89 @@
+"""Sparse integer ranks for ordering columns and cards.
+
+Positions are spaced RANK_GAP apart so an item can be placed between two
+neighbours by taking the midpoint, which writes a single row; placing it at
+either end steps RANK_GAP past the edge, so ranks may go negative. When two
+neighbours are adjacent the whole sequence is respaced, which happens at
+most once every ~log2(RANK_GAP) inserts into the same spot.
+"""
+from bisect import bisect_left
+
+RANK_GAP = 1024
+
+
+def spaced_ranks(count: int) -> list[int]:
+    return [(i + 1) * RANK_GAP for i in range(count)]
+
+
+def rank_between(before: int | None, after: int | None) -> int | None:
+    """Rank strictly between two neighbours (None meaning the sequence edge), or None if there is no room."""
+    if before is None and after is None:
+        return RANK_GAP
+    if before is None:
+        return after - RANK_GAP
+    if after is None:
+        return before + RANK_GAP
+    if after - before < 2:
+        return None
+    return (before + after) // 2
+
+
+def _longest_increasing_run(ranks: list[int | None]) -> set[int]:
+    """Indices of a longest strictly increasing subsequence of the non-None ranks."""
+    tails: list[int] = []        # smallest tail rank of an increasing run of each length
+    tail_idx: list[int] = []     # index in `ranks` of that tail
+    prev: dict[int, int] = {}
+    for i, rank in enumerate(ranks):
+        if rank is None:
+            continue
+        k = bisect_left(tails, rank)
+        if k == len(tails):
+            tails.append(rank)
+            tail_idx.append(i)
+        else:
+            tails[k] = rank
+            tail_idx[k] = i
+        if k > 0:
+            prev[i] = tail_idx[k - 1]
+    keep = set()
+    i = tail_idx[-1] if tail_idx else None
+    while i is not None:
+        keep.add(i)
+        i = prev.get(i)
+    return keep
+
+
+def assign_ranks(current: list[int | None]) -> list[int]:
+    """Ranks for a sequence given in its desired order.
+
+    `current` holds each item's existing rank in this sequence, or None for
+    items new to it. The longest already-ordered subset keeps its ranks and the
+    rest are slotted into the gaps, so moving one item changes one rank. Falls
+    back to evenly respacing everything when a gap is too small.
+    """
+    keep = _longest_increasing_run(current)
+    result: list[int] = []
+    pending = 0  # items waiting for a rank between the last kept rank and the next
+    low = None
+    for i, rank in enumerate(current + [None]):
+        if i not in keep and i < len(current):
+            pending += 1
+            continue
+        high = rank
+        if pending:
+            if low is None and high is None:
+                result.extend(spaced_ranks(pending))
+            elif low is None:
+                result.extend(high - RANK_GAP * (pending - j) for j in range(pending))
+            elif high is None:
+                result.extend(low + RANK_GAP * (j + 1) for j in range(pending))
+            else:
+                step = (high - low) // (pending + 1)
+                if step < 1:
+                    return spaced_ranks(len(current))
+                result.extend(low + step * (j + 1) for j in range(pending))
+            pending = 0
+        if i < len(current):
+            result.append(rank)
+            low = rank
+    return result
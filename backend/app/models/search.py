@@ -0,0 +1,100 @@
+"""Ranked full-text search over the cards of every board a user belongs to.
+
+Backed by the kanban_cards_fts FTS5 index (see CARD_SEARCH_DDL in
+app/models/board.py). Archived cards are not indexed.
+"""
+import html
+import re
+
+from pydantic import BaseModel
+from sqlalchemy import func, literal_column, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.board import Board, BoardMember, KanbanCard, KanbanColumn
+
+_fts = table("kanban_cards_fts")
+_FTS = literal_column("kanban_cards_fts")
+_ROWID = literal_column("kanban_cards_fts.rowid")
+TITLE_WEIGHT = 5.0  # a match in the title counts this many times a match in the details
+# snippet() marks matches with these; they are swapped for <mark> after the text is HTML-escaped
+_OPEN, _CLOSE = "\x02", "\x03"
+
+
+class SearchHit(BaseModel):
+    card_id: str
+    title: str
+    snippet: str  # HTML: escaped details trimmed around the matches, which are wrapped in <mark>
+    board_id: str
+    board_title: str
+    column_id: str
+    column_title: str
+
+
+def _highlight(snippet: str) -> str:
+    return html.escape(snippet).replace(_OPEN, "<mark>").replace(_CLOSE, "</mark>")
+
+
+def fts_query(text: str) -> str | None:
+    """Turn free text into an FTS5 query: every word must match, the last one as a prefix.
+
+    Words are quoted, so FTS5 operators and punctuation in the input are
+    taken literally rather than raising syntax errors. Returns None if the
+    text has no words.
+    """
+    words = re.findall(r"\w+", text)
+    if not words:
+        return None
+    return " ".join(f'"{word}"' for word in words) + "*"
+
+
+async def search_cards(
+    session: AsyncSession, user_id: str, text: str, limit: int, board_id: str | None = None,
+) -> list[SearchHit]:
+    """Best matches first (bm25), restricted to boards the user is a member of.
+
+    The user's columns are collected once into a list that SQLite materializes,
+    so each FTS match costs one rowid lookup and a set probe rather than a join
+    through columns and memberships; board and column titles are joined only
+    for the `limit` rows that survive ranking.
+    """
+    query = fts_query(text)
+    if query is None:
+        return []
+    scope = (
+        select(KanbanColumn.id)
+        .join(BoardMember, (BoardMember.board_id == KanbanColumn.board_id) & (BoardMember.user_id == user_id))
+    )
+    if board_id is not None:
+        scope = scope.where(KanbanColumn.board_id == board_id)
+    rank = func.bm25(_FTS, TITLE_WEIGHT, 1.0).label("rank")
+    ranked = (
+        select(
+            KanbanCard.id.label("card_id"),
+            KanbanCard.title.label("title"),
+            KanbanCard.column_id.label("column_id"),
+            func.snippet(_FTS, 1, _OPEN, _CLOSE, "…", 12).label("snippet"),
+            rank,
+        )
+        .select_from(_fts)
+        .join(KanbanCard, KanbanCard.seq == _ROWID)
+        .where(_FTS.op("MATCH")(query), KanbanCard.column_id.in_(scope))
+        .order_by(rank)
+        .limit(limit)
+        .subquery()
+    )
+    rows = (await session.execute(
+        select(
+            ranked.c.card_id, ranked.c.title, ranked.c.snippet,
+            Board.id, Board.title, KanbanColumn.id, KanbanColumn.title,
+        )
+        .join(KanbanColumn, KanbanColumn.id == ranked.c.column_id)
+        .join(Board, Board.id == KanbanColumn.board_id)
+        .order_by(ranked.c.rank)
+    )).all()
+    return [
+        SearchHit(
+            card_id=card_id, title=title, snippet=_highlight(snippet or ""), board_id=bid, board_title=board_title,
+            column_id=column_id, column_title=column_title,
+        )
+        for card_id, title, snippet, bid, board_title, column_id, column_title in rows
+    ]
@@ -0,0 +1,99 @@
+"""Board templates for new boards, and copying an existing board inside the database."""
+import time
+from uuid import uuid4
+
+from pydantic import BaseModel
+from sqlalchemy import String, cast, func, literal, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.board import Board, BoardMember, BoardNotFound, KanbanCard, KanbanColumn
+from app.models.ranking import spaced_ranks
+
+
+class BoardTemplate(BaseModel):
+    id: str
+    title: str
+    columns: list[str]
+
+
+BOARD_TEMPLATES = {
+    template.id: template
+    for template in [
+        BoardTemplate(id="default", title="Product kanban", columns=["Backlog", "Discovery", "In Progress", "Review", "Done"]),
+        BoardTemplate(id="simple", title="Simple", columns=["To Do", "Doing", "Done"]),
+        BoardTemplate(id="bugs", title="Bug triage", columns=["Reported", "Confirmed", "Fixing", "Verifying", "Closed"]),
+        BoardTemplate(id="empty", title="Empty", columns=[]),
+    ]
+}
+
+
+class CloneBoardRequest(BaseModel):
+    title: str | None = None  # defaults to "<source title> (copy)"
+    include_cards: bool = True
+
+
+async def create_board_from_template(
+    session: AsyncSession, title: str, owner_id: str, template: BoardTemplate,
+) -> str:
+    """Add the board, its owner's membership and the template's columns (one INSERT); returns the board id."""
+    board_id = str(uuid4())
+    session.add(Board(id=board_id, title=title, owner_id=owner_id))
+    session.add(BoardMember(board_id=board_id, user_id=owner_id))
+    await session.flush()
+    if template.columns:
+        await session.execute(KanbanColumn.__table__.insert(), [
+            {"id": str(uuid4()), "title": col_title, "position": rank, "board_id": board_id}
+            for rank, col_title in zip(spaced_ranks(len(template.columns)), template.columns)
+        ])
+    return board_id
+
+
+async def clone_board(
+    session: AsyncSession, source_id: str, owner_id: str, title: str | None = None, include_cards: bool = True,
+) -> tuple[str, str]:
+    """Copy a board's columns (and cards) into a new board owned by owner_id; returns (board id, title).
+
+    Columns and cards are each copied with one INSERT ... SELECT, so their data
+    never leaves SQLite. A copied column's id is the new board's id plus the
+    source column's rowid, which is unique and lets the card copy find its
+    column with a join; cards draw new ids from randomblob(). Positions and
+    creators are kept; assignees are cleared because the owner is the new
+    board's only member. Raises BoardNotFound if the source board no longer
+    exists. The caller commits.
+    """
+    source = await session.get(Board, source_id)
+    if source is None:
+        raise BoardNotFound(source_id)
+    title = title if title is not None else f"{source.title} (copy)"
+    board_id = str(uuid4())
+    session.add(Board(id=board_id, title=title, owner_id=owner_id))
+    session.add(BoardMember(board_id=board_id, user_id=owner_id))
+    await session.flush()
+
+    copied_column_id = literal(f"{board_id}-") + cast(literal_column("kanban_columns.rowid"), String)
+    await session.execute(
+        KanbanColumn.__table__.insert().from_select(
+            ["id", "title", "position", "board_id"],
+            select(copied_column_id, KanbanColumn.title, KanbanColumn.position, literal(board_id))
+            .where(KanbanColumn.board_id == source_id),
+        )
+    )
+    if include_cards:
+        await session.execute(
+            KanbanCard.__table__.insert().from_select(
+                ["id", "title", "details", "column_id", "position", "created_by_id", "assigned_to_id", "updated_at"],
+                select(
+                    literal("card-") + func.lower(func.hex(func.randomblob(16))),
+                    KanbanCard.title,
+                    KanbanCard.details,
+                    copied_column_id,
+                    KanbanCard.position,
+                    KanbanCard.created_by_id,
+                    literal(None),
+                    literal(time.time()),
+                )
+                .join(KanbanColumn, KanbanColumn.id == KanbanCard.column_id)
+                .where(KanbanColumn.board_id == source_id),
+            )
+        )
+    return board_id, title
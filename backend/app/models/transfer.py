@@ -0,0 +1,246 @@
+"""Streaming NDJSON export and batched import of whole boards.
+
+The format is one JSON object per line: a `board` line first, then each
+column followed by its cards, in board order:
+
+    {"type": "board", "id": "...", "title": "...", "version": 3}
+    {"type": "column", "id": "...", "title": "Backlog"}
+    {"type": "card", "id": "...", "title": "...", "details": "...", "created_by": "user", "assigned_to": null}
+
+Export streams a single query, so the file is one consistent snapshot and
+memory stays flat however many cards the board holds. Import never holds
+more than one batch of cards and commits each batch on its own, so the
+write lock is released between batches.
+"""
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from uuid import uuid4
+
+from pydantic import BaseModel
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.board import Board, BoardMember, KanbanCard, KanbanColumn, User, _dumps, orjson
+from app.models.ranking import RANK_GAP
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+class BoardImportError(Exception):
+    def __init__(self, detail: str):
+        super().__init__(detail)
+        self.detail = detail
+
+
+class BoardImportConflict(BoardImportError):
+    """The export's ids are already in use."""
+
+
+class ImportResult(BaseModel):
+    id: str
+    title: str
+    columns: int
+    cards: int
+
+
+async def export_board(session: AsyncSession, board_id: str, batch_size: int) -> AsyncIterator[bytes]:
+    """NDJSON lines for the board, yielded `batch_size` rows at a time."""
+    creator = aliased(User)
+    assignee = aliased(User)
+    result = await session.stream(
+        select(
+            Board.title, Board.version, KanbanColumn.id, KanbanColumn.title,
+            KanbanCard.id, KanbanCard.title, KanbanCard.details, creator.username, assignee.username,
+        )
+        .select_from(Board)
+        .outerjoin(KanbanColumn, KanbanColumn.board_id == Board.id)
+        .outerjoin(KanbanCard, KanbanCard.column_id == KanbanColumn.id)
+        .outerjoin(creator, KanbanCard.created_by_id == creator.id)
+        .outerjoin(assignee, KanbanCard.assigned_to_id == assignee.id)
+        .where(Board.id == board_id)
+        .order_by(KanbanColumn.position, KanbanColumn.id, KanbanCard.position, KanbanCard.id)
+        .execution_options(yield_per=batch_size)
+    )
+    current_column = None
+    first = True
+    async for rows in result.partitions():
+        lines = []
+        for board_title, version, col_id, col_title, card_id, title, details, created_by, assigned_to in rows:
+            if first:
+                lines.append(_dumps({"type": "board", "id": board_id, "title": board_title, "version": version}))
+                first = False
+            if col_id is not None and col_id != current_column:
+                lines.append(_dumps({"type": "column", "id": col_id, "title": col_title}))
+                current_column = col_id
+            if card_id is not None:
+                lines.append(_dumps({
+                    "type": "card", "id": card_id, "title": title, "details": details or "",
+                    "created_by": created_by, "assigned_to": assigned_to,
+                }))
+        yield b"\n".join(lines) + b"\n"
+
+
+async def _ndjson_lines(chunks: AsyncIterable[bytes], max_line_bytes: int) -> AsyncIterator[tuple[int, dict]]:
+    """Parse (line number, object) pairs from a byte stream split at arbitrary points.
+
+    A line longer than max_line_bytes raises BoardImportError as soon as it
+    is seen, so an unterminated line is never buffered past that size.
+    """
+    buffer = b""
+    number = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            number += 1
+            _check_length(number, line, max_line_bytes)
+            if line.strip():
+                yield number, _parse(number, line)
+        _check_length(number + 1, buffer, max_line_bytes)
+    if buffer.strip():
+        yield number + 1, _parse(number + 1, buffer)
+
+
+def _check_length(number: int, line: bytes, max_line_bytes: int) -> None:
+    if len(line) > max_line_bytes:
+        raise BoardImportError(f"Line {number}: longer than {max_line_bytes} bytes")
+
+
+def _parse(number: int, line: bytes) -> dict:
+    try:
+        obj = _loads(line)
+    except ValueError:
+        raise BoardImportError(f"Line {number}: invalid JSON")
+    if not isinstance(obj, dict):
+        raise BoardImportError(f"Line {number}: expected an object")
+    return obj
+
+
+def _username(number: int, obj: dict, key: str) -> str | None:
+    name = obj.get(key)
+    if name is not None and not isinstance(name, str):
+        raise BoardImportError(f"Line {number}: {key} must be a username or null")
+    return name
+
+
+class _CardBatch:
+    """Cards waiting to be written, with usernames resolved one batch at a time."""
+
+    def __init__(self, session: AsyncSession, created_by_id: str):
+        self.session = session
+        self.created_by_id = created_by_id
+        self.rows: list[dict] = []
+        self.user_ids: dict[str, str | None] = {}
+        self.written = 0
+
+    async def flush(self) -> None:
+        if not self.rows:
+            return
+        names = {name for row in self.rows for name in (row["created_by"], row["assigned_to"]) if name}
+        unknown = names - self.user_ids.keys()
+        if unknown:
+            found = dict((await self.session.execute(
+                select(User.username, User.id).where(User.username.in_(unknown))
+            )).all())
+            self.user_ids.update({name: found.get(name) for name in unknown})
+        await self.session.execute(KanbanCard.__table__.insert(), [
+            {
+                "id": row["id"],
+                "title": row["title"],
+                "details": row["details"],
+                "column_id": row["column_id"],
+                "position": row["position"],
+                "created_by_id": self.user_ids.get(row["created_by"]) or self.created_by_id,
+                "assigned_to_id": self.user_ids.get(row["assigned_to"]),
+            }
+            for row in self.rows
+        ])
+        await self.session.commit()
+        self.written += len(self.rows)
+        self.rows = []
+
+
+async def import_board(
+    session: AsyncSession,
+    chunks: AsyncIterable[bytes],
+    owner_id: str,
+    batch_size: int,
+    new_ids: bool = False,
+    max_line_bytes: int = 1 << 20,
+) -> ImportResult:
+    """Create a board owned by owner_id from an NDJSON stream.
+
+    Cards are committed every `batch_size` rows. With new_ids every column and
+    card gets a fresh id, so a board can be imported next to the one it was
+    exported from. Unknown usernames are dropped (the importer becomes the
+    creator). Lines longer than max_line_bytes are rejected. On any error the
+    partly imported board is deleted and BoardImportError raised.
+    """
+    board_id = str(uuid4())
+    title = None
+    columns = 0
+    column_id = None
+    rank = 0
+    batch = _CardBatch(session, owner_id)
+    try:
+        async for number, obj in _ndjson_lines(chunks, max_line_bytes):
+            kind = obj.get("type")
+            try:
+                if title is None:
+                    if kind != "board":
+                        raise BoardImportError(f"Line {number}: the first line must be the board")
+                    title = str(obj["title"])
+                    session.add(Board(id=board_id, title=title, owner_id=owner_id))
+                    session.add(BoardMember(board_id=board_id, user_id=owner_id))
+                    await session.commit()
+                elif kind == "column":
+                    await batch.flush()
+                    columns += 1
+                    column_id = str(uuid4()) if new_ids else str(obj["id"])
+                    rank = 0
+                    await session.execute(KanbanColumn.__table__.insert().values(
+                        id=column_id, title=str(obj["title"]), position=columns * RANK_GAP, board_id=board_id,
+                    ))
+                elif kind == "card":
+                    if column_id is None:
+                        raise BoardImportError(f"Line {number}: card before any column")
+                    rank += RANK_GAP
+                    batch.rows.append({
+                        "id": f"card-{uuid4()}" if new_ids else str(obj["id"]),
+                        "title": str(obj["title"]),
+                        "details": str(obj.get("details") or ""),
+                        "column_id": column_id,
+                        "position": rank,
+                        "created_by": _username(number, obj, "created_by"),
+                        "assigned_to": _username(number, obj, "assigned_to"),
+                    })
+                    if len(batch.rows) >= batch_size:
+                        await batch.flush()
+                else:
+                    raise BoardImportError(f"Line {number}: unknown line type {kind!r}")
+            except KeyError as exc:
+                raise BoardImportError(f"Line {number}: missing field {exc.args[0]!r}")
+        if title is None:
+            raise BoardImportError("Empty import")
+        await batch.flush()
+        await session.commit()
+    except Exception as exc:
+        await session.rollback()
+        await _discard(session, board_id)
+        if isinstance(exc, BoardImportError):
+            raise
+        if isinstance(exc, IntegrityError):
+            raise BoardImportConflict("Column or card ids already exist; import with new_ids=true") from exc
+        raise
+    return ImportResult(id=board_id, title=title, columns=columns, cards=batch.written)
+
+
+async def _discard(session: AsyncSession, board_id: str) -> None:
+    column_ids = select(KanbanColumn.id).where(KanbanColumn.board_id == board_id)
+    await session.execute(delete(KanbanCard).where(KanbanCard.column_id.in_(column_ids)))
+    await session.execute(delete(KanbanColumn).where(KanbanColumn.board_id == board_id))
+    await session.execute(delete(BoardMember).where(BoardMember.board_id == board_id))
+    await session.execute(delete(Board).where(Board.id == board_id))
+    await session.commit()
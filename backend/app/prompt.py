@@ -0,0 +1,124 @@
+"""Compact board encoding for the AI system prompt.
+
+Instead of embedding the BoardData JSON, the board is rendered as one table per
+column with short aliases (C1, K1, ...) standing in for the real ids, details
+clipped to a fixed length, and, for boards larger than a card budget, only the
+cards most relevant to the latest user message. The model replies with board
+operations that use the aliases; expand_operations() maps them back onto the
+real board.
+"""
+import re
+from dataclasses import dataclass, field
+
+from app import config
+
+_WORD = re.compile(r"\w+")
+
+
+@dataclass
+class PromptBoard:
+    text: str
+    aliases: dict[str, str] = field(default_factory=dict)        # alias -> real id
+    clipped_details: dict[str, str] = field(default_factory=dict)  # real card id -> details as shown
+    hidden_card_ids: set[str] = field(default_factory=set)
+
+
+def _one_line(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _clip(text: str, limit: int) -> str:
+    text = _one_line(text)
+    if len(text) <= limit:
+        return text
+    return text[:limit].rstrip() + "…"
+
+
+def _select_cards(board: dict, query: str, max_cards: int) -> set[str]:
+    """Ids of the max_cards cards sharing the most words with the query (earlier cards win ties)."""
+    card_order = [cid for col in board.get("columns", []) for cid in col["cardIds"] if cid in board.get("cards", {})]
+    if len(card_order) <= max_cards:
+        return set(card_order)
+    terms = set(_WORD.findall(query.lower()))
+
+    def score(cid: str) -> int:
+        card = board["cards"][cid]
+        words = set(_WORD.findall(f"{card['title']} {card.get('details', '')}".lower()))
+        return len(terms & words)
+
+    ranked = sorted(range(len(card_order)), key=lambda i: (-score(card_order[i]), i))
+    return {card_order[i] for i in ranked[:max_cards]}
+
+
+def encode_board(
+    board: dict,
+    query: str = "",
+    max_cards: int | None = None,
+    details_chars: int | None = None,
+) -> PromptBoard:
+    max_cards = config.AI_PROMPT_MAX_CARDS if max_cards is None else max_cards
+    details_chars = config.AI_PROMPT_DETAILS_CHARS if details_chars is None else details_chars
+
+    shown = _select_cards(board, query, max_cards)
+    prompt = PromptBoard(text="")
+    lines = []
+    card_no = 0
+    for col_no, col in enumerate(board.get("columns", []), start=1):
+        col_alias = f"C{col_no}"
+        prompt.aliases[col_alias] = col["id"]
+        hidden = 0
+        lines.append(f"## {col_alias} {_one_line(col['title'])}")
+        for cid in col["cardIds"]:
+            card = board.get("cards", {}).get(cid)
+            if card is None:
+                continue
+            if cid not in shown:
+                prompt.hidden_card_ids.add(cid)
+                hidden += 1
+                continue
+            card_no += 1
+            card_alias = f"K{card_no}"
+            prompt.aliases[card_alias] = cid
+            details = card.get("details") or ""
+            shown_details = _clip(details, details_chars)
+            if shown_details != details:
+                prompt.clipped_details[cid] = shown_details
+            row = f"{card_alias} | {_one_line(card['title'])} | {shown_details}"
+            if card.get("assigned_to"):
+                row += f" | @{card['assigned_to']}"
+            lines.append(row)
+        if hidden:
+            lines.append(f"(+{hidden} more cards not shown)")
+    prompt.text = "\n".join(lines)
+    return prompt
+
+
+def expand_operations(operations: list, board: dict, prompt: PromptBoard) -> list:
+    """Map operations written against the compact prompt back onto real ids.
+
+    Card indexes count only the cards the model was shown, so they are shifted
+    past any hidden cards; edits that echo back clipped details drop them.
+    """
+    columns = {col["id"]: col["cardIds"] for col in board.get("columns", [])}
+    expanded = []
+    for op in operations:
+        if not isinstance(op, dict):
+            expanded.append(op)  # left for schema validation to reject
+            continue
+        op = {
+            key: prompt.aliases.get(value, value) if key in ("card_id", "column_id") and isinstance(value, str) else value
+            for key, value in op.items()
+        }
+        if op.get("op") == "edit_card" and op.get("details") is not None \
+                and op["details"] == prompt.clipped_details.get(op.get("card_id")):
+            del op["details"]
+        full = columns.get(op.get("column_id"))
+        if op.get("op") in ("add_card", "move_card") and isinstance(op.get("index"), int) and full and prompt.hidden_card_ids:
+            full = [cid for cid in full if cid != op.get("card_id")]
+            visible = [cid for cid in full if cid not in prompt.hidden_card_ids]
+            if op["index"] < 0:
+                op["index"] = 0  # before everything, shown or not
+            else:
+                op["index"] = full.index(visible[op["index"]]) if op["index"] < len(visible) else None
+        expanded.append(op)
+    return expanded
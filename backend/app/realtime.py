@@ -0,0 +1,95 @@
+"""In-process fan-out of board change events to WebSocket subscribers.
+
+Each connection owns a small bounded queue. publish() serializes an event
+once and drops it into every subscriber queue without awaiting, so a write
+request never waits on slow clients; a subscriber whose queue is full is
+closed instead of buffering without limit, and reconnects to refetch the
+board. Idle connections cost one queue and one parked task each.
+
+The hub only reaches connections held by this worker process. Running
+several workers needs an external broker (e.g. Redis pub/sub) feeding
+publish() on every worker.
+"""
+import asyncio
+import json
+from dataclasses import dataclass, field
+
+from app import config
+
+CLOSE = None  # queue sentinel telling the connection to close
+
+CLOSE_NORMAL = 1000
+CLOSE_TRY_AGAIN = 1013      # fell behind; reconnect and refetch
+CLOSE_UNAUTHORIZED = 4401
+CLOSE_FORBIDDEN = 4403      # not (or no longer) a member
+
+
+@dataclass(eq=False)
+class Subscription:
+    board_id: str
+    user_id: str
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=config.WS_QUEUE_SIZE))
+    close_code: int = CLOSE_NORMAL
+
+
+class BoardHub:
+    def __init__(self):
+        self._subscribers: dict[str, set[Subscription]] = {}
+
+    def subscribe(self, board_id: str, user_id: str) -> Subscription:
+        sub = Subscription(board_id, user_id)
+        self._subscribers.setdefault(board_id, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        subs = self._subscribers.get(sub.board_id)
+        if subs is None:
+            return
+        subs.discard(sub)
+        if not subs:
+            del self._subscribers[sub.board_id]
+
+    def publish(self, board_id: str, event: dict) -> int:
+        """Queue an event for every subscriber of the board; returns how many received it."""
+        subs = self._subscribers.get(board_id)
+        if not subs:
+            return 0
+        message = json.dumps(event)
+        delivered = 0
+        for sub in list(subs):
+            try:
+                sub.queue.put_nowait(message)
+                delivered += 1
+            except asyncio.QueueFull:
+                self._close(sub, CLOSE_TRY_AGAIN)
+        return delivered
+
+    def disconnect(self, board_id: str, user_id: str | None = None, code: int = CLOSE_NORMAL) -> None:
+        """Close the board's subscriptions, or only those of one user."""
+        for sub in list(self._subscribers.get(board_id, ())):
+            if user_id is None or sub.user_id == user_id:
+                self._close(sub, code)
+
+    def _close(self, sub: Subscription, code: int) -> None:
+        self.unsubscribe(sub)
+        sub.close_code = code
+        while True:  # make room so the sentinel always fits
+            try:
+                sub.queue.put_nowait(CLOSE)
+                return
+            except asyncio.QueueFull:
+                sub.queue.get_nowait()
+
+    def stats(self) -> dict:
+        return {
+            "boards": len(self._subscribers),
+            "connections": sum(len(subs) for subs in self._subscribers.values()),
+        }
+
+
+board_hub = BoardHub()
+
+
+def publish_board_change(board_id: str, version: int, kind: str, **payload) -> None:
+    """Tell subscribers a board changed. kind is "replace", "ops", "assign", "members", "archive" or "restore"."""
+    board_hub.publish(board_id, {"type": "board_changed", "board_id": board_id, "version": version, "kind": kind, **payload})
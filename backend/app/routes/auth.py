@@ -4,6 +4,7 @@ from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.passwords import DUMMY_HASH, hash_password_async, needs_rehash, verify_password_async
 from app.auth.permissions import issue_token, require_auth, revoke_token, SessionData
 from app.database import get_session
 from app.models.board import User
@@ -26,13 +27,17 @@ class TokenResponse(BaseModel):
 async def login(body: LoginRequest, session: AsyncSession = Depends(get_session)):
     result = await session.execute(select(User).where(User.username == body.username))
     user = result.scalar_one_or_none()
-    if user is None or user.password != body.password:
+    valid = await verify_password_async(body.password, user.password if user else DUMMY_HASH)
+    if user is None or not valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
-    token = issue_token(user.id, user.username)
+    if needs_rehash(user.password):
+        user.password = await hash_password_async(body.password)
+        await session.commit()
+    token = await issue_token(user.id, user.username)
     return TokenResponse(token=token, user_id=user.id, username=user.username)
 
 
 @router.post("/auth/logout", status_code=204)
 async def logout(session_data: SessionData = Depends(require_auth)):
-    revoke_token(session_data.token)
+    await revoke_token(session_data.token)
     return Response(status_code=204)
@@ -1,39 +1,106 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import time
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, WebSocket
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import select, delete
+from sqlalchemy import and_, select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.auth.permissions import require_auth, SessionData
+from app import config
+from app.auth.board_access import BoardAccess, board_access, forget_board_access
+from app.auth.permissions import authenticate_token, require_auth, SessionData
+from app.cache import board_cache
+from app.realtime import CLOSE, CLOSE_FORBIDDEN, CLOSE_UNAUTHORIZED, Subscription, board_hub, publish_board_change
 from app.database import get_session
 from app.models.board import (
-    Board, BoardMember, User, KanbanCard,
-    BoardData, BoardSummary, MemberSchema,
-    db_to_board, board_to_db,
+    Board, BoardMember, User, KanbanColumn,
+    BoardData, BoardIdConflict, BoardNotFound, BoardSummary, BoardVersionConflict, BoardWindow, CardPage, CardSchema,
+    MemberSchema, WindowColumnSchema,
+    COLUMN_CARDS_MAX_COLUMNS, board_columns_query, board_read_query, board_to_db, bump_board_version,
+    column_cards_query, decode_card_cursor, rows_to_board_json, rows_to_card_pages,
 )
+from app.models.archive import (
+    ArchiveConflict, ArchivePage, ArchiveRequest, ArchiveResult, RestoreRequest,
+    archive_cards, decode_archive_cursor, list_archived_cards, restore_cards,
+)
+from app.models.assignment import BulkAssignRequest, BulkAssignResult, CardAssignment, assign_cards
+from app.models.ops import BoardOpError, BoardOpNotFound, BoardOpsRequest, BoardOpsResult, apply_ops
+from app.models.templates import (
+    BOARD_TEMPLATES, BoardTemplate, CloneBoardRequest, clone_board, create_board_from_template,
+)
+from app.models.transfer import BoardImportConflict, BoardImportError, ImportResult, export_board, import_board
 
 router = APIRouter()
 
 
-async def _get_board_or_404(session: AsyncSession, board_id: str) -> Board:
-    board = await session.get(Board, board_id)
-    if board is None:
+async def _require_member(session: AsyncSession, board_id: str, user_id: str) -> BoardAccess:
+    access = await board_access(session, board_id, user_id)
+    if access is None:
         raise HTTPException(status_code=404, detail="Board not found")
-    return board
+    if not access.member:
+        raise HTTPException(status_code=403, detail="Not a member of this board")
+    return access
 
 
-async def _require_member(session: AsyncSession, board_id: str, user_id: str) -> Board:
-    board = await _get_board_or_404(session, board_id)
-    member = await session.get(BoardMember, (board_id, user_id))
-    if member is None:
+def _etag(board_id: str, version: int) -> str:
+    return f'"{board_id}-{version}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def _expected_version(board_id: str, if_match: str | None, expected_version: int | None) -> int | None:
+    """The version a write is conditional on, from the If-Match ETag or an explicit expected_version."""
+    if expected_version is not None:
+        return expected_version
+    if not if_match or if_match.strip() == "*":
+        return None
+    number = if_match.strip().removeprefix("W/").removeprefix(f'"{board_id}-').removesuffix('"')
+    return int(number) if number.isdigit() else -1  # an ETag we never issued can't match
+
+
+def _version_conflict(exc: BoardVersionConflict) -> JSONResponse:
+    return JSONResponse(
+        status_code=409,
+        content={"detail": "Board was changed by someone else", "version": exc.current_version},
+        headers={"ETag": _etag(exc.board_id, exc.current_version)},
+    )
+
+
+def _board_json_response(board_id: str, version: int, body: bytes) -> Response:
+    headers = {"ETag": _etag(board_id, version), "Cache-Control": "no-cache"}
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _load_board(session: AsyncSession, board_id: str, user_id: str) -> Response:
+    """Membership check and board read in one query, returned as pre-serialized BoardData JSON."""
+    rows = (await session.execute(board_read_query(board_id, user_id))).all()
+    if not rows:
+        raise HTTPException(status_code=404, detail="Board not found")
+    if rows[0][0] is None:
         raise HTTPException(status_code=403, detail="Not a member of this board")
-    return board
+    version = rows[0][1]
+    body = rows_to_board_json(rows)
+    board_cache.put((board_id, version), body)
+    return _board_json_response(board_id, version, body)
 
 
-async def _require_owner(session: AsyncSession, board_id: str, user_id: str) -> Board:
-    board = await _require_member(session, board_id, user_id)
-    if board.owner_id != user_id:
+def _board_gone(exc: BoardNotFound) -> HTTPException:
+    """404 for a board deleted after a (possibly cached) access check passed."""
+    forget_board_access(exc.board_id)
+    return HTTPException(status_code=404, detail="Board not found")
+
+
+async def _require_owner(session: AsyncSession, board_id: str, user_id: str) -> BoardAccess:
+    access = await _require_member(session, board_id, user_id)
+    if not access.owner:
         raise HTTPException(status_code=403, detail="Only the board owner can perform this action")
-    return board
+    return access
 
 
 @router.get("/boards", response_model=list[BoardSummary])
@@ -54,6 +121,12 @@ async def list_boards(
 
 class CreateBoardRequest(BaseModel):
     title: str
+    template: str = "default"  # a key of BOARD_TEMPLATES
+
+
+@router.get("/board-templates", response_model=list[BoardTemplate])
+async def list_board_templates(session_data: SessionData = Depends(require_auth)):
+    return list(BOARD_TEMPLATES.values())
 
 
 @router.post("/boards", response_model=BoardSummary, status_code=201)
@@ -62,50 +135,326 @@ async def create_board(
     session_data: SessionData = Depends(require_auth),
     session: AsyncSession = Depends(get_session),
 ):
-    from uuid import uuid4
-    from app.models.board import KanbanColumn
-    board_id = str(uuid4())
-    board = Board(id=board_id, title=body.title, owner_id=session_data.user_id)
-    session.add(board)
-    session.add(BoardMember(board_id=board_id, user_id=session_data.user_id))
-    default_columns = ["Backlog", "Discovery", "In Progress", "Review", "Done"]
-    for pos, col_title in enumerate(default_columns):
-        session.add(KanbanColumn(id=str(uuid4()), title=col_title, position=pos, board_id=board_id))
+    template = BOARD_TEMPLATES.get(body.template)
+    if template is None:
+        raise HTTPException(status_code=400, detail=f"Unknown template: {body.template}")
+    board_id = await create_board_from_template(session, body.title, session_data.user_id, template)
     await session.commit()
     return BoardSummary(id=board_id, title=body.title, owner_username=session_data.username)
 
 
+@router.post("/boards/{board_id}/clone", response_model=BoardSummary, status_code=201)
+async def post_clone(
+    board_id: str,
+    body: CloneBoardRequest | None = None,
+    session_data: SessionData = Depends(require_auth),
+    session: AsyncSession = Depends(get_session),
+):
+    """Copy a board the caller belongs to into a new board they own, without the payload leaving the server."""
+    body = body or CloneBoardRequest()
+    await _require_member(session, board_id, session_data.user_id)
+    try:
+        new_id, title = await clone_board(
+            session, board_id, session_data.user_id, title=body.title, include_cards=body.include_cards,
+        )
+    except BoardNotFound as exc:
+        raise _board_gone(exc)
+    await session.commit()
+    return BoardSummary(id=new_id, title=title, owner_username=session_data.username)
+
+
 @router.delete("/boards/{board_id}", status_code=204)
 async def delete_board(
     board_id: str,
     session_data: SessionData = Depends(require_auth),
     session: AsyncSession = Depends(get_session),
 ):
-    board = await _require_owner(session, board_id, session_data.user_id)
+    await _require_owner(session, board_id, session_data.user_id)
+    board = await session.get(Board, board_id)
+    if board is None:
+        raise _board_gone(BoardNotFound(board_id))
     await session.delete(board)
     await session.commit()
+    forget_board_access(board_id)
+    board_hub.publish(board_id, {"type": "board_deleted", "board_id": board_id})
+    board_hub.disconnect(board_id)
 
 
 @router.get("/boards/{board_id}", response_model=BoardData)
 async def get_board(
     board_id: str,
+    if_none_match: str | None = Header(default=None),
     session_data: SessionData = Depends(require_auth),
     session: AsyncSession = Depends(get_session),
 ):
-    await _require_member(session, board_id, session_data.user_id)
-    return await db_to_board(session, board_id)
+    """Board JSON with an ETag of its version.
+
+    A version lookup (which also checks membership) decides between 304, a
+    cached payload and a full read, so unchanged boards skip the board query.
+    """
+    row = (await session.execute(
+        select(Board.version, BoardMember.user_id)
+        .outerjoin(BoardMember, and_(BoardMember.board_id == Board.id, BoardMember.user_id == session_data.user_id))
+        .where(Board.id == board_id)
+    )).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    version, member = row
+    if member is None:
+        raise HTTPException(status_code=403, detail="Not a member of this board")
+    etag = _etag(board_id, version)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    body = board_cache.get((board_id, version))
+    if body is not None:
+        return _board_json_response(board_id, version, body)
+    return await _load_board(session, board_id, session_data.user_id)
+
+
+_page_size = Query(default=config.BOARD_PAGE_SIZE, ge=1, le=config.BOARD_PAGE_MAX_SIZE)
+
+
+@router.get("/boards/{board_id}/window", response_model=BoardWindow)
+async def get_board_window(
+    board_id: str,
+    limit: int = _page_size,
+    if_none_match: str | None = Header(default=None),
+    session_data: SessionData = Depends(require_auth),
+    session: AsyncSession = Depends(get_session),
+):
+    """The board with only the first `limit` cards of each column.
+
+    Every column carries its total cardCount and, when it holds more cards
+    than were sent, a nextCursor for GET /boards/{id}/columns/{column_id}/cards.
+    The response size is bounded by the number of columns times `limit`,
+    however many cards the board has accumulated.
+    """
+    rows = (await session.execute(board_columns_query(board_id, session_data.user_id))).all()
+    if not rows:
+        raise HTTPException(status_code=404, detail="Board not found")
+    if rows[0][0] is None:
+        raise HTTPException(status_code=403, detail="Not a member of this board")
+    # The version is read before the cards, so a write in between can only make it
+    # look older than the cards are; the resulting board_changed event makes the
+    # client refetch rather than miss the change.
+    version = rows[0][1]
+    etag = _etag(board_id, version)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    columns = [(col_id, title, count) for _, _, col_id, title, count in rows if col_id is not None]
+    card_ids, cursors, cards = {}, {}, {}
+    if columns:
+        column_ids = [col[0] for col in columns]
+        card_rows = []
+        for start in range(0, len(column_ids), COLUMN_CARDS_MAX_COLUMNS):
+            chunk = column_ids[start:start + COLUMN_CARDS_MAX_COLUMNS]
+            card_rows += (await session.execute(column_cards_query(chunk, limit + 1))).all()
+        card_ids, cursors, cards = rows_to_card_pages(card_rows, limit)
+    window = BoardWindow(
+        version=version,
+        columns=[
+            WindowColumnSchema(
+                id=col_id, title=title, cardIds=card_ids.get(col_id, []),
+                cardCount=count, nextCursor=cursors.get(col_id),
+            )
+            for col_id, title, count in columns
+        ],
+        cards=cards,
+    )
+    return _board_json_response(board_id, version, window.model_dump_json().encode())
+
+
+@router.get("/boards/{board_id}/columns/{column_id}/cards", response_model=CardPage)
+async def get_column_cards(
+    board_id: str,
+    column_id: str,
+    after: str | None = None,
+    limit: int = _page_size,
+    session_data: SessionData = Depends(require_auth),
+    session: AsyncSession = Depends(get_session),
+):
+    """The next page of a column's cards, following the `after` cursor from a previous page or window."""
+    try:
+        cursor = decode_card_cursor(after) if after else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    row = (await session.execute(
+        select(Board.version, BoardMember.user_id, KanbanColumn.id)
+        .outerjoin(BoardMember, and_(BoardMember.board_id == Board.id, BoardMember.user_id == session_data.user_id))
+        .outerjoin(KanbanColumn, and_(KanbanColumn.board_id == Board.id, KanbanColumn.id == column_id))
+        .where(Board.id == board_id)
+    )).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    version, member, found_column = row
+    if member is None:
+        raise HTTPException(status_code=403, detail="Not a member of this board")
+    if found_column is None:
+        raise HTTPException(status_code=404, detail="Column not found")
+    card_rows = (await session.execute(column_cards_query([column_id], limit + 1, after=cursor))).all()
+    card_ids, cursors, cards = rows_to_card_pages(card_rows, limit)
+    return CardPage(
+        version=version, cardIds=card_ids.get(column_id, []), cards=cards, nextCursor=cursors.get(column_id),
+    )
 
 
 @router.patch("/boards/{board_id}", response_model=BoardData)
 async def patch_board(
     board_id: str,
     body: BoardData,
+    expected_version: int | None = None,
+    if_match: str | None = Header(default=None),
+    session_data: SessionData = Depends(require_auth),
+    session: AsyncSession = Depends(get_session),
+):
+    """Replace the board. With If-Match (or expected_version), 409 if someone else wrote first."""
+    await _require_member(session, board_id, session_data.user_id)
+    try:
+        version = await board_to_db(
+            session, board_id, body, session_data.user_id,
+            expected_version=_expected_version(board_id, if_match, expected_version),
+        )
+    except BoardVersionConflict as exc:
+        return _version_conflict(exc)
+    except BoardIdConflict as exc:
+        raise HTTPException(status_code=409, detail=exc.detail)
+    except BoardNotFound as exc:
+        raise _board_gone(exc)
+    publish_board_change(board_id, version, "replace")
+    return await _load_board(session, board_id, session_data.user_id)
+
+
+@router.post("/boards/{board_id}/ops", response_model=BoardOpsResult)
+async def post_board_ops(
+    board_id: str,
+    body: BoardOpsRequest,
+    if_match: str | None = Header(default=None),
+    session_data: SessionData = Depends(require_auth),
+    session: AsyncSession = Depends(get_session),
+):
+    await _require_member(session, board_id, session_data.user_id)
+    try:
+        result = await apply_ops(
+            session, board_id, body.ops, session_data.user_id,
+            expected_version=_expected_version(board_id, if_match, body.expected_version),
+        )
+    except BoardVersionConflict as exc:
+        return _version_conflict(exc)
+    except BoardNotFound as exc:
+        raise _board_gone(exc)
+    except BoardOpNotFound as exc:
+        raise HTTPException(status_code=404, detail=exc.detail)
+    except BoardOpError as exc:
+        raise HTTPException(status_code=409, detail=exc.detail)
+    publish_board_change(board_id, result.version, "ops", changes=result.model_dump())
+    return result
+
+
+@router.post("/boards/{board_id}/archive", response_model=ArchiveResult)
+async def post_archive(
+    board_id: str,
+    body: ArchiveRequest,
+    if_match: str | None = Header(default=None),
+    session_data: SessionData = Depends(require_auth),
+    session: AsyncSession = Depends(get_session),
+):
+    """Move cards out of the board into its archive, by column, ids and/or age."""
+    await _require_member(session, board_id, session_data.user_id)
+    older_than = time.time() - body.older_than_days * 86400 if body.older_than_days is not None else None
+    try:
+        result = await archive_cards(
+            session, board_id, column_id=body.column_id, card_ids=body.card_ids, older_than=older_than,
+            expected_version=_expected_version(board_id, if_match, body.expected_version),
+        )
+    except BoardVersionConflict as exc:
+        return _version_conflict(exc)
+    except BoardNotFound as exc:
+        raise _board_gone(exc)
+    except ArchiveConflict as exc:
+        raise HTTPException(status_code=409, detail=exc.detail)
+    except BoardOpError as exc:
+        raise HTTPException(status_code=400, detail=exc.detail)
+    if result.count:
+        publish_board_change(board_id, result.version, "archive")
+    return result
+
+
+@router.get("/boards/{board_id}/archive", response_model=ArchivePage)
+async def get_archive(
+    board_id: str,
+    q: str | None = None,
+    column_id: str | None = None,
+    after: str | None = None,
+    limit: int = _page_size,
     session_data: SessionData = Depends(require_auth),
     session: AsyncSession = Depends(get_session),
 ):
+    """Archived cards, most recently archived first, optionally filtered by column or text."""
+    try:
+        cursor = decode_archive_cursor(after) if after else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     await _require_member(session, board_id, session_data.user_id)
-    await board_to_db(session, board_id, body, session_data.user_id)
-    return await db_to_board(session, board_id)
+    return await list_archived_cards(session, board_id, limit, after=cursor, column_id=column_id, query=q)
+
+
+@router.post("/boards/{board_id}/archive/restore", response_model=ArchiveResult)
+async def post_restore(
+    board_id: str,
+    body: RestoreRequest,
+    if_match: str | None = Header(default=None),
+    session_data: SessionData = Depends(require_auth),
+    session: AsyncSession = Depends(get_session),
+):
+    await _require_member(session, board_id, session_data.user_id)
+    try:
+        result = await restore_cards(
+            session, board_id, body.card_ids,
+            expected_version=_expected_version(board_id, if_match, body.expected_version),
+        )
+    except BoardVersionConflict as exc:
+        return _version_conflict(exc)
+    except BoardNotFound as exc:
+        raise _board_gone(exc)
+    except BoardOpError as exc:
+        raise HTTPException(status_code=409, detail=exc.detail)
+    if result.count:
+        publish_board_change(board_id, result.version, "restore")
+    return result
+
+
+@router.get("/boards/{board_id}/export")
+async def get_export(
+    board_id: str,
+    session_data: SessionData = Depends(require_auth),
+    session: AsyncSession = Depends(get_session),
+):
+    """The whole board as NDJSON, streamed from one query (see app/models/transfer.py for the format)."""
+    await _require_member(session, board_id, session_data.user_id)
+    return StreamingResponse(
+        export_board(session, board_id, config.EXPORT_BATCH_SIZE),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="board-{board_id}.ndjson"'},
+    )
+
+
+@router.post("/boards/import", response_model=ImportResult, status_code=201)
+async def post_import(
+    request: Request,
+    new_ids: bool = False,
+    session_data: SessionData = Depends(require_auth),
+    session: AsyncSession = Depends(get_session),
+):
+    """Create a board owned by the caller from an NDJSON export, read and written in batches."""
+    try:
+        return await import_board(
+            session, request.stream(), session_data.user_id, config.IMPORT_BATCH_SIZE,
+            new_ids=new_ids, max_line_bytes=config.IMPORT_MAX_LINE_BYTES,
+        )
+    except BoardImportConflict as exc:
+        raise HTTPException(status_code=409, detail=exc.detail)
+    except BoardImportError as exc:
+        raise HTTPException(status_code=400, detail=exc.detail)
 
 
 @router.get("/boards/{board_id}/members", response_model=list[MemberSchema])
@@ -144,8 +493,14 @@ async def invite_member(
     existing = await session.get(BoardMember, (board_id, user.id))
     if existing:
         raise HTTPException(status_code=409, detail="User is already a member")
+    try:
+        version = await bump_board_version(session, board_id)
+    except BoardNotFound as exc:
+        raise _board_gone(exc)
     session.add(BoardMember(board_id=board_id, user_id=user.id))
     await session.commit()
+    forget_board_access(board_id, user.id)
+    publish_board_change(board_id, version, "members")
     return MemberSchema(user_id=user.id, username=user.username)
 
 
@@ -156,13 +511,17 @@ async def remove_member(
     session_data: SessionData = Depends(require_auth),
     session: AsyncSession = Depends(get_session),
 ):
-    board = await _require_owner(session, board_id, session_data.user_id)
+    await _require_owner(session, board_id, session_data.user_id)
     if username == session_data.username:
         raise HTTPException(status_code=400, detail="Owner cannot remove themselves from the board")
     result = await session.execute(select(User).where(User.username == username))
     user = result.scalar_one_or_none()
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
+    try:
+        version = await bump_board_version(session, board_id)
+    except BoardNotFound as exc:
+        raise _board_gone(exc)
     await session.execute(
         delete(BoardMember).where(
             BoardMember.board_id == board_id,
@@ -170,13 +529,16 @@ async def remove_member(
         )
     )
     await session.commit()
+    forget_board_access(board_id, user.id)
+    publish_board_change(board_id, version, "members")
+    board_hub.disconnect(board_id, user.id, code=CLOSE_FORBIDDEN)
 
 
 class AssignCardRequest(BaseModel):
     username: str | None
 
 
-@router.patch("/boards/{board_id}/cards/{card_id}/assignee", response_model=None)
+@router.patch("/boards/{board_id}/cards/{card_id}/assignee", response_model=CardSchema)
 async def assign_card(
     board_id: str,
     card_id: str,
@@ -185,40 +547,91 @@ async def assign_card(
     session: AsyncSession = Depends(get_session),
 ):
     await _require_member(session, board_id, session_data.user_id)
-    card = await session.get(KanbanCard, card_id)
-    if card is None:
-        raise HTTPException(status_code=404, detail="Card not found")
-
-    if body.username is None:
-        card.assigned_to_id = None
-    else:
-        result = await session.execute(select(User).where(User.username == body.username))
-        user = result.scalar_one_or_none()
-        if user is None:
-            raise HTTPException(status_code=404, detail="User not found")
-        card.assigned_to_id = user.id
-
-    await session.commit()
-    await session.refresh(card)
-
-    # Return card with resolved usernames
-    created_by_username = None
-    if card.created_by_id:
-        creator = await session.get(User, card.created_by_id)
-        if creator:
-            created_by_username = creator.username
-
-    assigned_to_username = None
-    if card.assigned_to_id:
-        assignee = await session.get(User, card.assigned_to_id)
-        if assignee:
-            assigned_to_username = assignee.username
-
-    from app.models.board import CardSchema
-    return CardSchema(
-        id=card.id,
-        title=card.title,
-        details=card.details or "",
-        created_by=created_by_username,
-        assigned_to=assigned_to_username,
-    )
+    try:
+        result = await assign_cards(session, board_id, [CardAssignment(card_id=card_id, username=body.username)])
+    except BoardNotFound as exc:
+        raise _board_gone(exc)
+    except BoardOpNotFound as exc:
+        raise HTTPException(status_code=404, detail=exc.detail)
+    card = result.cards[0]
+    publish_board_change(board_id, result.version, "assign", card=card.model_dump())
+    return card
+
+
+@router.patch("/boards/{board_id}/cards/assignees", response_model=BulkAssignResult)
+async def assign_cards_bulk(
+    board_id: str,
+    body: BulkAssignRequest,
+    if_match: str | None = Header(default=None),
+    session_data: SessionData = Depends(require_auth),
+    session: AsyncSession = Depends(get_session),
+):
+    """Assign or unassign many cards in one write; fails as a whole if any card or user is unknown."""
+    await _require_member(session, board_id, session_data.user_id)
+    try:
+        result = await assign_cards(
+            session, board_id, body.assignments,
+            expected_version=_expected_version(board_id, if_match, body.expected_version),
+        )
+    except BoardVersionConflict as exc:
+        return _version_conflict(exc)
+    except BoardNotFound as exc:
+        raise _board_gone(exc)
+    except BoardOpNotFound as exc:
+        raise HTTPException(status_code=404, detail=exc.detail)
+    except BoardOpError as exc:
+        raise HTTPException(status_code=400, detail=exc.detail)
+    publish_board_change(board_id, result.version, "assign", cards=[card.model_dump() for card in result.cards])
+    return result
+
+
+async def _pump_events(websocket: WebSocket, sub: Subscription) -> None:
+    """Forward queued events until the hub closes the subscription or the client goes away."""
+
+    async def send():
+        while (message := await sub.queue.get()) is not CLOSE:
+            await websocket.send_text(message)
+        await websocket.close(code=sub.close_code)
+
+    async def receive():
+        # Client messages (e.g. keepalive pings) are ignored; this only notices the disconnect
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    tasks = {asyncio.create_task(send()), asyncio.create_task(receive())}
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+@router.websocket("/boards/{board_id}/ws")
+async def board_events(
+    websocket: WebSocket,
+    board_id: str,
+    token: str = "",
+    session: AsyncSession = Depends(get_session),
+):
+    """Push board change events to a member.
+
+    Browsers cannot set headers on a WebSocket, so the bearer token comes in
+    the `token` query parameter. Each message is a JSON event:
+    `board_changed` (with the new version and, for ops and assignments, the
+    changed fragment) or `board_deleted`.
+    """
+    session_data = await authenticate_token(token) if token else None
+    if session_data is None:
+        await websocket.close(code=CLOSE_UNAUTHORIZED)
+        return
+    access = await board_access(session, board_id, session_data.user_id)
+    await session.close()  # don't hold a pooled connection for the life of the socket
+    if access is None or not access.member:
+        await websocket.close(code=CLOSE_FORBIDDEN)
+        return
+    sub = board_hub.subscribe(board_id, session_data.user_id)  # before accept, so no event is missed
+    try:
+        await websocket.accept()
+        await _pump_events(websocket, sub)
+    finally:
+        board_hub.unsubscribe(sub)
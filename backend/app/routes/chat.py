@@ -1,14 +1,53 @@
+import json
+import logging
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.board_access import board_access
 from app.auth.permissions import require_auth, SessionData
 from app.database import get_session
-from app.models.board import BoardData, ChatRequest, ChatResponse, board_to_db, BoardMember
-from app.ai import call_ai
+from app.models.board import ChatRequest, ChatResponse, BoardNotFound, BoardVersionConflict
+from app.models.ops import BoardOp, BoardOpError, apply_ops
+from app.ai import call_ai, stream_ai
+from app.realtime import publish_board_change
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_ops_adapter = TypeAdapter(list[BoardOp])
+
+
+async def _require_chat_member(session: AsyncSession, board_id: str, user_id: str) -> None:
+    access = await board_access(session, board_id, user_id)
+    if access is None or not access.member:
+        raise HTTPException(status_code=403, detail="Not a member of this board")
+
+
+async def _apply_ai_result(
+    session: AsyncSession, board_id: str, user_id: str, result: dict, board_version: int | None = None,
+) -> ChatResponse:
+    message = result.get("message", "")
+    changes = None
+    raw_ops = result.get("operations") or []
+    if raw_ops:
+        try:
+            changes = await apply_ops(
+                session, board_id, _ops_adapter.validate_python(raw_ops), user_id, expected_version=board_version,
+            )
+        except BoardNotFound:
+            message += "\n\n(The board was deleted while I was answering, so I didn't apply those changes.)"
+        except BoardVersionConflict:
+            message += "\n\n(The board changed while I was answering, so I didn't apply those changes. Please ask again.)"
+        except (ValidationError, BoardOpError) as exc:
+            logger.warning("Discarding AI operations for board %s: %s", board_id, exc)
+            message += "\n\n(I couldn't apply those board changes, so the board was left unchanged.)"
+        else:
+            publish_board_change(board_id, changes.version, "ops", changes=changes.model_dump())
+    return ChatResponse(message=message, changes=changes)
+
 
 @router.post("/chat", response_model=ChatResponse)
 async def post_chat(
@@ -16,16 +55,38 @@ async def post_chat(
     session_data: SessionData = Depends(require_auth),
     session: AsyncSession = Depends(get_session),
 ):
-    # Verify membership
-    member = await session.get(BoardMember, (body.board_id, session_data.user_id))
-    if member is None:
-        raise HTTPException(status_code=403, detail="Not a member of this board")
+    await _require_chat_member(session, body.board_id, session_data.user_id)
+    result = await call_ai(body.board.model_dump(), body.messages)
+    return await _apply_ai_result(session, body.board_id, session_data.user_id, result, body.board_version)
 
-    result = call_ai(body.board.model_dump(), body.messages)
-    message = result.get("message", "")
-    board_update = None
-    raw_update = result.get("board_update")
-    if raw_update is not None:
-        board_update = BoardData.model_validate(raw_update)
-        await board_to_db(session, body.board_id, board_update, session_data.user_id)
-    return ChatResponse(message=message, board_update=board_update)
+
+def _sse(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+@router.post("/chat/stream")
+async def post_chat_stream(
+    body: ChatRequest,
+    session_data: SessionData = Depends(require_auth),
+    session: AsyncSession = Depends(get_session),
+):
+    """Server-Sent Events variant of /chat.
+
+    Emits `token` events carrying pieces of the assistant message as they are
+    generated, then one `done` event with the ChatResponse.
+    """
+    await _require_chat_member(session, body.board_id, session_data.user_id)
+
+    async def events():
+        async for kind, value in stream_ai(body.board.model_dump(), body.messages):
+            if kind == "token":
+                yield _sse("token", json.dumps({"delta": value}))
+                continue
+            response = await _apply_ai_result(session, body.board_id, session_data.user_id, value, body.board_version)
+            yield _sse("done", response.model_dump_json())
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
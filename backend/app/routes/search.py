@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import config
+from app.auth.permissions import require_auth, SessionData
+from app.database import get_session
+from app.models.search import SearchHit, search_cards
+
+router = APIRouter()
+
+
+@router.get("/search", response_model=list[SearchHit])
+async def search(
+    q: str = Query(min_length=1, max_length=200),
+    board_id: str | None = None,
+    limit: int = Query(default=config.SEARCH_PAGE_SIZE, ge=1, le=config.BOARD_PAGE_MAX_SIZE),
+    session_data: SessionData = Depends(require_auth),
+    session: AsyncSession = Depends(get_session),
+):
+    """Cards matching every word of `q` across the caller's boards, best match first."""
+    return await search_cards(session, session_data.user_id, q, limit, board_id=board_id)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Benchmark a full board read before and after moving most of its cards to the archive.
+
+    uv run python scripts/bench_archive.py --cards 50000 --active 5000
+"""
+import argparse
+import asyncio
+import time
+
+from bench_common import api_client, make_board, make_engine, summarize, timed  # also puts app/ on sys.path
+from app.cache import board_cache
+
+
+async def main(n_cards: int, n_active: int, repeat: int) -> None:
+    engine, maker = await make_engine()
+    async with api_client(maker) as client:
+        board_id = (await client.post("/api/boards", json={"title": "Bench"})).json()["id"]
+        # Active cards in the first column, history in the last one
+        board = make_board(n_cards, n_columns=2)
+        active, history = board["columns"]
+        cards = active["cardIds"] + history["cardIds"]
+        active["cardIds"], history["cardIds"] = cards[:n_active], cards[n_active:]
+        (await client.patch(f"/api/boards/{board_id}", json=board)).raise_for_status()
+        url = f"/api/boards/{board_id}"
+
+        async def cold():
+            board_cache.clear()
+            await client.get(url)
+
+        print(f"cards={n_cards} active={n_active}")
+        print(f"  {'before archiving':<18} {summarize(await timed(cold, repeat))}")
+        start = time.perf_counter()
+        result = (await client.post(f"{url}/archive", json={"column_id": history["id"]})).json()
+        print(f"  archived {result['count']} cards in {(time.perf_counter() - start) * 1000:.0f} ms")
+        print(f"  {'after archiving':<18} {summarize(await timed(cold, repeat))}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=50000)
+    parser.add_argument("--active", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.cards, args.active, args.repeat))
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Benchmark board permission checks: two primary-key gets, one joined query, and a cache hit.
+
+    uv run python scripts/bench_board_access.py --repeat 2000
+"""
+import argparse
+import asyncio
+
+from bench_common import make_engine, summarize, timed  # also puts app/ on sys.path
+from app.auth.board_access import board_access
+from app.cache import board_access_cache
+from app.models.board import Board, BoardMember
+
+
+async def main(repeat: int) -> None:
+    engine, maker = await make_engine()
+    async with maker() as session:
+
+        async def two_gets():
+            session.expunge_all()  # an identity-map hit would skip the database, unlike a fresh request
+            await session.get(Board, "board-1")
+            await session.get(BoardMember, ("board-1", "user-1"))
+
+        async def joined():
+            board_access_cache.clear()
+            await board_access(session, "board-1", "user-1")
+
+        async def cached():
+            await board_access(session, "board-1", "user-1")
+
+        print(f"repeat={repeat}")
+        for label, fn in [("session.get x2", two_gets), ("joined query", joined), ("cache hit", cached)]:
+            print(f"  {label:<15} {summarize(await timed(fn, repeat))}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
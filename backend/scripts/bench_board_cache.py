@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Benchmark GET /api/boards/{id} on a cold cache, a warm cache and with If-None-Match.
+
+    uv run python scripts/bench_board_cache.py --cards 5000
+"""
+import argparse
+import asyncio
+
+from bench_common import api_client, make_board, make_engine, summarize, timed  # also puts app/ on sys.path
+from app.cache import board_cache
+
+
+async def main(n_cards: int, repeat: int) -> None:
+    engine, maker = await make_engine()
+    async with api_client(maker) as client:
+        board_id = (await client.post("/api/boards", json={"title": "Bench"})).json()["id"]
+        (await client.patch(f"/api/boards/{board_id}", json=make_board(n_cards))).raise_for_status()
+        url = f"/api/boards/{board_id}"
+
+        async def cold():
+            board_cache.clear()
+            await client.get(url)
+
+        etag = (await client.get(url)).headers["etag"]
+        cases = [
+            ("cold (full read)", cold),
+            ("warm cache", lambda: client.get(url)),
+            ("If-None-Match -> 304", lambda: client.get(url, headers={"If-None-Match": etag})),
+        ]
+        print(f"cards={n_cards}")
+        for label, fn in cases:
+            print(f"  {label:<21} {summarize(await timed(fn, repeat))}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(main(args.cards, args.repeat))
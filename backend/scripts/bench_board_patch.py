@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Benchmark PATCH /api/boards/{id} latency against board size.
+
+Each round moves one card to the top of another column and renames it, so the
+measurement covers the read-diff-upsert path of board_to_db plus the re-read.
+
+    uv run python scripts/bench_board_patch.py --sizes 100 500 2000 --repeat 20
+"""
+import argparse
+import asyncio
+import copy
+
+from bench_common import api_client, make_board, make_engine, summarize, timed
+
+
+async def bench_size(n_cards: int, repeat: int) -> None:
+    engine, maker = await make_engine()
+    board = make_board(n_cards)
+    async with api_client(maker) as client:
+        board_id = (await client.post("/api/boards", json={"title": f"Bench {n_cards}"})).json()["id"]
+        resp = await client.patch(f"/api/boards/{board_id}", json=board)
+        resp.raise_for_status()
+
+        state = {"board": resp.json(), "round": 0}
+
+        async def one_patch():
+            b = copy.deepcopy(state["board"])
+            src, dst = b["columns"][0], b["columns"][1]
+            if not src["cardIds"]:
+                src, dst = dst, src
+            card_id = src["cardIds"].pop()
+            dst["cardIds"].insert(0, card_id)
+            state["round"] += 1
+            b["cards"][card_id]["title"] = f"Moved {state['round']}"
+            r = await client.patch(f"/api/boards/{board_id}", json=b)
+            r.raise_for_status()
+            state["board"] = r.json()
+
+        samples = await timed(one_patch, repeat)
+    await engine.dispose()
+    print(f"cards={n_cards:>6}  {summarize(samples)}")
+
+
+async def main(sizes: list[int], repeat: int) -> None:
+    for n in sizes:
+        await bench_size(n, repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500, 2000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.repeat))
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Benchmark loading a board: five-round-trip ORM path vs the single joined query.
+
+The legacy path is the previous get_board: membership via two session.get
+calls, then columns, cards and users as separate ORM queries. The new path is
+board_read_query + rows_to_board. Reports latency and statements executed.
+
+    uv run python scripts/bench_board_read.py --sizes 100 1000 5000
+"""
+import argparse
+import asyncio
+
+from sqlalchemy import event, select
+
+from bench_common import api_client, make_board, make_engine, summarize, timed  # also puts app/ on sys.path
+from app.models.board import (
+    Board, BoardData, BoardMember, CardSchema, ColumnSchema, KanbanCard, KanbanColumn, User,
+    board_read_query, rows_to_board,
+)
+
+
+async def legacy_load(session, board_id: str, user_id: str) -> BoardData:
+    await session.get(Board, board_id)
+    await session.get(BoardMember, (board_id, user_id))
+    cols = (await session.execute(
+        select(KanbanColumn).where(KanbanColumn.board_id == board_id).order_by(KanbanColumn.position)
+    )).scalars().all()
+    cards = (await session.execute(
+        select(KanbanCard).where(KanbanCard.column_id.in_([c.id for c in cols])).order_by(KanbanCard.position)
+    )).scalars().all()
+    user_ids = {uid for card in cards for uid in (card.created_by_id, card.assigned_to_id) if uid}
+    users = {u.id: u.username for u in (await session.execute(select(User).where(User.id.in_(user_ids)))).scalars()}
+    by_col: dict[str, list[str]] = {}
+    for card in cards:
+        by_col.setdefault(card.column_id, []).append(card.id)
+    return BoardData(
+        columns=[ColumnSchema(id=c.id, title=c.title, cardIds=by_col.get(c.id, [])) for c in cols],
+        cards={
+            c.id: CardSchema(id=c.id, title=c.title, details=c.details or "",
+                             created_by=users.get(c.created_by_id), assigned_to=users.get(c.assigned_to_id))
+            for c in cards
+        },
+    )
+
+
+async def new_load(session, board_id: str, user_id: str) -> BoardData:
+    return rows_to_board((await session.execute(board_read_query(board_id, user_id))).all())
+
+
+async def bench_size(n_cards: int, repeat: int) -> None:
+    engine, maker = await make_engine()
+    async with api_client(maker) as client:
+        board_id = (await client.post("/api/boards", json={"title": f"Bench {n_cards}"})).json()["id"]
+        (await client.patch(f"/api/boards/{board_id}", json=make_board(n_cards))).raise_for_status()
+
+    statements = 0
+
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    for label, load in (("legacy", legacy_load), ("joined", new_load)):
+        async def run():
+            async with maker() as session:
+                await load(session, board_id, "user-1")
+
+        statements = 0
+        await run()
+        per_load = statements
+        samples = await timed(run, repeat)
+        print(f"cards={n_cards:>6}  {label:<6} statements={per_load}  {summarize(samples)}")
+    await engine.dispose()
+
+
+async def main(sizes: list[int], repeat: int) -> None:
+    for n in sizes:
+        await bench_size(n, repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.repeat))
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark serializing a large board for GET /api/boards/{id}.
+
+Starts from the same board_read_query rows and compares the model path
+(rows_to_board, then what FastAPI does for response_model=BoardData: dump,
+re-validate, dump to JSON types, json.dumps) with rows_to_board_json, which
+writes the JSON bytes directly. Also times the full GET over ASGI.
+
+    uv run python scripts/bench_board_serialize.py --cards 5000
+"""
+import argparse
+import asyncio
+import json
+
+from pydantic import TypeAdapter
+
+from bench_common import api_client, make_board, make_engine, summarize, timed  # also puts app/ on sys.path
+from app.models import board as board_module
+from app.models.board import BoardData, board_read_query, rows_to_board, rows_to_board_json
+
+_adapter = TypeAdapter(BoardData)
+
+
+def model_path(rows) -> bytes:
+    board = rows_to_board(rows)
+    validated = BoardData.model_validate(board.model_dump())
+    content = _adapter.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+async def main(n_cards: int, repeat: int) -> None:
+    engine, maker = await make_engine()
+    async with api_client(maker) as client:
+        board_id = (await client.post("/api/boards", json={"title": "Bench"})).json()["id"]
+        (await client.patch(f"/api/boards/{board_id}", json=make_board(n_cards))).raise_for_status()
+        async with maker() as session:
+            rows = (await session.execute(board_read_query(board_id, "user-1"))).all()
+        assert json.loads(model_path(rows)) == json.loads(rows_to_board_json(rows))
+
+        orjson = board_module.orjson
+        variants = [("models + response_model", model_path), ("raw rows -> json", rows_to_board_json)]
+        if orjson is not None:
+            def stdlib_json(r):
+                board_module.orjson = None
+                try:
+                    return rows_to_board_json(r)
+                finally:
+                    board_module.orjson = orjson
+            variants.insert(1, ("raw rows -> stdlib json", stdlib_json))
+
+        async def run_sync(fn):
+            fn(rows)
+
+        print(f"cards={n_cards}  payload={len(rows_to_board_json(rows)) / 1024:.0f} KiB  orjson={'yes' if orjson else 'no'}")
+        for label, fn in variants:
+            samples = await timed(lambda: run_sync(fn), repeat)
+            print(f"  {label:<24} {summarize(samples)}")
+        samples = await timed(lambda: client.get(f"/api/boards/{board_id}"), repeat)
+        print(f"  {'GET /api/boards/{id}':<24} {summarize(samples)}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(main(args.cards, args.repeat))
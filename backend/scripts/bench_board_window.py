@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Benchmark the full GET /api/boards/{id} against the windowed read and column paging.
+
+    uv run python scripts/bench_board_window.py --cards 50000 --limit 50
+"""
+import argparse
+import asyncio
+
+from bench_common import api_client, make_board, make_engine, summarize, timed  # also puts app/ on sys.path
+from app.cache import board_cache
+
+
+async def main(n_cards: int, limit: int, repeat: int) -> None:
+    engine, maker = await make_engine()
+    async with api_client(maker) as client:
+        board_id = (await client.post("/api/boards", json={"title": "Bench"})).json()["id"]
+        (await client.patch(f"/api/boards/{board_id}", json=make_board(n_cards))).raise_for_status()
+        full_url = f"/api/boards/{board_id}"
+        window_url = f"/api/boards/{board_id}/window?limit={limit}"
+
+        # A cursor halfway down the first column, as if the user had scrolled that far
+        window = (await client.get(window_url)).json()
+        column = window["columns"][0]
+        cursor = column["nextCursor"]
+        for _ in range(column["cardCount"] // (2 * limit)):
+            page = (await client.get(f"/api/boards/{board_id}/columns/{column['id']}/cards",
+                                     params={"after": cursor, "limit": limit})).json()
+            cursor = page["nextCursor"] or cursor
+        page_url = f"/api/boards/{board_id}/columns/{column['id']}/cards?after={cursor}&limit={limit}"
+
+        async def full():
+            board_cache.clear()
+            await client.get(full_url)
+
+        print(f"cards={n_cards} limit={limit}")
+        for label, url in [("full board", full_url), ("window", window_url), ("mid-column page", page_url)]:
+            size = len((await client.get(url)).content)
+            fn = full if url == full_url else (lambda url=url: client.get(url))
+            print(f"  {label:<16} {size / 1024:9.1f} KiB  {summarize(await timed(fn, repeat))}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=50000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.cards, args.limit, args.repeat))
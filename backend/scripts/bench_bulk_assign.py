@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Benchmark assigning --assign cards one request at a time against one bulk request.
+
+    uv run python scripts/bench_bulk_assign.py --cards 10000 --assign 500
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from bench_common import api_client, make_board, make_engine  # also puts app/ on sys.path
+
+
+async def main(n_cards: int, n_assign: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, maker = await make_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        async with api_client(maker) as client:
+            board = make_board(n_cards)
+            (await client.patch("/api/boards/board-1", json=board)).raise_for_status()
+            card_ids = list(board["cards"])[:n_assign]
+            users = ["alice", "bob"]
+            print(f"cards={n_cards} assign={n_assign}")
+
+            start = time.perf_counter()
+            for i, card_id in enumerate(card_ids):
+                resp = await client.patch(f"/api/boards/board-1/cards/{card_id}/assignee", json={"username": users[i % 2]})
+                resp.raise_for_status()
+            single = time.perf_counter() - start
+            print(f"  {'one by one':<10} {single * 1000:8.0f} ms  ({single * 1000 / n_assign:.2f} ms/card)")
+
+            body = {"assignments": [{"card_id": c, "username": users[(i + 1) % 2]} for i, c in enumerate(card_ids)]}
+            start = time.perf_counter()
+            (await client.patch("/api/boards/board-1/cards/assignees", json=body)).raise_for_status()
+            bulk = time.perf_counter() - start
+            print(f"  {'bulk':<10} {bulk * 1000:8.0f} ms  ({single / bulk:.0f}x faster)")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=10000)
+    parser.add_argument("--assign", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.cards, args.assign))
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark moving a card to the top of a long column.
+
+Each move re-reads the board and then either posts a single move_card op or
+PATCHes the whole board. Reports latency and how many card rows were rewritten.
+
+    uv run python scripts/bench_card_moves.py --lengths 100 500 2000
+"""
+import argparse
+import asyncio
+
+from sqlalchemy import select
+
+from bench_common import api_client, make_board, make_engine, summarize, timed  # also puts app/ on sys.path
+from app.models.board import KanbanCard
+
+
+async def _positions(maker) -> dict[str, tuple[str, int]]:
+    async with maker() as session:
+        rows = (await session.execute(select(KanbanCard.id, KanbanCard.column_id, KanbanCard.position))).all()
+    return {card_id: (column_id, position) for card_id, column_id, position in rows}
+
+
+async def bench_length(length: int, repeat: int) -> None:
+    engine, maker = await make_engine()
+    board = make_board(length, n_columns=1)
+    async with api_client(maker) as client:
+        board_id = (await client.post("/api/boards", json={"title": f"Bench {length}"})).json()["id"]
+        board["columns"].append({"id": "bench-col-side", "title": "Side", "cardIds": []})
+        (await client.patch(f"/api/boards/{board_id}", json=board)).raise_for_status()
+        col_id = board["columns"][0]["id"]
+
+        async def ops_move():
+            b = (await client.get(f"/api/boards/{board_id}")).json()
+            last = b["columns"][0]["cardIds"][-1]
+            r = await client.post(
+                f"/api/boards/{board_id}/ops",
+                json={"ops": [{"op": "move_card", "card_id": last, "column_id": col_id, "index": 0}]},
+            )
+            r.raise_for_status()
+
+        async def patch_move():
+            b = (await client.get(f"/api/boards/{board_id}")).json()
+            ids = b["columns"][0]["cardIds"]
+            ids.insert(0, ids.pop())
+            r = await client.patch(f"/api/boards/{board_id}", json=b)
+            r.raise_for_status()
+
+        for label, fn in (("ops  ", ops_move), ("patch", patch_move)):
+            before = await _positions(maker)
+            samples = await timed(fn, repeat)
+            after = await _positions(maker)
+            rewritten = sum(1 for cid in after if before.get(cid) != after[cid])
+            print(f"column={length:>6}  {label}  {summarize(samples)}  rows rewritten over {repeat} moves={rewritten}")
+    await engine.dispose()
+
+
+async def main(lengths: list[int], repeat: int) -> None:
+    for n in lengths:
+        await bench_length(n, repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lengths", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.lengths, args.repeat))
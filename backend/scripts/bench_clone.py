@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Benchmark POST /boards/{id}/clone against copying a board client-side (GET, create, PATCH).
+
+    uv run python scripts/bench_clone.py --cards 10000
+"""
+import argparse
+import asyncio
+
+from bench_common import api_client, make_board, make_engine, summarize, timed  # also puts app/ on sys.path
+
+
+async def main(n_cards: int, repeat: int) -> None:
+    engine, maker = await make_engine()
+    async with api_client(maker) as client:
+        board_id = (await client.post("/api/boards", json={"title": "Bench"})).json()["id"]
+        (await client.patch(f"/api/boards/{board_id}", json=make_board(n_cards))).raise_for_status()
+
+        async def client_side():
+            board = (await client.get(f"/api/boards/{board_id}")).json()
+            copy_id = (await client.post("/api/boards", json={"title": "Copy", "template": "empty"})).json()["id"]
+            # Ids are global, so a client-side copy has to rename every column and card
+            suffix = copy_id[:8]
+            columns = [
+                {"id": f"{col['id']}-{suffix}", "title": col["title"], "cardIds": [f"{c}-{suffix}" for c in col["cardIds"]]}
+                for col in board["columns"]
+            ]
+            cards = {f"{c}-{suffix}": {**card, "id": f"{c}-{suffix}"} for c, card in board["cards"].items()}
+            (await client.patch(f"/api/boards/{copy_id}", json={"columns": columns, "cards": cards})).raise_for_status()
+
+        async def server_side():
+            (await client.post(f"/api/boards/{board_id}/clone")).raise_for_status()
+
+        print(f"cards={n_cards}")
+        print(f"  {'GET + PATCH':<12} {summarize(await timed(client_side, repeat))}")
+        print(f"  {'clone':<12} {summarize(await timed(server_side, repeat))}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.cards, args.repeat))
@@ -0,0 +1,87 @@
+"""Shared helpers for the standalone benchmark scripts in this directory."""
+import os
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.auth.permissions import issue_token
+from app.database import Base, get_session, seed_db, set_sqlite_pragma
+from app.main import app
+
+
+async def make_engine(url: str = "sqlite+aiosqlite:///:memory:"):
+    engine = create_async_engine(url, echo=False)
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragma)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with maker() as session:
+        await seed_db(session)
+    return engine, maker
+
+
+@asynccontextmanager
+async def api_client(maker):
+    """httpx client talking to the ASGI app in-process, bound to the given session maker."""
+
+    async def override_get_session():
+        async with maker() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = override_get_session
+    token = await issue_token("user-1", "user")
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://bench",
+            headers={"Authorization": f"Bearer {token}"},
+        ) as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+
+
+def make_board(n_cards: int, n_columns: int = 5, prefix: str = "bench") -> dict:
+    """BoardData-shaped dict with n_cards spread round-robin across n_columns."""
+    columns = [
+        {"id": f"{prefix}-col-{i}", "title": f"Column {i}", "cardIds": []}
+        for i in range(n_columns)
+    ]
+    cards = {}
+    for i in range(n_cards):
+        card_id = f"{prefix}-card-{i}"
+        columns[i % n_columns]["cardIds"].append(card_id)
+        cards[card_id] = {"id": card_id, "title": f"Card {i}", "details": f"Details for card {i}"}
+    return {"columns": columns, "cards": cards}
+
+
+async def timed(fn, repeat: int) -> list[float]:
+    """Run the async callable `repeat` times and return wall-clock latencies in ms."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def summarize(samples: list[float]) -> str:
+    return (
+        f"median={statistics.median(samples):8.2f}ms  "
+        f"p95={percentile(samples, 95):8.2f}ms  "
+        f"p99={percentile(samples, 99):8.2f}ms"
+    )
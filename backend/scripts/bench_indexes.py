@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark the board read and membership queries with and without indexes.
+
+Builds a file database with --boards boards and --cards cards (spread over
+five columns per board), then for each phase prints EXPLAIN QUERY PLAN for
+the hot queries and the latency of GET /api/boards and GET /api/boards/{id}.
+
+    uv run python scripts/bench_indexes.py --boards 10000 --cards 1000000
+"""
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import tempfile
+
+from sqlalchemy.dialects import sqlite as sqlite_dialect
+from sqlalchemy.schema import CreateIndex
+
+from bench_common import api_client, make_engine, summarize, timed  # also puts app/ on sys.path
+from app.database import Base
+
+HOT_QUERIES = {
+    "columns by board": "SELECT id FROM kanban_columns WHERE board_id = 'b-1' ORDER BY position",
+    "cards by column": "SELECT id FROM kanban_cards WHERE column_id IN ('b-1-c0', 'b-1-c1') ORDER BY position",
+    "boards by member": (
+        "SELECT boards.id FROM boards JOIN board_members ON boards.id = board_members.board_id "
+        "WHERE board_members.user_id = 'user-1' ORDER BY boards.title"
+    ),
+}
+MEMBER_BOARDS = 25  # boards user-1 belongs to, so GET /api/boards returns a realistic list
+
+
+def _indexes():
+    return [index for table in Base.metadata.sorted_tables for index in table.indexes]
+
+
+def populate(path: str, n_boards: int, n_cards: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    users = [(f"u-{i}", f"bench-user-{i}", "x") for i in range(1000)]
+    conn.executemany("INSERT INTO users (id, username, password) VALUES (?, ?, ?)", users)
+    member_boards = set(rng.sample(range(n_boards), min(MEMBER_BOARDS, n_boards)))
+    boards, members, columns = [], [], []
+    for b in range(n_boards):
+        owner = rng.choice(users)[0]
+        boards.append((f"b-{b}", f"Board {b}", owner, 0))
+        members.extend({(f"b-{b}", owner), (f"b-{b}", rng.choice(users)[0])})
+        if b in member_boards:
+            members.append((f"b-{b}", "user-1"))
+        columns.extend((f"b-{b}-c{c}", f"Column {c}", (c + 1) * 1024, f"b-{b}") for c in range(5))
+    conn.executemany("INSERT INTO boards (id, title, owner_id, version) VALUES (?, ?, ?, ?)", boards)
+    conn.executemany("INSERT OR IGNORE INTO board_members (board_id, user_id) VALUES (?, ?)", members)
+    conn.executemany("INSERT INTO kanban_columns (id, title, position, board_id) VALUES (?, ?, ?, ?)", columns)
+
+    def cards():
+        for i in range(n_cards):
+            column = rng.randrange(len(columns))
+            yield (f"k-{i}", f"Card {i}", "details", columns[column][0], i * 1024, rng.choice(users)[0], rng.choice(users)[0])
+
+    conn.executemany(
+        "INSERT INTO kanban_cards (id, title, details, column_id, position, created_by_id, assigned_to_id) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        cards(),
+    )
+    conn.commit()
+    conn.close()
+    return [f"b-{b}" for b in sorted(member_boards)]
+
+
+def set_indexes(path: str, enabled: bool) -> None:
+    conn = sqlite3.connect(path)
+    for index in _indexes():
+        if enabled:
+            conn.execute(str(CreateIndex(index, if_not_exists=True).compile(dialect=sqlite_dialect.dialect())))
+        else:
+            conn.execute(f"DROP INDEX IF EXISTS {index.name}")
+    conn.execute("ANALYZE")
+    conn.commit()
+    for label, sql in HOT_QUERIES.items():
+        plan = "; ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}"))
+        print(f"  {label:<17} {plan}")
+    conn.close()
+
+
+async def main(n_boards: int, n_cards: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        engine, maker = await make_engine(f"sqlite+aiosqlite:///{path}")
+        board_ids = populate(path, n_boards, n_cards)
+        print(f"boards={n_boards} cards={n_cards} (~{n_cards // max(n_boards, 1)} per board)")
+        for enabled in (False, True):
+            print("with indexes" if enabled else "without indexes")
+            set_indexes(path, enabled)
+            rng = random.Random(1)
+            async with api_client(maker) as client:
+                list_samples = await timed(lambda: client.get("/api/boards"), repeat)
+                read_samples = await timed(lambda: client.get(f"/api/boards/{rng.choice(board_ids)}"), repeat)
+            print(f"  GET /api/boards       {summarize(list_samples)}")
+            print(f"  GET /api/boards/{{id}}  {summarize(read_samples)}")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--boards", type=int, default=10000)
+    parser.add_argument("--cards", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.boards, args.cards, args.repeat))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Benchmark board reads during a burst of logins.
+
+Fires --logins concurrent POST /api/auth/login requests while a reader keeps
+issuing GET /api/boards/board-1, once with scrypt running inline on the event
+loop and once offloaded to the password hashing pool. Reports login throughput
+and board read latency.
+
+    uv run python scripts/bench_login_storm.py --logins 200 --concurrency 50
+"""
+import argparse
+import asyncio
+import time
+
+from bench_common import api_client, make_engine, summarize  # also puts app/ on sys.path
+from app.auth import passwords
+
+_pooled_offload = passwords._offload
+
+
+async def _inline_offload(fn, *args):
+    return fn(*args)
+
+
+async def bench_mode(label: str, logins: int, concurrency: int) -> None:
+    passwords._offload = _inline_offload if label == "inline" else _pooled_offload
+    engine, maker = await make_engine()
+    async with api_client(maker) as client:
+        reads: list[float] = []
+        done = asyncio.Event()
+
+        async def reader():
+            while not done.is_set():
+                start = time.perf_counter()
+                (await client.get("/api/boards/board-1")).raise_for_status()
+                reads.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(0.005)
+
+        gate = asyncio.Semaphore(concurrency)
+
+        async def login():
+            async with gate:
+                resp = await client.post("/api/auth/login", json={"username": "user", "password": "password"})
+                resp.raise_for_status()
+
+        reader_task = asyncio.create_task(reader())
+        await asyncio.sleep(0.05)
+        start = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(logins)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await reader_task
+    await engine.dispose()
+    print(f"{label:<7} logins/s={logins / elapsed:7.1f}  board reads (n={len(reads):>4})  {summarize(reads)}")
+
+
+async def main(logins: int, concurrency: int) -> None:
+    for label in ("inline", "pooled"):
+        await bench_mode(label, logins, concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.concurrency))
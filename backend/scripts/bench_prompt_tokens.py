@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Report AI system-prompt size for boards of increasing size.
+
+Compares the old JSON board embedding with the compact encoding used by
+app.ai. Token counts use tiktoken's o200k_base encoding when it is installed
+and fall back to a 4-characters-per-token estimate otherwise.
+
+    uv run python scripts/bench_prompt_tokens.py --sizes 10 100 1000 10000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.ai import _build_messages
+from app.prompt import encode_board
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("o200k_base")
+
+    def count_tokens(text: str) -> int:
+        return len(_encoding.encode(text))
+
+    TOKENIZER = "tiktoken o200k_base"
+except ImportError:
+    def count_tokens(text: str) -> int:
+        return len(text) // 4
+
+    TOKENIZER = "chars/4 estimate"
+
+WORDS = "roadmap customer signal analytics dashboard review release onboarding sprint design copy QA".split()
+
+
+def make_board(n_cards: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    titles = ["Backlog", "Discovery", "In Progress", "Review", "Done"]
+    columns = [{"id": f"col-{i}-{rng.getrandbits(64):016x}", "title": t, "cardIds": []} for i, t in enumerate(titles)]
+    cards = {}
+    for i in range(n_cards):
+        card_id = f"card-{rng.getrandbits(128):032x}"
+        # Most history piles up in Done, like a real long-lived board
+        column = columns[-1] if rng.random() < 0.6 else rng.choice(columns[:-1])
+        column["cardIds"].append(card_id)
+        cards[card_id] = {
+            "id": card_id,
+            "title": " ".join(rng.choices(WORDS, k=4)).capitalize(),
+            "details": " ".join(rng.choices(WORDS, k=rng.randint(5, 60))),
+            "created_by": "user",
+            "assigned_to": rng.choice([None, "alice", "bob"]),
+        }
+    return {"columns": columns, "cards": cards}
+
+
+def legacy_prompt(board: dict) -> str:
+    return f"Board: {json.dumps(board)}"
+
+
+def main(sizes: list[int]) -> None:
+    print(f"tokenizer: {TOKENIZER}")
+    print(f"{'cards':>7} {'json tokens':>12} {'compact tokens':>15} {'ratio':>7} {'cards shown':>12}")
+    for n in sizes:
+        board = make_board(n)
+        prompt = encode_board(board, query="what is blocking the analytics dashboard release?")
+        system = _build_messages(prompt, [])[0]["content"]
+        legacy = count_tokens(legacy_prompt(board))
+        compact = count_tokens(system)
+        shown = n - len(prompt.hidden_card_ids)
+        print(f"{n:>7} {legacy:>12} {compact:>15} {legacy / compact:>6.1f}x {shown:>12}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    args = parser.parse_args()
+    main(args.sizes)
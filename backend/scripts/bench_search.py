@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark GET /api/search (FTS5) against a LIKE scan of the same boards.
+
+Builds a file database with --cards cards over --boards boards, with titles
+and details drawn from a Zipf-like vocabulary, then times rare, common,
+multi-word and prefix queries with user-1 a member of each of the
+--member-boards counts in turn. LIKE scans only the member boards, so it
+is competitive for users on few boards; FTS cost depends on how many cards
+match, not on how many the user can see.
+
+    uv run python scripts/bench_search.py --boards 10000 --cards 1000000 --member-boards 25 1000 10000
+"""
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from bench_common import api_client, make_engine, summarize, timed  # also puts app/ on sys.path
+
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "ta", "vi", "so", "pe", "da", "gu", "fi", "ho", "be", "zo", "xa"]
+VOCABULARY = sorted({a + b + c for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES})
+WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+LIKE_SQL = """
+SELECT kanban_cards.id FROM kanban_cards
+JOIN kanban_columns ON kanban_columns.id = kanban_cards.column_id
+JOIN board_members ON board_members.board_id = kanban_columns.board_id AND board_members.user_id = 'user-1'
+WHERE {where}
+"""  # no ranking without FTS, so every match has to be collected before the best 20 can be picked
+
+
+def populate(path: str, n_boards: int, n_cards: int, seed: int = 0) -> float:
+    """Fill the database and return how long the FTS rebuild took, in seconds."""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    boards = [(f"b-{b}", f"Board {b}", "user-2", 0) for b in range(n_boards)]
+    conn.executemany("INSERT INTO boards (id, title, owner_id, version) VALUES (?, ?, ?, ?)", boards)
+    columns = [(f"b-{b}-c{c}", f"Column {c}", (c + 1) * 1024, f"b-{b}") for b in range(n_boards) for c in range(5)]
+    conn.executemany("INSERT INTO kanban_columns (id, title, position, board_id) VALUES (?, ?, ?, ?)", columns)
+
+    def words(k):
+        return " ".join(rng.choices(VOCABULARY, WEIGHTS, k=k))
+
+    def cards():
+        for i in range(n_cards):
+            yield (f"k-{i}", words(4), words(16), columns[rng.randrange(len(columns))][0], i * 1024)
+
+    # Bulk load without the sync triggers, then build the index in one pass
+    triggers = conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'kanban_cards_fts_%'").fetchall()
+    for name, _ in triggers:
+        conn.execute(f"DROP TRIGGER {name}")
+    conn.executemany(
+        "INSERT INTO kanban_cards (id, title, details, column_id, position, updated_at) VALUES (?, ?, ?, ?, ?, 0)",
+        cards(),
+    )
+    start = time.perf_counter()
+    conn.execute("INSERT INTO kanban_cards_fts (kanban_cards_fts) VALUES ('rebuild')")
+    rebuild = time.perf_counter() - start
+    for _, sql in triggers:
+        conn.execute(sql)
+    conn.execute("ANALYZE")
+    conn.commit()
+    conn.close()
+    return rebuild
+
+
+def set_membership(path: str, n_boards: int, member_boards: int) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute("DELETE FROM board_members WHERE user_id = 'user-1' AND board_id != 'board-1'")
+    boards = random.Random(1).sample(range(n_boards), min(member_boards, n_boards))
+    conn.executemany("INSERT INTO board_members (board_id, user_id) VALUES (?, 'user-1')", [(f"b-{b}",) for b in boards])
+    conn.commit()
+    conn.close()
+
+
+async def main(n_boards: int, n_cards: int, member_boards: list[int], repeat: int) -> None:
+    queries = {
+        "rare word": VOCABULARY[len(VOCABULARY) // 2],
+        "common word": VOCABULARY[0],
+        "two words": f"{VOCABULARY[3]} {VOCABULARY[40]}",
+        "prefix": VOCABULARY[200][:4],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        engine, maker = await make_engine(f"sqlite+aiosqlite:///{path}")
+        rebuild = populate(path, n_boards, n_cards)
+        print(f"boards={n_boards} cards={n_cards}; FTS rebuild {rebuild:.1f}s")
+        conn = sqlite3.connect(path)
+        async with api_client(maker) as client:
+            for count in member_boards:
+                set_membership(path, n_boards, count)
+                print(f"member of {count} boards")
+                for label, q in queries.items():
+                    fts = await timed(lambda: client.get("/api/search", params={"q": q}), repeat)
+                    where = " AND ".join(
+                        f"(kanban_cards.title LIKE '%{w}%' OR kanban_cards.details LIKE '%{w}%')" for w in q.split()
+                    )
+
+                    async def like():
+                        conn.execute(LIKE_SQL.format(where=where)).fetchall()
+
+                    print(f"  {label:<12} FTS  {summarize(fts)}")
+                    print(f"  {'':<12} LIKE {summarize(await timed(like, max(3, repeat // 5)))}")
+        conn.close()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--boards", type=int, default=10000)
+    parser.add_argument("--cards", type=int, default=1000000)
+    parser.add_argument("--member-boards", type=int, nargs="+", default=[25, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.boards, args.cards, args.member_boards, args.repeat))
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Benchmark require_auth token lookups for each session backend.
+
+Fills each store with N live sessions, then times require_auth on random
+tokens. The "signed" row uses AUTH_TOKEN_MODE=signed, which verifies an HMAC
+instead of looking the token up. The Redis backend uses FakeRedis unless --redis-url points at a
+server. SQLite runs against a file database so it pays real I/O costs.
+
+    uv run python scripts/bench_sessions.py --sessions 1000 10000 --lookups 2000
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+
+from bench_common import make_engine, summarize, timed  # also puts app/ on sys.path
+from app import config
+from app.auth import permissions
+from app.auth.sessions import FakeRedis, MemorySessionStore, RedisSessionStore, SqliteSessionStore, build_session_store
+
+
+async def bench_store(label: str, store, n_sessions: int, lookups: int, token_mode: str = "session") -> None:
+    permissions.set_session_store(store)
+    config.AUTH_TOKEN_MODE = token_mode
+    tokens = [await permissions.issue_token("user-1", "user") for _ in range(n_sessions)]
+    rng = random.Random(0)
+
+    async def lookup():
+        await permissions.require_auth(f"Bearer {rng.choice(tokens)}")
+
+    samples = await timed(lookup, lookups)
+    print(f"sessions={n_sessions:>6}  {label:<7} {summarize(samples)}")
+
+
+async def main(sizes: list[int], lookups: int, redis_url: str) -> None:
+    for n in sizes:
+        await bench_store("memory", MemorySessionStore(), n, lookups)
+        with tempfile.TemporaryDirectory() as tmp:
+            engine, maker = await make_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+            await bench_store("sqlite", SqliteSessionStore(maker), n, lookups)
+            await engine.dispose()
+        redis_store = build_session_store("redis", redis_url) if redis_url else RedisSessionStore(FakeRedis())
+        await bench_store("redis", redis_store, n, lookups)
+        await bench_store("signed", MemorySessionStore(), n, lookups, token_mode="signed")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--redis-url", default="")
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions, args.lookups, args.redis_url))
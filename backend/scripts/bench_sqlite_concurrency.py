@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark board reads while another process keeps writing.
+
+Runs --readers concurrent GET /api/boards/board-1 loops against a file
+database while a separate writer process (standing in for another uvicorn
+worker) repeatedly rewrites every card of a --cards card board in one
+transaction. Runs once with the old rollback-journal settings and once with
+the WAL profile from app.config, and reports read throughput, read latency
+and how many write transactions committed.
+
+    uv run python scripts/bench_sqlite_concurrency.py --readers 8 --seconds 5
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import time
+
+from bench_common import api_client, make_board, make_engine, summarize  # also puts app/ on sys.path
+from app import config
+
+PROFILES = {
+    "rollback journal": {
+        "SQLITE_JOURNAL_MODE": "DELETE",
+        "SQLITE_SYNCHRONOUS": "FULL",
+        "SQLITE_MMAP_SIZE": 0,
+        "SQLITE_CACHE_SIZE": -2000,
+        "SQLITE_TEMP_STORE": "DEFAULT",
+    },
+    "wal (app.config)": {},
+}
+
+
+def _writer(path: str, pragmas: dict, board_id: str, seconds: float, commits) -> None:
+    conn = sqlite3.connect(path, timeout=config.SQLITE_BUSY_TIMEOUT_MS / 1000, isolation_level=None)
+    conn.execute(f"PRAGMA journal_mode={pragmas['SQLITE_JOURNAL_MODE']}")
+    conn.execute(f"PRAGMA synchronous={pragmas['SQLITE_SYNCHRONOUS']}")
+    deadline = time.perf_counter() + seconds
+    rev = 0
+    while time.perf_counter() < deadline:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(
+            "UPDATE kanban_cards SET details = ? WHERE column_id IN (SELECT id FROM kanban_columns WHERE board_id = ?)",
+            (f"rev {rev}", board_id),
+        )
+        conn.execute("COMMIT")
+        rev += 1
+    commits.value = rev
+    conn.close()
+
+
+async def bench_profile(label: str, overrides: dict, readers: int, seconds: float, n_cards: int) -> None:
+    saved = {key: getattr(config, key) for key in overrides}
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    pragmas = {key: getattr(config, key) for key in ("SQLITE_JOURNAL_MODE", "SQLITE_SYNCHRONOUS")}
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.db")
+            engine, maker = await make_engine(f"sqlite+aiosqlite:///{path}")
+            async with api_client(maker) as client:
+                board_id = (await client.post("/api/boards", json={"title": "Write target"})).json()["id"]
+                (await client.patch(f"/api/boards/{board_id}", json=make_board(n_cards))).raise_for_status()
+
+                commits = multiprocessing.Value("i", 0)
+                writer = multiprocessing.Process(target=_writer, args=(path, pragmas, board_id, seconds, commits))
+                writer.start()
+                deadline = time.perf_counter() + seconds
+                reads: list[float] = []
+
+                async def reader():
+                    while time.perf_counter() < deadline:
+                        start = time.perf_counter()
+                        (await client.get("/api/boards/board-1")).raise_for_status()
+                        reads.append((time.perf_counter() - start) * 1000)
+
+                await asyncio.gather(*(reader() for _ in range(readers)))
+                await asyncio.get_running_loop().run_in_executor(None, writer.join)
+            await engine.dispose()
+    finally:
+        for key, value in saved.items():
+            setattr(config, key, value)
+    print(f"{label:<17} reads/s={len(reads) / seconds:7.1f}  writer commits={commits.value:>5}  {summarize(reads)}")
+
+
+async def main(readers: int, seconds: float, n_cards: int) -> None:
+    for label, overrides in PROFILES.items():
+        await bench_profile(label, overrides, readers, seconds, n_cards)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--cards", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.readers, args.seconds, args.cards))
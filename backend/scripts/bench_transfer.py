@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark NDJSON board export/import against the whole-board GET and PATCH they replace for bulk moves.
+
+Calls the model functions directly on a file database (the ASGI test
+transport buffers whole responses, which would hide the difference) and
+reports wall time and, from a second traced run, peak Python heap.
+
+    uv run python scripts/bench_transfer.py --cards 200000
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+
+from bench_common import make_board, make_engine  # also puts app/ on sys.path
+from app.models.board import BoardData, board_read_query, board_to_db, rows_to_board_json
+from app.models.transfer import export_board, import_board
+
+
+async def measure(fn):
+    """(result, seconds, peak MiB) for fn(), run once untraced for the time and once under tracemalloc."""
+    start = time.perf_counter()
+    result = await fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    await fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+
+async def main(n_cards: int, export_batch: int, import_batch: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, maker = await make_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        board = BoardData.model_validate(make_board(n_cards))
+        export_path = os.path.join(tmp, "board.ndjson")
+        print(f"cards={n_cards} export_batch={export_batch} import_batch={import_batch}")
+
+        async def patch():
+            async with maker() as session:
+                await board_to_db(session, "board-1", board)
+                await session.commit()
+
+        _, elapsed, peak = await measure(patch)
+        print(f"  {'PATCH whole board':<20} {elapsed:6.2f}s  peak {peak:7.1f} MiB")
+
+        async def full_read():
+            async with maker() as session:
+                return rows_to_board_json((await session.execute(board_read_query("board-1", "user-1"))).all())
+
+        body, elapsed, peak = await measure(full_read)
+        print(f"  {'GET whole board':<20} {elapsed:6.2f}s  peak {peak:7.1f} MiB  ({len(body) / 2**20:.1f} MiB JSON)")
+        del body
+
+        async def export():
+            async with maker() as session:
+                with open(export_path, "wb") as out:
+                    async for chunk in export_board(session, "board-1", export_batch):
+                        out.write(chunk)
+
+        _, elapsed, peak = await measure(export)
+        size = os.path.getsize(export_path) / 2**20
+        print(f"  {'NDJSON export':<20} {elapsed:6.2f}s  peak {peak:7.1f} MiB  ({size:.1f} MiB NDJSON)")
+
+        async def chunks():
+            with open(export_path, "rb") as src:
+                while chunk := src.read(64 * 1024):
+                    yield chunk
+
+        async def import_():
+            async with maker() as session:
+                return await import_board(session, chunks(), "user-1", import_batch, new_ids=True)
+
+        result, elapsed, peak = await measure(import_)
+        print(f"  {'NDJSON import':<20} {elapsed:6.2f}s  peak {peak:7.1f} MiB  ({result.cards} cards)")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=200000)
+    parser.add_argument("--export-batch", type=int, default=1000)
+    parser.add_argument("--import-batch", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.cards, args.export_batch, args.import_batch))
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Load test: board reads while chats are in flight against a slow stub LLM.
+
+Starts a local OpenAI-compatible stub that answers /chat/completions after
+--llm-delay seconds (or streams the answer over that time when asked to),
+runs the API against a temporary SQLite file, and measures
+GET /api/boards/{id} latency with and without concurrent /api/chat traffic. With
+a non-blocking AI client the two p99 figures should be close. Finally it
+compares time-to-first-byte of /api/chat and /api/chat/stream.
+
+    uv run python scripts/load_test_chat.py --chats 8 --llm-delay 2
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+_tmpdir = tempfile.mkdtemp(prefix="agentic-pm-load-")
+STUB_PORT = int(os.getenv("STUB_LLM_PORT", "8765"))
+APP_PORT = int(os.getenv("LOAD_TEST_APP_PORT", "8766"))
+
+# Point the app at the stub and a throwaway database before it is imported
+os.environ["AI_BASE_URL"] = f"http://127.0.0.1:{STUB_PORT}/v1"
+os.environ["OPENROUTER_API_KEY"] = "stub-key"
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(_tmpdir, 'board.db')}"
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+from app.main import app
+from bench_common import summarize
+
+stub = FastAPI()
+LLM_DELAY = 2.0
+STUB_TOKENS = 20
+
+
+@stub.post("/v1/chat/completions")
+async def stub_completion(request: Request):
+    content = json.dumps({"message": " ".join(["stub"] * STUB_TOKENS), "operations": []})
+    if (await request.json()).get("stream"):
+        return StreamingResponse(_stub_stream(content), media_type="text/event-stream")
+    await asyncio.sleep(LLM_DELAY)
+    return {
+        "id": "stub",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": "stub",
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+    }
+
+
+async def _stub_stream(content: str):
+    piece = max(1, len(content) // STUB_TOKENS)
+    for start in range(0, len(content), piece):
+        await asyncio.sleep(LLM_DELAY / STUB_TOKENS)
+        chunk = {
+            "id": "stub",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": "stub",
+            "choices": [{"index": 0, "delta": {"content": content[start:start + piece]}, "finish_reason": None}],
+        }
+        yield f"data: {json.dumps(chunk)}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+def _serve_in_thread(asgi_app, port: int) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(asgi_app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return server
+        time.sleep(0.05)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+async def measure_reads(client: httpx.AsyncClient, duration: float) -> list[float]:
+    samples = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        (await client.get("/api/boards/board-1")).raise_for_status()
+        samples.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.01)
+    return samples
+
+
+async def chat_loop(client: httpx.AsyncClient, board: dict, stop: asyncio.Event, done: list[int]) -> None:
+    payload = {"messages": [{"role": "user", "content": "hi"}], "board": board, "board_id": "board-1"}
+    while not stop.is_set():
+        (await client.post("/api/chat", json=payload)).raise_for_status()
+        done.append(1)
+
+
+async def main(chats: int, duration: float) -> None:
+    base = f"http://127.0.0.1:{APP_PORT}"
+    async with httpx.AsyncClient(base_url=base, timeout=60) as client:
+        login = await client.post("/api/auth/login", json={"username": "user", "password": "password"})
+        client.headers["Authorization"] = f"Bearer {login.json()['token']}"
+        board = (await client.get("/api/boards/board-1")).json()
+
+        idle = await measure_reads(client, duration)
+        print(f"board reads, no chat traffic:        {summarize(idle)}")
+
+        stop = asyncio.Event()
+        done: list[int] = []
+        chatters = [asyncio.create_task(chat_loop(client, board, stop, done)) for _ in range(chats)]
+        await asyncio.sleep(0.2)
+        loaded = await measure_reads(client, duration)
+        stop.set()
+        await asyncio.gather(*chatters)
+        print(f"board reads, {chats:>3} chats in flight:    {summarize(loaded)}  (chats completed={len(done)})")
+
+        payload = {"messages": [{"role": "user", "content": "hi"}], "board": board, "board_id": "board-1"}
+        start = time.perf_counter()
+        (await client.post("/api/chat", json=payload)).raise_for_status()
+        print(f"/api/chat         time to first byte: {(time.perf_counter() - start) * 1000:8.2f}ms")
+        start = time.perf_counter()
+        first_token = None
+        async with client.stream("POST", "/api/chat/stream", json=payload) as resp:
+            async for line in resp.aiter_lines():
+                if line == "event: token" and first_token is None:
+                    first_token = (time.perf_counter() - start) * 1000
+        print(f"/api/chat/stream  time to first token: {first_token:7.2f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chats", type=int, default=8, help="concurrent chat clients")
+    parser.add_argument("--llm-delay", type=float, default=2.0, help="stub LLM response time in seconds")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds to sample board reads per phase")
+    args = parser.parse_args()
+    LLM_DELAY = args.llm_delay
+
+    _serve_in_thread(stub, STUB_PORT)
+    _serve_in_thread(app, APP_PORT)
+    asyncio.run(main(args.chats, args.duration))
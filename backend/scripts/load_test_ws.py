@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Load test: board change broadcast latency versus WebSocket subscriber count.
+
+Starts the API on a local port against a temporary SQLite file, opens N
+idle WebSocket subscriptions to board-1 for each --subscribers value, then
+posts --events board ops and measures, for every subscriber, the time from
+sending the ops request to receiving the board_changed event. The clients
+run in the same process as the server, so on small machines their own
+receive work is part of the figures.
+
+    uv run python scripts/load_test_ws.py --subscribers 10 100 1000 2000
+"""
+import argparse
+import asyncio
+import os
+import resource
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+_tmpdir = tempfile.mkdtemp(prefix="agentic-pm-ws-")
+APP_PORT = int(os.getenv("LOAD_TEST_APP_PORT", "8767"))
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(_tmpdir, 'board.db')}"
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+import uvicorn
+import websockets
+
+from app.main import app
+from bench_common import percentile, summarize
+
+
+def _serve_in_thread(asgi_app, port: int) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(asgi_app, host="127.0.0.1", port=port, log_level="warning", backlog=4096))
+    threading.Thread(target=server.run, daemon=True).start()
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return server
+        time.sleep(0.05)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+async def run_round(client: httpx.AsyncClient, token: str, n_subscribers: int, events: int) -> None:
+    url = f"ws://127.0.0.1:{APP_PORT}/api/boards/board-1/ws?token={token}"
+    sockets = []
+    for start in range(0, n_subscribers, 200):  # connect in batches to stay under the listen backlog
+        sockets += await asyncio.gather(*(websockets.connect(url, max_queue=None) for _ in range(start, min(n_subscribers, start + 200))))
+
+    async def arrival(ws) -> float:
+        await ws.recv()
+        return time.perf_counter()
+
+    latencies: list[float] = []
+    last_arrivals: list[float] = []
+    for i in range(events):
+        ops = {"ops": [{"op": "edit_card", "card_id": "card-1", "title": f"Load test {i}"}]}
+        recv = [asyncio.create_task(arrival(ws)) for ws in sockets]
+        sent = time.perf_counter()
+        (await client.post("/api/boards/board-1/ops", json=ops)).raise_for_status()
+        arrivals = [(t - sent) * 1000 for t in await asyncio.gather(*recv)]
+        latencies += arrivals
+        last_arrivals.append(max(arrivals))
+
+    await asyncio.gather(*(ws.close() for ws in sockets))
+    print(
+        f"subscribers={n_subscribers:>5}  delivery {summarize(latencies)}  "
+        f"last subscriber p50={percentile(last_arrivals, 50):8.2f}ms"
+    )
+
+
+async def main(counts: list[int], events: int) -> None:
+    base = f"http://127.0.0.1:{APP_PORT}"
+    async with httpx.AsyncClient(base_url=base, timeout=60) as client:
+        login = await client.post("/api/auth/login", json={"username": "user", "password": "password"})
+        token = login.json()["token"]
+        client.headers["Authorization"] = f"Bearer {token}"
+        for n in counts:
+            await run_round(client, token, n, events)
+            await asyncio.sleep(0.5)  # let the server finish closing the previous round
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[10, 100, 1000, 2000])
+    parser.add_argument("--events", type=int, default=20)
+    args = parser.parse_args()
+
+    # Client and server share this process, so each subscription costs two file descriptors
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, max(soft, 4 * max(args.subscribers) + 256)), hard))
+
+    _serve_in_thread(app, APP_PORT)
+    asyncio.run(main(args.subscribers, args.events))
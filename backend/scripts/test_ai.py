@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 """Standalone script to verify OpenRouter connectivity."""
+import asyncio
 import sys
 import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from app.ai import call_ai
+from app.models.board import ChatMessage
 
 def main():
     if not __import__("app.config", fromlist=["config"]).OPENROUTER_API_KEY:
@@ -13,7 +15,7 @@ def main():
         sys.exit(1)
 
     try:
-        result = call_ai(board={}, messages=[{"role": "user", "content": "What is 2+2?"}])
+        result = asyncio.run(call_ai(board={}, messages=[ChatMessage(role="user", content="What is 2+2?")]))
         print(result.get("message", str(result)))
         sys.exit(0)
     except Exception as e:
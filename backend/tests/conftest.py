@@ -3,6 +3,7 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
+from app.cache import board_access_cache, board_cache
 from app.main import app
 from app.database import get_session, Base, seed_db
 
@@ -34,13 +35,24 @@ def client(db_engine):
             yield session
 
     app.dependency_overrides[get_session] = override_get_session
+    # every test starts from a fresh database with the same board ids, versions and members
+    board_cache.clear()
+    board_access_cache.clear()
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
 
 
 @pytest.fixture
-def auth_headers(client):
-    resp = client.post("/api/auth/login", json={"username": "user", "password": "password"})
-    token = resp.json()["token"]
-    return {"Authorization": f"Bearer {token}"}
+def login(client):
+    """Log a seeded user in by username and return their auth headers."""
+    def _login(username):
+        resp = client.post("/api/auth/login", json={"username": username, "password": "password"})
+        token = resp.json()["token"]
+        return {"Authorization": f"Bearer {token}"}
+    return _login
+
+
+@pytest.fixture
+def auth_headers(login):
+    return login("user")
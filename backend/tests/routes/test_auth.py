@@ -52,3 +52,19 @@ def test_logout(client, auth_headers):
 def test_logout_requires_auth(client):
     resp = client.post("/api/auth/logout")
     assert resp.status_code == 401
+
+
+def test_login_rehashes_plaintext_password(client, db_engine):
+    """A password stored before hashing was introduced is upgraded on the next login."""
+    import asyncio
+    from sqlalchemy import text
+
+    async def _exec(sql):
+        async with db_engine.begin() as conn:
+            result = await conn.execute(text(sql))
+            return result.scalar() if result.returns_rows else None
+
+    asyncio.run(_exec("UPDATE users SET password = 'legacy' WHERE id = 'user-2'"))
+    resp = client.post("/api/auth/login", json={"username": "alice", "password": "legacy"})
+    assert resp.status_code == 200
+    assert asyncio.run(_exec("SELECT password FROM users WHERE id = 'user-2'")).startswith("scrypt$")
@@ -14,6 +14,33 @@ def test_get_board_after_login(client, auth_headers):
     assert len(data["cards"]) == 8
 
 
+def test_get_board_orders_columns_cards_and_usernames(client, auth_headers):
+    client.patch(f"/api/boards/{BOARD_ID}/cards/card-2/assignee", json={"username": "alice"}, headers=auth_headers)
+    data = client.get(f"/api/boards/{BOARD_ID}", headers=auth_headers).json()
+    assert [c["id"] for c in data["columns"]] == ["col-backlog", "col-discovery", "col-progress", "col-review", "col-done"]
+    assert data["columns"][0]["cardIds"] == ["card-1", "card-2"]
+    assert data["cards"]["card-2"]["assigned_to"] == "alice"
+    assert data["cards"]["card-2"]["created_by"] == "user"
+
+
+def test_get_board_not_found(client, auth_headers):
+    resp = client.get("/api/boards/no-such-board", headers=auth_headers)
+    assert resp.status_code == 404
+
+
+def test_get_board_as_non_member(client, auth_headers, login):
+    board_id = client.post("/api/boards", json={"title": "Private"}, headers=auth_headers).json()["id"]
+    resp = client.get(f"/api/boards/{board_id}", headers=login("bob"))
+    assert resp.status_code == 403
+
+
+def test_get_board_keeps_empty_columns(client, auth_headers):
+    board_id = client.post("/api/boards", json={"title": "Empty"}, headers=auth_headers).json()["id"]
+    data = client.get(f"/api/boards/{board_id}", headers=auth_headers).json()
+    assert [c["cardIds"] for c in data["columns"]] == [[]] * 5
+    assert data["cards"] == {}
+
+
 def test_patch_board_move_card(client, auth_headers):
     # Get current board
     board = client.get(f"/api/boards/{BOARD_ID}", headers=auth_headers).json()
@@ -119,10 +146,8 @@ def test_delete_board_as_owner(client, auth_headers):
     assert resp.status_code == 204
 
 
-def test_delete_board_as_non_owner(client):
-    # Login as alice
-    alice_resp = client.post("/api/auth/login", json={"username": "alice", "password": "password"})
-    alice_headers = {"Authorization": f"Bearer {alice_resp.json()['token']}"}
+def test_delete_board_as_non_owner(client, login):
+    alice_headers = login("alice")
 
     resp = client.delete(f"/api/boards/{BOARD_ID}", headers=alice_headers)
     assert resp.status_code == 403
@@ -161,9 +186,8 @@ def test_invite_nonexistent_user(client, auth_headers):
     assert resp.status_code == 404
 
 
-def test_non_owner_cannot_invite(client):
-    alice_resp = client.post("/api/auth/login", json={"username": "alice", "password": "password"})
-    alice_headers = {"Authorization": f"Bearer {alice_resp.json()['token']}"}
+def test_non_owner_cannot_invite(client, login):
+    alice_headers = login("alice")
 
     resp = client.post(
         f"/api/boards/{BOARD_ID}/members",
@@ -171,3 +195,56 @@ def test_non_owner_cannot_invite(client):
         headers=alice_headers,
     )
     assert resp.status_code == 403
+
+
+def test_patch_board_reorders_and_renames_columns(client, auth_headers):
+    board = client.get(f"/api/boards/{BOARD_ID}", headers=auth_headers).json()
+    board["columns"].reverse()
+    board["columns"][0]["title"] = "Shipped"
+
+    resp = client.patch(f"/api/boards/{BOARD_ID}", json=board, headers=auth_headers)
+    assert resp.status_code == 200
+    updated = resp.json()
+    assert [c["id"] for c in updated["columns"]] == [c["id"] for c in board["columns"]]
+    assert updated["columns"][0]["title"] == "Shipped"
+
+
+def test_patch_board_moves_card_out_of_deleted_column(client, auth_headers):
+    client.patch(f"/api/boards/{BOARD_ID}/cards/card-7/assignee", json={"username": "alice"}, headers=auth_headers)
+    board = client.get(f"/api/boards/{BOARD_ID}", headers=auth_headers).json()
+
+    # Drop col-done but keep card-7 by moving it to col-review
+    done = next(c for c in board["columns"] if c["id"] == "col-done")
+    review = next(c for c in board["columns"] if c["id"] == "col-review")
+    review["cardIds"].append("card-7")
+    board["columns"].remove(done)
+    del board["cards"]["card-8"]
+
+    resp = client.patch(f"/api/boards/{BOARD_ID}", json=board, headers=auth_headers)
+    assert resp.status_code == 200
+    updated = resp.json()
+    assert all(c["id"] != "col-done" for c in updated["columns"])
+    assert "card-8" not in updated["cards"]
+    assert updated["cards"]["card-7"]["assigned_to"] == "alice"
+    updated_review = next(c for c in updated["columns"] if c["id"] == "col-review")
+    assert updated_review["cardIds"] == ["card-6", "card-7"]
+
+
+def test_patch_board_cannot_take_another_boards_ids(client, auth_headers, login):
+    alice_headers = login("alice")
+    board_id = client.post("/api/boards", json={"title": "Alice"}, headers=alice_headers).json()["id"]
+    before = client.get(f"/api/boards/{BOARD_ID}", headers=auth_headers).json()
+
+    own = client.get(f"/api/boards/{board_id}", headers=alice_headers).json()
+    own["columns"][0]["cardIds"].append("card-1")
+    own["cards"]["card-1"] = {"id": "card-1", "title": "Mine now"}
+    resp = client.patch(f"/api/boards/{board_id}", json=own, headers=alice_headers)
+    assert resp.status_code == 409
+    assert resp.json()["detail"] == "Ids already used by another board: card-1"
+
+    own = client.get(f"/api/boards/{board_id}", headers=alice_headers).json()
+    own["columns"].append({"id": "col-done", "title": "Renamed", "cardIds": []})
+    assert client.patch(f"/api/boards/{board_id}", json=own, headers=alice_headers).status_code == 409
+
+    assert client.get(f"/api/boards/{BOARD_ID}", headers=auth_headers).json() == before
+    assert client.get(f"/api/boards/{board_id}", headers=alice_headers).json()["cards"] == {}
@@ -0,0 +1,39 @@
+from app.cache import board_access_cache
+
+
+def test_repeated_checks_hit_the_cache(client, auth_headers):
+    client.get("/api/boards/board-1/members", headers=auth_headers)
+    hits = board_access_cache.hits
+    client.get("/api/boards/board-1/members", headers=auth_headers)
+    assert board_access_cache.hits == hits + 1
+
+
+def test_invite_takes_effect_immediately(client, auth_headers, login):
+    board_id = client.post("/api/boards", json={"title": "Team"}, headers=auth_headers).json()["id"]
+    bob = login("bob")
+    assert client.get(f"/api/boards/{board_id}/members", headers=bob).status_code == 403  # cached as non-member
+    client.post(f"/api/boards/{board_id}/members", json={"username": "bob"}, headers=auth_headers)
+    assert client.get(f"/api/boards/{board_id}/members", headers=bob).status_code == 200
+
+
+def test_removal_takes_effect_immediately(client, auth_headers, login):
+    board_id = client.post("/api/boards", json={"title": "Team"}, headers=auth_headers).json()["id"]
+    client.post(f"/api/boards/{board_id}/members", json={"username": "bob"}, headers=auth_headers)
+    bob = login("bob")
+    assert client.get(f"/api/boards/{board_id}/members", headers=bob).status_code == 200
+    client.delete(f"/api/boards/{board_id}/members/bob", headers=auth_headers)
+    assert client.get(f"/api/boards/{board_id}/members", headers=bob).status_code == 403
+
+
+def test_deleted_board_is_not_served_from_cache(client, auth_headers):
+    board_id = client.post("/api/boards", json={"title": "Doomed"}, headers=auth_headers).json()["id"]
+    assert client.get(f"/api/boards/{board_id}/members", headers=auth_headers).status_code == 200
+    client.delete(f"/api/boards/{board_id}", headers=auth_headers)
+    assert client.get(f"/api/boards/{board_id}/members", headers=auth_headers).status_code == 404
+
+
+def test_member_is_not_owner(client, auth_headers, login):
+    board_id = client.post("/api/boards", json={"title": "Team"}, headers=auth_headers).json()["id"]
+    client.post(f"/api/boards/{board_id}/members", json={"username": "bob"}, headers=auth_headers)
+    resp = client.post(f"/api/boards/{board_id}/members", json={"username": "alice"}, headers=login("bob"))
+    assert resp.status_code == 403
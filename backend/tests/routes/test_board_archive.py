@@ -0,0 +1,140 @@
+import asyncio
+
+from sqlalchemy import text
+
+BOARD_ID = "board-1"
+
+
+def _archive(client, headers, **body):
+    return client.post(f"/api/boards/{BOARD_ID}/archive", json=body, headers=headers)
+
+
+def _board(client, headers):
+    return client.get(f"/api/boards/{BOARD_ID}", headers=headers).json()
+
+
+def test_archive_column_removes_cards_from_board(client, auth_headers):
+    resp = _archive(client, auth_headers, column_id="col-done")
+    assert resp.status_code == 200
+    assert resp.json() == {"version": 1, "count": 2}
+    board = _board(client, auth_headers)
+    done = next(col for col in board["columns"] if col["id"] == "col-done")
+    assert done["cardIds"] == []
+    assert "card-7" not in board["cards"]
+
+
+def test_archive_lists_archived_cards(client, auth_headers):
+    _archive(client, auth_headers, card_ids=["card-1"])
+    _archive(client, auth_headers, column_id="col-done")
+    page = client.get(f"/api/boards/{BOARD_ID}/archive", headers=auth_headers).json()
+    assert [card["id"] for card in page["cards"]][-1] == "card-1"
+    assert {card["id"] for card in page["cards"]} == {"card-1", "card-7", "card-8"}
+    card = next(card for card in page["cards"] if card["id"] == "card-7")
+    assert card["column_title"] == "Done"
+    assert card["created_by"] == "user"
+
+
+def test_archive_search_and_pagination(client, auth_headers):
+    _archive(client, auth_headers, column_id="col-backlog")
+    _archive(client, auth_headers, column_id="col-done")
+    found = client.get(f"/api/boards/{BOARD_ID}/archive", params={"q": "ONBOARDING"}, headers=auth_headers).json()
+    assert [card["id"] for card in found["cards"]] == ["card-8"]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 1, **({"after": cursor} if cursor else {})}
+        page = client.get(f"/api/boards/{BOARD_ID}/archive", params=params, headers=auth_headers).json()
+        seen += [card["id"] for card in page["cards"]]
+        if not (cursor := page["nextCursor"]):
+            break
+    assert sorted(seen) == ["card-1", "card-2", "card-7", "card-8"]
+
+
+def test_older_than_days_keeps_recent_cards(client, auth_headers, db_engine):
+    async def _age():
+        async with db_engine.begin() as conn:
+            await conn.execute(text("UPDATE kanban_cards SET updated_at = updated_at - 10 * 86400 WHERE id = 'card-7'"))
+
+    asyncio.run(_age())
+    resp = _archive(client, auth_headers, column_id="col-done", older_than_days=7)
+    assert resp.json()["count"] == 1
+    done = next(col for col in _board(client, auth_headers)["columns"] if col["id"] == "col-done")
+    assert done["cardIds"] == ["card-8"]
+
+
+def test_nothing_to_archive_leaves_version(client, auth_headers):
+    resp = _archive(client, auth_headers, card_ids=["no-such-card"])
+    assert resp.json() == {"version": 0, "count": 0}
+    assert client.get(f"/api/boards/{BOARD_ID}", headers=auth_headers).headers["etag"] == '"board-1-0"'
+
+
+def test_archive_requires_a_filter(client, auth_headers):
+    assert _archive(client, auth_headers).status_code == 400
+
+
+def test_archive_honours_if_match(client, auth_headers):
+    resp = client.post(
+        f"/api/boards/{BOARD_ID}/archive", json={"column_id": "col-done"},
+        headers={**auth_headers, "If-Match": '"board-1-5"'},
+    )
+    assert resp.status_code == 409
+    assert resp.json()["version"] == 0
+
+
+def test_restore_appends_to_original_column(client, auth_headers):
+    _archive(client, auth_headers, card_ids=["card-1"])
+    resp = client.post(f"/api/boards/{BOARD_ID}/archive/restore", json={"card_ids": ["card-1"]}, headers=auth_headers)
+    assert resp.json() == {"version": 2, "count": 1}
+    backlog = next(col for col in _board(client, auth_headers)["columns"] if col["id"] == "col-backlog")
+    assert backlog["cardIds"] == ["card-2", "card-1"]
+    assert client.get(f"/api/boards/{BOARD_ID}/archive", headers=auth_headers).json()["cards"] == []
+
+
+def test_restore_into_first_column_when_original_is_gone(client, auth_headers):
+    _archive(client, auth_headers, column_id="col-done")
+    client.post(
+        f"/api/boards/{BOARD_ID}/ops", json={"ops": [{"op": "delete_column", "column_id": "col-done"}]},
+        headers=auth_headers,
+    )
+    client.post(f"/api/boards/{BOARD_ID}/archive/restore", json={"card_ids": ["card-7", "card-8"]}, headers=auth_headers)
+    backlog = _board(client, auth_headers)["columns"][0]
+    assert backlog["cardIds"] == ["card-1", "card-2", "card-7", "card-8"]
+
+
+def test_archive_requires_membership(client, auth_headers, login):
+    board_id = client.post("/api/boards", json={"title": "Private"}, headers=auth_headers).json()["id"]
+    headers = login("bob")
+    assert client.get(f"/api/boards/{board_id}/archive", headers=headers).status_code == 403
+    assert client.post(f"/api/boards/{board_id}/archive", json={"card_ids": []}, headers=headers).status_code == 403
+
+
+def _add_card_elsewhere(client, headers, card_id):
+    board_id = client.post("/api/boards", json={"title": "Elsewhere"}, headers=headers).json()["id"]
+    column_id = client.get(f"/api/boards/{board_id}", headers=headers).json()["columns"][0]["id"]
+    op = {"op": "add_card", "column_id": column_id, "title": "Taken", "card_id": card_id}
+    assert client.post(f"/api/boards/{board_id}/ops", json={"ops": [op]}, headers=headers).status_code == 200
+    return board_id, column_id
+
+
+def test_restore_rejects_ids_taken_by_live_cards(client, auth_headers):
+    _archive(client, auth_headers, card_ids=["card-7", "card-8"])
+    _add_card_elsewhere(client, auth_headers, "card-8")
+    resp = client.post(
+        f"/api/boards/{BOARD_ID}/archive/restore", json={"card_ids": ["card-7", "card-8"]}, headers=auth_headers,
+    )
+    assert resp.status_code == 409
+    assert resp.json()["detail"] == "Cards already exist: card-8"
+    assert "card-7" not in _board(client, auth_headers)["cards"]
+    archived = client.get(f"/api/boards/{BOARD_ID}/archive", headers=auth_headers).json()["cards"]
+    assert {card["id"] for card in archived} == {"card-7", "card-8"}
+
+
+def test_archive_rejects_ids_archived_by_another_board(client, auth_headers):
+    _archive(client, auth_headers, card_ids=["card-8"])
+    other, column_id = _add_card_elsewhere(client, auth_headers, "card-8")
+    resp = client.post(f"/api/boards/{other}/archive", json={"card_ids": ["card-8"]}, headers=auth_headers)
+    assert resp.status_code == 409
+    other_board = client.get(f"/api/boards/{other}", headers=auth_headers).json()
+    assert other_board["cards"]["card-8"]["title"] == "Taken"
+    archived = client.get(f"/api/boards/{BOARD_ID}/archive", headers=auth_headers).json()["cards"]
+    assert [(card["id"], card["column_title"]) for card in archived] == [("card-8", "Done")]
@@ -0,0 +1,99 @@
+import asyncio
+
+from sqlalchemy import text
+
+BOARD_ID = "board-1"
+
+
+def _assign(client, headers, assignments, board_id=BOARD_ID, **extra):
+    body = {"assignments": [{"card_id": c, "username": u} for c, u in assignments], **extra}
+    return client.patch(f"/api/boards/{board_id}/cards/assignees", json=body, headers=headers)
+
+
+def _cards(client, headers, board_id=BOARD_ID):
+    return client.get(f"/api/boards/{board_id}", headers=headers).json()["cards"]
+
+
+def test_bulk_assign_sets_and_clears_assignees(client, auth_headers):
+    _assign(client, auth_headers, [("card-3", "bob")])
+    resp = _assign(client, auth_headers, [("card-1", "alice"), ("card-2", "bob"), ("card-3", None)])
+    assert resp.status_code == 200
+    result = resp.json()
+    assert result["version"] == 2
+    assert {card["id"]: card["assigned_to"] for card in result["cards"]} == {
+        "card-1": "alice", "card-2": "bob", "card-3": None,
+    }
+    assert result["cards"][0]["created_by"] == "user"
+
+    cards = _cards(client, auth_headers)
+    assert (cards["card-1"]["assigned_to"], cards["card-2"]["assigned_to"], cards["card-3"]["assigned_to"]) == (
+        "alice", "bob", None,
+    )
+    assert cards["card-4"]["assigned_to"] is None
+
+
+def test_bulk_assign_last_assignment_wins(client, auth_headers):
+    result = _assign(client, auth_headers, [("card-1", "alice"), ("card-1", "bob")]).json()
+    assert [(card["id"], card["assigned_to"]) for card in result["cards"]] == [("card-1", "bob")]
+
+
+def test_bulk_assign_is_all_or_nothing(client, auth_headers):
+    resp = _assign(client, auth_headers, [("card-1", "alice"), ("card-2", "nobody")])
+    assert resp.status_code == 404
+    assert resp.json()["detail"] == "User not found: nobody"
+    resp = _assign(client, auth_headers, [("card-1", "alice"), ("card-404", "bob")])
+    assert resp.status_code == 404
+    assert resp.json()["detail"] == "Card not found: card-404"
+    assert _cards(client, auth_headers)["card-1"]["assigned_to"] is None
+    assert client.get(f"/api/boards/{BOARD_ID}", headers=auth_headers).headers["etag"] == f'"{BOARD_ID}-0"'
+
+
+def test_bulk_assign_rejects_cards_from_other_boards(client, auth_headers):
+    board_id = client.post("/api/boards", json={"title": "Other"}, headers=auth_headers).json()["id"]
+    resp = _assign(client, auth_headers, [("card-1", "alice")], board_id=board_id)
+    assert resp.status_code == 404
+    # The single-card endpoint goes through the same check
+    resp = client.patch(f"/api/boards/{board_id}/cards/card-1/assignee", json={"username": "alice"}, headers=auth_headers)
+    assert resp.status_code == 404
+    assert _cards(client, auth_headers)["card-1"]["assigned_to"] is None
+
+
+def test_bulk_assign_checks_version(client, auth_headers):
+    resp = _assign(client, {"If-Match": f'"{BOARD_ID}-5"', **auth_headers}, [("card-1", "alice")])
+    assert resp.status_code == 409
+    resp = _assign(client, auth_headers, [("card-1", "alice")], expected_version=0)
+    assert resp.status_code == 200
+
+
+def test_bulk_assign_requires_assignments_and_membership(client, auth_headers, login):
+    assert _assign(client, auth_headers, []).status_code == 400
+    board_id = client.post("/api/boards", json={"title": "Private"}, headers=auth_headers).json()["id"]
+    resp = _assign(client, login("alice"), [("card-1", "alice")], board_id=board_id)
+    assert resp.status_code == 403
+
+
+def test_bulk_assign_splits_large_requests(client, auth_headers, db_engine, monkeypatch):
+    # Three bound parameters per card would put one UPDATE past SQLite's 32766-variable limit
+    card_ids = [f"card-bulk-{i}" for i in range(11000)]
+
+    async def _add_cards():
+        async with db_engine.begin() as conn:
+            await conn.execute(
+                text("INSERT INTO kanban_cards (id, title, column_id, position, updated_at) "
+                     "VALUES (:id, 'Bulk', 'col-backlog', :position, 0)"),
+                [{"id": card_id, "position": 10_000 + i} for i, card_id in enumerate(card_ids)],
+            )
+
+    asyncio.run(_add_cards())
+    resp = _assign(client, auth_headers, [(card_id, "alice") for card_id in card_ids])
+    assert resp.status_code == 200
+    assert len(resp.json()["cards"]) == len(card_ids)
+    cards = _cards(client, auth_headers)
+    assert {cards[card_id]["assigned_to"] for card_id in card_ids} == {"alice"}
+
+    # Smaller chunks give the same result, including which assignment wins for a repeated card
+    monkeypatch.setattr("app.models.assignment.ASSIGN_CHUNK_SIZE", 2)
+    result = _assign(client, auth_headers, [("card-1", "bob"), ("card-2", None), ("card-3", "alice"), ("card-1", "alice")]).json()
+    assert {card["id"]: card["assigned_to"] for card in result["cards"]} == {
+        "card-1": "alice", "card-2": None, "card-3": "alice",
+    }
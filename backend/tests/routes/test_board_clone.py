@@ -0,0 +1,94 @@
+import asyncio
+
+from sqlalchemy import text
+
+from app.cache import board_access_cache
+
+BOARD_ID = "board-1"
+
+
+def _board(client, headers, board_id):
+    return client.get(f"/api/boards/{board_id}", headers=headers).json()
+
+
+def test_list_templates(client, auth_headers):
+    templates = client.get("/api/board-templates", headers=auth_headers).json()
+    assert [t["id"] for t in templates] == ["default", "simple", "bugs", "empty"]
+    assert templates[0]["columns"][0] == "Backlog"
+
+
+def test_create_board_from_template(client, auth_headers):
+    board_id = client.post("/api/boards", json={"title": "Small", "template": "simple"}, headers=auth_headers).json()["id"]
+    assert [col["title"] for col in _board(client, auth_headers, board_id)["columns"]] == ["To Do", "Doing", "Done"]
+
+    board_id = client.post("/api/boards", json={"title": "Blank", "template": "empty"}, headers=auth_headers).json()["id"]
+    assert _board(client, auth_headers, board_id)["columns"] == []
+
+    resp = client.post("/api/boards", json={"title": "Nope", "template": "missing"}, headers=auth_headers)
+    assert resp.status_code == 400
+
+
+def test_clone_copies_columns_and_cards(client, auth_headers):
+    client.patch(f"/api/boards/{BOARD_ID}/cards/card-1/assignee", json={"username": "bob"}, headers=auth_headers)
+    source = _board(client, auth_headers, BOARD_ID)
+    resp = client.post(f"/api/boards/{BOARD_ID}/clone", headers=auth_headers)
+    assert resp.status_code == 201
+    clone = resp.json()
+    assert clone["title"] == "Main Board (copy)"
+    assert clone["owner_username"] == "user"
+
+    copy = _board(client, auth_headers, clone["id"])
+    assert [col["title"] for col in copy["columns"]] == [col["title"] for col in source["columns"]]
+    assert not {col["id"] for col in copy["columns"]} & {col["id"] for col in source["columns"]}
+
+    def titles(board):
+        return [[board["cards"][card_id]["title"] for card_id in col["cardIds"]] for col in board["columns"]]
+
+    assert titles(copy) == titles(source)
+    assert not set(copy["cards"]) & set(source["cards"])
+    first = copy["cards"][copy["columns"][0]["cardIds"][0]]
+    assert first["created_by"] == "user"
+    assert first["assigned_to"] is None
+
+    # The source is untouched and the copy is independent of it
+    assert _board(client, auth_headers, BOARD_ID) == source
+    members = client.get(f"/api/boards/{clone['id']}/members", headers=auth_headers).json()
+    assert [m["username"] for m in members] == ["user"]
+
+
+def test_clone_as_template_without_cards(client, auth_headers):
+    resp = client.post(
+        f"/api/boards/{BOARD_ID}/clone", json={"title": "Next sprint", "include_cards": False}, headers=auth_headers,
+    )
+    clone = resp.json()
+    assert clone["title"] == "Next sprint"
+    copy = _board(client, auth_headers, clone["id"])
+    assert len(copy["columns"]) == 5
+    assert copy["cards"] == {}
+
+
+def test_clone_requires_membership(client, auth_headers, login):
+    board_id = client.post("/api/boards", json={"title": "Private"}, headers=auth_headers).json()["id"]
+    assert client.post(f"/api/boards/{board_id}/clone", headers=login("alice")).status_code == 403
+    assert client.post("/api/boards/missing/clone", headers=auth_headers).status_code == 404
+
+
+def test_member_can_clone_into_own_board(client, auth_headers, login):
+    bob = login("bob")
+    clone = client.post(f"/api/boards/{BOARD_ID}/clone", headers=bob).json()
+    assert clone["owner_username"] == "bob"
+    assert len(_board(client, bob, clone["id"])["cards"]) == 8
+
+
+def test_clone_of_board_deleted_by_another_worker_is_404(client, auth_headers, db_engine):
+    assert _board(client, auth_headers, BOARD_ID)  # caches user-1's access to board-1
+
+    async def _delete_elsewhere():
+        async with db_engine.begin() as conn:
+            await conn.execute(text("DELETE FROM boards WHERE id = 'board-1'"))
+
+    asyncio.run(_delete_elsewhere())
+    resp = client.post(f"/api/boards/{BOARD_ID}/clone", headers=auth_headers)
+    assert resp.status_code == 404
+    assert resp.json()["detail"] == "Board not found"
+    assert board_access_cache.get((BOARD_ID, "user-1")) is None
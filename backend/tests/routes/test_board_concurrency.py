@@ -0,0 +1,127 @@
+import asyncio
+
+from sqlalchemy import text
+
+from app.cache import board_access_cache
+
+BOARD_ID = "board-1"
+
+
+def _get(client, headers):
+    return client.get(f"/api/boards/{BOARD_ID}", headers=headers)
+
+
+def test_patch_with_current_etag_succeeds(client, auth_headers):
+    resp = _get(client, auth_headers)
+    board = resp.json()
+    board["columns"][0]["title"] = "Mine"
+    patched = client.patch(
+        f"/api/boards/{BOARD_ID}", json=board, headers={**auth_headers, "If-Match": resp.headers["etag"]}
+    )
+    assert patched.status_code == 200
+    assert patched.headers["etag"] == '"board-1-1"'
+
+
+def test_patch_with_stale_etag_conflicts(client, auth_headers):
+    resp = _get(client, auth_headers)
+    stale_etag, board = resp.headers["etag"], resp.json()
+    board["columns"][0]["title"] = "First"
+    client.patch(f"/api/boards/{BOARD_ID}", json=board, headers=auth_headers)
+
+    board["columns"][0]["title"] = "Second"
+    conflict = client.patch(f"/api/boards/{BOARD_ID}", json=board, headers={**auth_headers, "If-Match": stale_etag})
+    assert conflict.status_code == 409
+    assert conflict.json()["version"] == 1
+    assert conflict.headers["etag"] == '"board-1-1"'
+    assert _get(client, auth_headers).json()["columns"][0]["title"] == "First"
+
+
+def test_patch_with_expected_version_query(client, auth_headers):
+    board = _get(client, auth_headers).json()
+    assert client.patch(f"/api/boards/{BOARD_ID}?expected_version=5", json=board, headers=auth_headers).status_code == 409
+    assert client.patch(f"/api/boards/{BOARD_ID}?expected_version=0", json=board, headers=auth_headers).status_code == 200
+
+
+def test_patch_with_foreign_etag_conflicts(client, auth_headers):
+    board = _get(client, auth_headers).json()
+    resp = client.patch(f"/api/boards/{BOARD_ID}", json=board, headers={**auth_headers, "If-Match": '"other-0"'})
+    assert resp.status_code == 409
+
+
+def test_patch_without_precondition_still_last_writer_wins(client, auth_headers):
+    board = _get(client, auth_headers).json()
+    assert client.patch(f"/api/boards/{BOARD_ID}", json=board, headers=auth_headers).status_code == 200
+    assert client.patch(f"/api/boards/{BOARD_ID}", json=board, headers=auth_headers).status_code == 200
+
+
+def test_ops_with_stale_expected_version_change_nothing(client, auth_headers):
+    edit = {"op": "edit_card", "card_id": "card-1", "title": "Changed"}
+    client.post(f"/api/boards/{BOARD_ID}/ops", json={"ops": [edit]}, headers=auth_headers)
+    resp = client.post(
+        f"/api/boards/{BOARD_ID}/ops",
+        json={"ops": [{**edit, "title": "Stale"}], "expected_version": 0},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 409
+    assert resp.json()["version"] == 1
+    assert _get(client, auth_headers).json()["cards"]["card-1"]["title"] == "Changed"
+
+
+def test_ops_with_if_match(client, auth_headers):
+    etag = _get(client, auth_headers).headers["etag"]
+    edit = {"op": "edit_card", "card_id": "card-1", "title": "Changed"}
+    resp = client.post(f"/api/boards/{BOARD_ID}/ops", json={"ops": [edit]}, headers={**auth_headers, "If-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["version"] == 1
+
+
+def test_chat_with_stale_board_version_leaves_board_alone(client, auth_headers, monkeypatch):
+    async def _fake_call_ai(board, messages):
+        return {"message": "Renamed", "operations": [{"op": "edit_card", "card_id": "card-1", "title": "AI"}]}
+
+    monkeypatch.setattr("app.routes.chat.call_ai", _fake_call_ai)
+    board = _get(client, auth_headers).json()
+    client.post(
+        f"/api/boards/{BOARD_ID}/ops", json={"ops": [{"op": "edit_card", "card_id": "card-1", "title": "Human"}]},
+        headers=auth_headers,
+    )
+    resp = client.post(
+        "/api/chat",
+        json={"messages": [{"role": "user", "content": "rename"}], "board": board, "board_id": BOARD_ID, "board_version": 0},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200
+    assert resp.json()["changes"] is None
+    assert "board changed" in resp.json()["message"]
+    assert _get(client, auth_headers).json()["cards"]["card-1"]["title"] == "Human"
+
+
+def test_write_to_board_deleted_by_another_worker_is_404(client, auth_headers, db_engine):
+    assert _get(client, auth_headers).status_code == 200  # caches user-1's access to board-1
+
+    async def _delete_elsewhere():
+        async with db_engine.begin() as conn:
+            await conn.execute(text("DELETE FROM boards WHERE id = 'board-1'"))
+
+    asyncio.run(_delete_elsewhere())
+    ops = {"ops": [{"op": "rename_column", "column_id": "col-backlog", "title": "Gone"}]}
+    resp = client.post(f"/api/boards/{BOARD_ID}/ops", json=ops, headers=auth_headers)
+    assert resp.status_code == 404
+    assert resp.json()["detail"] == "Board not found"
+    assert board_access_cache.get((BOARD_ID, "user-1")) is None
+    resp = client.patch(f"/api/boards/{BOARD_ID}/cards/card-1/assignee", json={"username": None}, headers=auth_headers)
+    assert resp.status_code == 404
+
+
+def test_delete_of_board_deleted_by_another_worker_is_404(client, auth_headers, db_engine):
+    assert _get(client, auth_headers).status_code == 200  # caches user-1's access to board-1
+
+    async def _delete_elsewhere():
+        async with db_engine.begin() as conn:
+            await conn.execute(text("DELETE FROM boards WHERE id = 'board-1'"))
+
+    asyncio.run(_delete_elsewhere())
+    resp = client.delete(f"/api/boards/{BOARD_ID}", headers=auth_headers)
+    assert resp.status_code == 404
+    assert resp.json()["detail"] == "Board not found"
+    assert board_access_cache.get((BOARD_ID, "user-1")) is None
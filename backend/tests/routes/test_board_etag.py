@@ -0,0 +1,71 @@
+from app.cache import board_cache
+
+BOARD_ID = "board-1"
+
+
+def _get(client, headers, etag=None):
+    if etag:
+        headers = {**headers, "If-None-Match": etag}
+    return client.get(f"/api/boards/{BOARD_ID}", headers=headers)
+
+
+def test_get_board_returns_etag(client, auth_headers):
+    resp = _get(client, auth_headers)
+    assert resp.status_code == 200
+    assert resp.headers["etag"] == '"board-1-0"'
+
+
+def test_matching_etag_returns_304_without_body(client, auth_headers):
+    etag = _get(client, auth_headers).headers["etag"]
+    resp = _get(client, auth_headers, etag)
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+
+
+def test_weak_and_listed_etags_match(client, auth_headers):
+    etag = _get(client, auth_headers).headers["etag"]
+    assert _get(client, auth_headers, f'"other", W/{etag}').status_code == 304
+
+
+def test_second_read_served_from_cache(client, auth_headers):
+    first = _get(client, auth_headers)
+    hits = board_cache.hits
+    second = _get(client, auth_headers)
+    assert board_cache.hits == hits + 1
+    assert second.content == first.content
+
+
+def test_assign_card_changes_etag(client, auth_headers):
+    etag = _get(client, auth_headers).headers["etag"]
+    client.patch(f"/api/boards/{BOARD_ID}/cards/card-1/assignee", json={"username": "alice"}, headers=auth_headers)
+    resp = _get(client, auth_headers, etag)
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
+    assert resp.json()["cards"]["card-1"]["assigned_to"] == "alice"
+
+
+def test_member_changes_bump_version(client, auth_headers):
+    board_id = client.post("/api/boards", json={"title": "Team"}, headers=auth_headers).json()["id"]
+    etag = client.get(f"/api/boards/{board_id}", headers=auth_headers).headers["etag"]
+    client.post(f"/api/boards/{board_id}/members", json={"username": "bob"}, headers=auth_headers)
+    invited = client.get(f"/api/boards/{board_id}", headers=auth_headers).headers["etag"]
+    client.delete(f"/api/boards/{board_id}/members/bob", headers=auth_headers)
+    removed = client.get(f"/api/boards/{board_id}", headers=auth_headers).headers["etag"]
+    assert len({etag, invited, removed}) == 3
+
+
+def test_patch_response_carries_new_etag(client, auth_headers):
+    etag = _get(client, auth_headers).headers["etag"]
+    board = _get(client, auth_headers).json()
+    board["columns"][0]["title"] = "Renamed"
+    resp = client.patch(f"/api/boards/{BOARD_ID}", json=board, headers=auth_headers)
+    assert resp.headers["etag"] != etag
+    assert _get(client, auth_headers, resp.headers["etag"]).status_code == 304
+
+
+def test_non_member_gets_403_even_with_etag(client, auth_headers, login):
+    board_id = client.post("/api/boards", json={"title": "Private"}, headers=auth_headers).json()["id"]
+    etag = client.get(f"/api/boards/{board_id}", headers=auth_headers).headers["etag"]
+    resp = client.get(f"/api/boards/{board_id}", headers={**login("bob"), "If-None-Match": etag})
+    assert resp.status_code == 403
@@ -0,0 +1,167 @@
+BOARD_ID = "board-1"
+
+
+def _ops(client, auth_headers, *ops):
+    return client.post(f"/api/boards/{BOARD_ID}/ops", json={"ops": list(ops)}, headers=auth_headers)
+
+
+def _column(board, col_id):
+    return next(c for c in board["columns"] if c["id"] == col_id)
+
+
+def test_ops_requires_auth(client):
+    resp = client.post(f"/api/boards/{BOARD_ID}/ops", json={"ops": []})
+    assert resp.status_code == 401
+
+
+def test_move_card_between_columns(client, auth_headers):
+    resp = _ops(client, auth_headers, {"op": "move_card", "card_id": "card-1", "column_id": "col-progress", "index": 0})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["version"] == 1
+    assert _column(data, "col-progress")["cardIds"] == ["card-1", "card-4", "card-5"]
+    assert _column(data, "col-backlog")["cardIds"] == ["card-2"]
+    assert data["column_order"] is None
+
+    board = client.get(f"/api/boards/{BOARD_ID}", headers=auth_headers).json()
+    assert _column(board, "col-progress")["cardIds"] == ["card-1", "card-4", "card-5"]
+
+
+def test_move_card_within_column(client, auth_headers):
+    resp = _ops(client, auth_headers, {"op": "move_card", "card_id": "card-7", "column_id": "col-done"})
+    assert resp.status_code == 200
+    assert _column(resp.json(), "col-done")["cardIds"] == ["card-8", "card-7"]
+
+
+def test_add_edit_and_delete_cards(client, auth_headers):
+    resp = _ops(
+        client, auth_headers,
+        {"op": "add_card", "card_id": "card-new", "column_id": "col-review", "title": "New", "index": 0},
+        {"op": "edit_card", "card_id": "card-6", "title": "QA pass"},
+        {"op": "delete_card", "card_id": "card-8"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["cards"]["card-new"]["created_by"] == "user"
+    assert data["cards"]["card-6"]["title"] == "QA pass"
+    assert data["cards"]["card-6"]["details"] == "Verify hover, focus, and loading states."
+    assert data["deleted_card_ids"] == ["card-8"]
+    assert _column(data, "col-review")["cardIds"] == ["card-new", "card-6"]
+    assert _column(data, "col-done")["cardIds"] == ["card-7"]
+
+
+def test_column_ops(client, auth_headers):
+    resp = _ops(
+        client, auth_headers,
+        {"op": "add_column", "column_id": "col-blocked", "title": "Blocked", "index": 1},
+        {"op": "rename_column", "column_id": "col-review", "title": "QA"},
+        {"op": "move_column", "column_id": "col-done", "index": 0},
+        {"op": "delete_column", "column_id": "col-discovery"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["column_order"] == ["col-done", "col-backlog", "col-blocked", "col-progress", "col-review"]
+    assert data["deleted_column_ids"] == ["col-discovery"]
+    assert data["deleted_card_ids"] == ["card-3"]
+    assert _column(data, "col-review")["title"] == "QA"
+
+    board = client.get(f"/api/boards/{BOARD_ID}", headers=auth_headers).json()
+    assert [c["id"] for c in board["columns"]] == data["column_order"]
+    assert "card-3" not in board["cards"]
+
+
+def test_version_increments_per_batch(client, auth_headers):
+    first = _ops(client, auth_headers, {"op": "edit_card", "card_id": "card-1", "title": "a"}).json()
+    second = _ops(client, auth_headers, {"op": "edit_card", "card_id": "card-1", "title": "b"}).json()
+    assert second["version"] == first["version"] + 1
+
+
+def test_unknown_card_rolls_back_batch(client, auth_headers):
+    resp = _ops(
+        client, auth_headers,
+        {"op": "edit_card", "card_id": "card-1", "title": "Renamed"},
+        {"op": "move_card", "card_id": "nope", "column_id": "col-done"},
+    )
+    assert resp.status_code == 404
+
+    board = client.get(f"/api/boards/{BOARD_ID}", headers=auth_headers).json()
+    assert board["cards"]["card-1"]["title"] == "Align roadmap themes"
+
+
+def test_duplicate_card_id_conflicts(client, auth_headers):
+    resp = _ops(client, auth_headers, {"op": "add_card", "card_id": "card-1", "column_id": "col-done", "title": "x"})
+    assert resp.status_code == 409
+
+
+def test_invalid_op_rejected(client, auth_headers):
+    resp = _ops(client, auth_headers, {"op": "explode", "card_id": "card-1"})
+    assert resp.status_code == 422
+
+
+def _card_positions(db_engine):
+    import asyncio
+    from sqlalchemy import select
+    from app.models.board import KanbanCard
+
+    async def _read():
+        async with db_engine.connect() as conn:
+            rows = (await conn.execute(select(KanbanCard.id, KanbanCard.column_id, KanbanCard.position))).all()
+        return {card_id: (column_id, position) for card_id, column_id, position in rows}
+
+    return asyncio.run(_read())
+
+
+def test_move_card_writes_single_row(client, auth_headers, db_engine):
+    before = _card_positions(db_engine)
+    resp = _ops(client, auth_headers, {"op": "move_card", "card_id": "card-8", "column_id": "col-progress", "index": 1})
+    assert resp.status_code == 200
+    assert _column(resp.json(), "col-progress")["cardIds"] == ["card-4", "card-8", "card-5"]
+
+    after = _card_positions(db_engine)
+    assert [cid for cid in before if before[cid] != after[cid]] == ["card-8"]
+
+
+def test_repeated_inserts_respace_column(client, auth_headers):
+    # Repeatedly inserting at index 1 halves the same gap until it has to be respaced
+    for i in range(15):
+        resp = _ops(client, auth_headers, {"op": "add_card", "card_id": f"card-x{i}", "column_id": "col-review", "title": "x", "index": 1})
+        assert resp.status_code == 200
+
+    order = _column(resp.json(), "col-review")["cardIds"]
+    assert order == ["card-6"] + [f"card-x{i}" for i in reversed(range(15))]
+
+
+def _run_sql(db_engine, *statements):
+    import asyncio
+    from sqlalchemy import text
+
+    async def _run():
+        async with db_engine.begin() as conn:
+            for statement in statements:
+                result = await conn.execute(text(statement))
+            return result.all() if result.returns_rows else None
+
+    return asyncio.run(_run())
+
+
+def test_insert_index_breaks_rank_ties_by_id(client, auth_headers, db_engine):
+    # card-0 shares card-7's rank and was added after it, so only the id puts it first
+    _run_sql(db_engine, "INSERT INTO kanban_cards (id, title, details, column_id, position, updated_at) "
+                        "SELECT 'card-0', 'Tied', '', 'col-done', position, 0 FROM kanban_cards WHERE id = 'card-7'")
+    board = client.get(f"/api/boards/{BOARD_ID}", headers=auth_headers).json()
+    assert _column(board, "col-done")["cardIds"] == ["card-0", "card-7", "card-8"]
+
+    resp = _ops(client, auth_headers, {"op": "add_card", "card_id": "card-new", "column_id": "col-done", "title": "x", "index": 1})
+    assert _column(resp.json(), "col-done")["cardIds"] == ["card-0", "card-new", "card-7", "card-8"]
+
+
+def test_respacing_keeps_updated_at(client, auth_headers, db_engine):
+    _run_sql(db_engine, "UPDATE kanban_cards SET position = 1 WHERE id = 'card-7'",
+                        "UPDATE kanban_cards SET position = 2 WHERE id = 'card-8'",
+                        "UPDATE kanban_cards SET updated_at = 1.0 WHERE column_id = 'col-done'")
+    resp = _ops(client, auth_headers, {"op": "move_card", "card_id": "card-1", "column_id": "col-done", "index": 1})
+    assert _column(resp.json(), "col-done")["cardIds"] == ["card-7", "card-1", "card-8"]
+
+    rows = _run_sql(db_engine, "SELECT id, position, updated_at FROM kanban_cards WHERE id IN ('card-7', 'card-8') ORDER BY id")
+    assert [position for _, position, _ in rows] != [1, 2]  # the column was respaced
+    assert [updated_at for _, _, updated_at in rows] == [1.0, 1.0]
@@ -0,0 +1,121 @@
+import json
+
+BOARD_ID = "board-1"
+
+
+def _export(client, headers, board_id=BOARD_ID):
+    resp = client.get(f"/api/boards/{board_id}/export", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+def _import(client, headers, lines, **params):
+    body = "".join(json.dumps(line) + "\n" for line in lines).encode()
+    return client.post("/api/boards/import", content=body, params=params, headers=headers)
+
+
+def test_export_lists_board_columns_and_cards_in_order(client, auth_headers):
+    lines = _export(client, auth_headers)
+    assert lines[0] == {"type": "board", "id": BOARD_ID, "title": lines[0]["title"], "version": 0}
+    columns = [line["id"] for line in lines if line["type"] == "column"]
+    assert columns == ["col-backlog", "col-discovery", "col-progress", "col-review", "col-done"]
+    ids = [line["id"] for line in lines[1:]]
+    assert ids[:4] == ["col-backlog", "card-1", "card-2", "col-discovery"]
+    assert ids[-3:] == ["col-done", "card-7", "card-8"]
+    card = next(line for line in lines if line["id"] == "card-1")
+    assert card["created_by"] == "user"
+
+
+def test_export_requires_membership(client, auth_headers, login):
+    board_id = client.post("/api/boards", json={"title": "Private"}, headers=auth_headers).json()["id"]
+    assert client.get(f"/api/boards/{board_id}/export", headers=login("alice")).status_code == 403
+    assert client.get("/api/boards/missing/export", headers=auth_headers).status_code == 404
+
+
+def test_export_includes_empty_columns(client, auth_headers):
+    board_id = client.post("/api/boards", json={"title": "Empty"}, headers=auth_headers).json()["id"]
+    lines = _export(client, auth_headers, board_id)
+    assert [line["type"] for line in lines] == ["board"] + ["column"] * 5
+
+
+def test_export_then_import_round_trips(client, auth_headers, monkeypatch, login):
+    monkeypatch.setattr("app.config.IMPORT_BATCH_SIZE", 3)
+    exported = _export(client, auth_headers)
+    alice = login("alice")
+    resp = _import(client, alice, exported, new_ids="true")
+    assert resp.status_code == 201
+    result = resp.json()
+    assert result["title"] == exported[0]["title"]
+    assert (result["columns"], result["cards"]) == (5, 8)
+
+    board = client.get(f"/api/boards/{result['id']}", headers=alice).json()
+    assert [col["title"] for col in board["columns"]] == ["Backlog", "Discovery", "In Progress", "Review", "Done"]
+    titles = [[board["cards"][card_id]["title"] for card_id in col["cardIds"]] for col in board["columns"]]
+    expected = {line["id"]: line["title"] for line in exported if line["type"] == "card"}
+    assert titles[0] == [expected["card-1"], expected["card-2"]]
+    assert sum(len(col) for col in titles) == 8
+    assert "card-1" not in board["cards"]
+    assert board["cards"][board["columns"][0]["cardIds"][0]]["created_by"] == "user"
+
+    owned = client.get("/api/boards", headers=alice).json()
+    assert result["id"] in [b["id"] for b in owned]
+
+
+def test_import_keeps_ids_and_rejects_duplicates(client, auth_headers):
+    exported = _export(client, auth_headers)
+    resp = _import(client, auth_headers, exported)
+    assert resp.status_code == 409
+    assert len(client.get("/api/boards", headers=auth_headers).json()) == 1  # the partial board was removed
+
+    fresh = [
+        {"type": "board", "title": "Moved"},
+        {"type": "column", "id": "col-x", "title": "Only"},
+        {"type": "card", "id": "card-x", "title": "Kept", "assigned_to": "nobody"},
+    ]
+    result = _import(client, auth_headers, fresh).json()
+    board = client.get(f"/api/boards/{result['id']}", headers=auth_headers).json()
+    assert board["columns"][0]["id"] == "col-x"
+    assert board["cards"]["card-x"]["assigned_to"] is None
+
+
+def test_import_rejects_malformed_lines(client, auth_headers):
+    cases = [
+        [{"type": "column", "id": "c", "title": "No board"}],
+        [{"type": "board", "title": "B"}, {"type": "card", "id": "k", "title": "Orphan"}],
+        [{"type": "board", "title": "B"}, {"type": "column", "id": "c"}],
+        [{"type": "board", "title": "B"}, {"type": "bogus"}],
+        [],
+    ]
+    for lines in cases:
+        resp = _import(client, auth_headers, lines)
+        assert resp.status_code == 400, lines
+    resp = client.post("/api/boards/import", content=b'{"type": "board", "title": "B"}\nnot json\n', headers=auth_headers)
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Line 2: invalid JSON"
+    assert len(client.get("/api/boards", headers=auth_headers).json()) == 1
+
+
+def test_import_rejects_non_string_usernames(client, auth_headers):
+    board = {"type": "board", "title": "B"}
+    column = {"type": "column", "id": "c-users", "title": "C"}
+    for bad in [5, ["alice"], {"name": "alice"}]:
+        for key in ("created_by", "assigned_to"):
+            card = {"type": "card", "id": "k-users", "title": "K", key: bad}
+            resp = _import(client, auth_headers, [board, column, card])
+            assert resp.status_code == 400, (key, bad)
+            assert resp.json()["detail"] == f"Line 3: {key} must be a username or null"
+    assert len(client.get("/api/boards", headers=auth_headers).json()) == 1
+
+
+def test_import_rejects_overlong_lines(client, auth_headers, monkeypatch):
+    monkeypatch.setattr("app.routes.boards.config.IMPORT_MAX_LINE_BYTES", 100)
+    board = json.dumps({"type": "board", "title": "B"}).encode()
+    # The second line never ends; it is rejected once it outgrows the limit
+    resp = client.post("/api/boards/import", content=board + b"\n" + b"x" * 500, headers=auth_headers)
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Line 2: longer than 100 bytes"
+    card = json.dumps({"type": "card", "id": "k", "title": "x" * 200}).encode()
+    resp = client.post("/api/boards/import", content=board + b"\n" + card + b"\n", headers=auth_headers)
+    assert resp.status_code == 400
+    assert len(client.get("/api/boards", headers=auth_headers).json()) == 1
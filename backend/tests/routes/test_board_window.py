@@ -0,0 +1,101 @@
+BOARD_ID = "board-1"
+
+
+def _window(client, headers, **params):
+    return client.get(f"/api/boards/{BOARD_ID}/window", params=params, headers=headers)
+
+
+def _page(client, headers, column_id, **params):
+    return client.get(f"/api/boards/{BOARD_ID}/columns/{column_id}/cards", params=params, headers=headers)
+
+
+def _add_cards(client, headers, column_id, count):
+    board = client.get(f"/api/boards/{BOARD_ID}", headers=headers).json()
+    column = next(col for col in board["columns"] if col["id"] == column_id)
+    for i in range(count):
+        card_id = f"bulk-{i}"
+        board["cards"][card_id] = {"id": card_id, "title": f"Bulk {i}", "details": ""}
+        column["cardIds"].append(card_id)
+    client.patch(f"/api/boards/{BOARD_ID}", json=board, headers=headers)
+    return column["cardIds"]
+
+
+def test_window_matches_full_board_when_it_fits(client, auth_headers):
+    full = client.get(f"/api/boards/{BOARD_ID}", headers=auth_headers).json()
+    window = _window(client, auth_headers, limit=10).json()
+    assert [col["cardIds"] for col in window["columns"]] == [col["cardIds"] for col in full["columns"]]
+    assert window["cards"] == full["cards"]
+    assert all(col["nextCursor"] is None for col in window["columns"])
+    assert [col["cardCount"] for col in window["columns"]] == [2, 1, 2, 1, 2]
+
+
+def test_window_limits_cards_per_column(client, auth_headers):
+    resp = _window(client, auth_headers, limit=1)
+    assert resp.status_code == 200
+    columns = {col["id"]: col for col in resp.json()["columns"]}
+    assert columns["col-backlog"]["cardIds"] == ["card-1"]
+    assert columns["col-backlog"]["cardCount"] == 2
+    assert columns["col-backlog"]["nextCursor"] is not None
+    assert columns["col-discovery"]["nextCursor"] is None
+    assert len(resp.json()["cards"]) == 5
+
+
+def test_paging_through_a_column_returns_every_card_once(client, auth_headers):
+    expected = _add_cards(client, auth_headers, "col-done", 23)
+    column = next(col for col in _window(client, auth_headers, limit=5).json()["columns"] if col["id"] == "col-done")
+    assert column["cardCount"] == 25
+    seen, cursor = list(column["cardIds"]), column["nextCursor"]
+    while cursor:
+        page = _page(client, auth_headers, "col-done", after=cursor, limit=7).json()
+        assert set(page["cards"]) == set(page["cardIds"])
+        seen += page["cardIds"]
+        cursor = page["nextCursor"]
+    assert seen == expected
+
+
+def test_column_page_without_cursor_starts_at_the_top(client, auth_headers):
+    page = _page(client, auth_headers, "col-progress").json()
+    assert page["cardIds"] == ["card-4", "card-5"]
+    assert page["nextCursor"] is None
+    assert page["version"] == 0
+
+
+def test_window_etag_revalidates(client, auth_headers):
+    etag = _window(client, auth_headers).headers["etag"]
+    resp = client.get(f"/api/boards/{BOARD_ID}/window", headers={**auth_headers, "If-None-Match": etag})
+    assert resp.status_code == 304
+
+
+def test_invalid_cursor_is_rejected(client, auth_headers):
+    assert _page(client, auth_headers, "col-done", after="nonsense").status_code == 400
+
+
+def test_unknown_column_is_404(client, auth_headers):
+    assert _page(client, auth_headers, "col-missing").status_code == 404
+
+
+def test_limit_is_bounded(client, auth_headers):
+    assert _window(client, auth_headers, limit=0).status_code == 422
+    assert _window(client, auth_headers, limit=100_000).status_code == 422
+
+
+def test_window_requires_membership(client, auth_headers, login):
+    board_id = client.post("/api/boards", json={"title": "Private"}, headers=auth_headers).json()["id"]
+    column_id = client.get(f"/api/boards/{board_id}/window", headers=auth_headers).json()["columns"][0]["id"]
+    headers = login("bob")
+    assert client.get(f"/api/boards/{board_id}/window", headers=headers).status_code == 403
+    assert client.get(f"/api/boards/{board_id}/columns/{column_id}/cards", headers=headers).status_code == 403
+
+
+def test_window_with_more_columns_than_one_compound_select_allows(client, auth_headers):
+    board = client.get(f"/api/boards/{BOARD_ID}", headers=auth_headers).json()
+    for i in range(605):
+        board["columns"].append({"id": f"wide-{i}", "title": f"Wide {i}", "cardIds": [f"wide-card-{i}"]})
+        board["cards"][f"wide-card-{i}"] = {"id": f"wide-card-{i}", "title": f"Card {i}", "details": ""}
+    assert client.patch(f"/api/boards/{BOARD_ID}", json=board, headers=auth_headers).status_code == 200
+    resp = _window(client, auth_headers, limit=1)
+    assert resp.status_code == 200
+    window = resp.json()
+    assert len(window["columns"]) == 610
+    assert window["columns"][-1]["cardIds"] == ["wide-card-604"]
+    assert len(window["cards"]) == 5 + 605
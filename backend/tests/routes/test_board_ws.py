@@ -0,0 +1,59 @@
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from app.realtime import CLOSE_FORBIDDEN, CLOSE_UNAUTHORIZED
+
+BOARD_ID = "board-1"
+
+
+def _token(headers: dict) -> str:
+    return headers["Authorization"].removeprefix("Bearer ")
+
+
+def test_ws_rejects_bad_token(client):
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect(f"/api/boards/{BOARD_ID}/ws?token=nope") as ws:
+            ws.receive_text()
+    assert exc.value.code == CLOSE_UNAUTHORIZED
+
+
+def test_ws_rejects_non_member(client, auth_headers, login):
+    board_id = client.post("/api/boards", json={"title": "Private"}, headers=auth_headers).json()["id"]
+    bob = login("bob")
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect(f"/api/boards/{board_id}/ws?token={_token(bob)}") as ws:
+            ws.receive_text()
+    assert exc.value.code == CLOSE_FORBIDDEN
+
+
+def test_ws_receives_ops_changes(client, auth_headers, login):
+    alice = login("alice")
+    with client.websocket_connect(f"/api/boards/{BOARD_ID}/ws?token={_token(alice)}") as ws:
+        ops = {"ops": [{"op": "edit_card", "card_id": "card-1", "title": "Renamed"}]}
+        resp = client.post(f"/api/boards/{BOARD_ID}/ops", json=ops, headers=auth_headers)
+        event = ws.receive_json()
+    assert event["type"] == "board_changed"
+    assert event["kind"] == "ops"
+    assert event["version"] == resp.json()["version"]
+    assert event["changes"]["cards"]["card-1"]["title"] == "Renamed"
+
+
+def test_ws_receives_patch_and_assign(client, auth_headers):
+    with client.websocket_connect(f"/api/boards/{BOARD_ID}/ws?token={_token(auth_headers)}") as ws:
+        board = client.get(f"/api/boards/{BOARD_ID}", headers=auth_headers).json()
+        client.patch(f"/api/boards/{BOARD_ID}", json=board, headers=auth_headers)
+        client.patch(f"/api/boards/{BOARD_ID}/cards/card-2/assignee", json={"username": "bob"}, headers=auth_headers)
+        replaced, assigned = ws.receive_json(), ws.receive_json()
+    assert replaced["kind"] == "replace"
+    assert assigned["kind"] == "assign"
+    assert assigned["card"]["assigned_to"] == "bob"
+
+
+def test_ws_removed_member_is_disconnected(client, auth_headers, login):
+    bob = login("bob")
+    with client.websocket_connect(f"/api/boards/{BOARD_ID}/ws?token={_token(bob)}") as ws:
+        client.delete(f"/api/boards/{BOARD_ID}/members/bob", headers=auth_headers)
+        assert ws.receive_json()["kind"] == "members"
+        with pytest.raises(WebSocketDisconnect) as exc:
+            ws.receive_json()
+    assert exc.value.code == CLOSE_FORBIDDEN
@@ -14,11 +14,11 @@ def test_chat_without_auth(client, auth_headers):
     assert resp.status_code == 401
 
 
-def test_chat_no_board_update(client, auth_headers, monkeypatch):
-    monkeypatch.setattr(
-        "app.routes.chat.call_ai",
-        lambda board, messages: {"message": "Done", "board_update": None},
-    )
+def test_chat_no_operations(client, auth_headers, monkeypatch):
+    async def _fake_call_ai(board, messages):
+        return {"message": "Done", "operations": []}
+
+    monkeypatch.setattr("app.routes.chat.call_ai", _fake_call_ai)
     board = _board_payload(client, auth_headers)
     resp = client.post(
         "/api/chat",
@@ -28,29 +28,19 @@ def test_chat_no_board_update(client, auth_headers, monkeypatch):
     assert resp.status_code == 200
     data = resp.json()
     assert data["message"] == "Done"
-    assert data["board_update"] is None
+    assert data["changes"] is None
 
 
-def test_chat_with_board_update(client, auth_headers, monkeypatch):
+def test_chat_with_operations(client, auth_headers, monkeypatch):
     board = _board_payload(client, auth_headers)
 
-    # Build an updated board: move card-1 from backlog to progress
-    updated = {
-        "columns": [
-            {**col, "cardIds": [c for c in col["cardIds"] if c != "card-1"]}
-            if col["id"] == "col-backlog"
-            else {**col, "cardIds": ["card-1"] + col["cardIds"]}
-            if col["id"] == "col-progress"
-            else col
-            for col in board["columns"]
-        ],
-        "cards": board["cards"],
-    }
-
-    monkeypatch.setattr(
-        "app.routes.chat.call_ai",
-        lambda b, m: {"message": "Moved card-1", "board_update": updated},
-    )
+    async def _fake_call_ai(board, messages):
+        return {
+            "message": "Moved card-1",
+            "operations": [{"op": "move_card", "card_id": "card-1", "column_id": "col-progress", "index": 0}],
+        }
+
+    monkeypatch.setattr("app.routes.chat.call_ai", _fake_call_ai)
 
     resp = client.post(
         "/api/chat",
@@ -60,7 +50,9 @@ def test_chat_with_board_update(client, auth_headers, monkeypatch):
     assert resp.status_code == 200
     data = resp.json()
     assert data["message"] == "Moved card-1"
-    assert data["board_update"] is not None
+    assert data["changes"]["version"] == 1
+    progress = next(c for c in data["changes"]["columns"] if c["id"] == "col-progress")
+    assert progress["cardIds"][0] == "card-1"
 
     # Verify persistence
     refreshed = _board_payload(client, auth_headers)
@@ -70,6 +62,32 @@ def test_chat_with_board_update(client, auth_headers, monkeypatch):
     assert "card-1" not in backlog["cardIds"]
 
 
+def test_chat_invalid_operations_leave_board_unchanged(client, auth_headers, monkeypatch):
+    board = _board_payload(client, auth_headers)
+
+    async def _fake_call_ai(board, messages):
+        return {
+            "message": "Done",
+            "operations": [
+                {"op": "edit_card", "card_id": "card-1", "title": "Renamed"},
+                {"op": "move_card", "card_id": "no-such-card", "column_id": "col-done"},
+            ],
+        }
+
+    monkeypatch.setattr("app.routes.chat.call_ai", _fake_call_ai)
+
+    resp = client.post(
+        "/api/chat",
+        json={"messages": [{"role": "user", "content": "do it"}], "board": board, "board_id": BOARD_ID},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["changes"] is None
+    assert "couldn't apply" in data["message"]
+    assert _board_payload(client, auth_headers)["cards"]["card-1"]["title"] == "Align roadmap themes"
+
+
 def test_chat_malformed_messages(client, auth_headers):
     resp = client.post(
         "/api/chat",
@@ -77,3 +95,50 @@ def test_chat_malformed_messages(client, auth_headers):
         headers=auth_headers,
     )
     assert resp.status_code == 422
+
+
+def _parse_sse(text):
+    import json
+    events = []
+    for block in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_chat_stream_emits_tokens_and_done(client, auth_headers, monkeypatch):
+    board = _board_payload(client, auth_headers)
+
+    async def _fake_stream_ai(board, messages):
+        yield "token", "Re"
+        yield "token", "named"
+        yield "result", {"message": "Renamed", "operations": [{"op": "edit_card", "card_id": "card-1", "title": "Renamed"}]}
+
+    monkeypatch.setattr("app.routes.chat.stream_ai", _fake_stream_ai)
+
+    resp = client.post(
+        "/api/chat/stream",
+        json={"messages": [{"role": "user", "content": "rename"}], "board": board, "board_id": BOARD_ID},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(resp.text)
+    assert events[:2] == [("token", {"delta": "Re"}), ("token", {"delta": "named"})]
+    kind, data = events[-1]
+    assert kind == "done"
+    assert data["message"] == "Renamed"
+    assert data["changes"]["cards"]["card-1"]["title"] == "Renamed"
+
+    refreshed = _board_payload(client, auth_headers)
+    assert refreshed["cards"]["card-1"]["title"] == "Renamed"
+
+
+def test_chat_stream_requires_membership(client, auth_headers):
+    board = _board_payload(client, auth_headers)
+    resp = client.post(
+        "/api/chat/stream",
+        json={"messages": [{"role": "user", "content": "hi"}], "board": board, "board_id": "missing-board"},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 403
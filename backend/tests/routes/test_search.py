@@ -0,0 +1,87 @@
+import asyncio
+
+from sqlalchemy import text
+
+
+def _search(client, headers, q, **params):
+    return client.get("/api/search", params={"q": q, **params}, headers=headers)
+
+
+def test_search_finds_seeded_card(client, auth_headers):
+    resp = _search(client, auth_headers, "roadmap")
+    assert resp.status_code == 200
+    hits = resp.json()
+    assert [hit["card_id"] for hit in hits] == ["card-1"]
+    assert hits[0]["board_title"] == "Main Board"
+    assert hits[0]["column_title"] == "Backlog"
+
+
+def test_search_matches_details_with_highlight(client, auth_headers):
+    hits = _search(client, auth_headers, "churn").json()
+    assert [hit["card_id"] for hit in hits] == ["card-2"]
+    assert "<mark>churn</mark>" in hits[0]["snippet"]
+
+
+def test_last_word_is_a_prefix_and_all_words_must_match(client, auth_headers):
+    assert [hit["card_id"] for hit in _search(client, auth_headers, "customer sig").json()] == ["card-2"]
+    assert _search(client, auth_headers, "customer roadmap").json() == []
+
+
+def test_title_matches_rank_first(client, auth_headers):
+    client.post(
+        "/api/boards/board-1/ops",
+        json={"ops": [{"op": "add_card", "column_id": "col-backlog", "card_id": "c-details",
+                       "title": "Unrelated", "details": "mentions sprint in passing"}]},
+        headers=auth_headers,
+    )
+    ids = [hit["card_id"] for hit in _search(client, auth_headers, "sprint").json()]
+    assert ids == ["card-8", "c-details"]
+
+
+def test_index_follows_edits_and_deletes(client, auth_headers):
+    ops = [{"op": "edit_card", "card_id": "card-1", "title": "Quarterly planning"}]
+    client.post("/api/boards/board-1/ops", json={"ops": ops}, headers=auth_headers)
+    assert _search(client, auth_headers, "roadmap").json() == []
+    assert [hit["card_id"] for hit in _search(client, auth_headers, "quarterly").json()] == ["card-1"]
+    client.post("/api/boards/board-1/ops", json={"ops": [{"op": "delete_card", "card_id": "card-1"}]}, headers=auth_headers)
+    assert _search(client, auth_headers, "quarterly").json() == []
+
+
+def test_archived_cards_are_not_found(client, auth_headers):
+    client.post("/api/boards/board-1/archive", json={"card_ids": ["card-1"]}, headers=auth_headers)
+    assert _search(client, auth_headers, "roadmap").json() == []
+
+
+def test_search_only_covers_member_boards(client, auth_headers, login):
+    board_id = client.post("/api/boards", json={"title": "Private"}, headers=auth_headers).json()["id"]
+    column_id = client.get(f"/api/boards/{board_id}/window", headers=auth_headers).json()["columns"][0]["id"]
+    client.post(
+        f"/api/boards/{board_id}/ops",
+        json={"ops": [{"op": "add_card", "column_id": column_id, "title": "Secret roadmap"}]},
+        headers=auth_headers,
+    )
+    assert len(_search(client, auth_headers, "roadmap").json()) == 2
+    assert len(_search(client, auth_headers, "roadmap", board_id=board_id).json()) == 1
+    assert [hit["card_id"] for hit in _search(client, login("bob"), "roadmap").json()] == ["card-1"]
+
+
+def test_query_syntax_is_taken_literally(client, auth_headers):
+    for q in ['"unbalanced', "roadmap OR NOT", "title:*", "(", "---"]:
+        assert _search(client, auth_headers, q).status_code == 200
+
+
+def test_search_requires_auth_and_query(client, auth_headers):
+    assert client.get("/api/search", params={"q": "roadmap"}).status_code == 401
+    assert client.get("/api/search", headers=auth_headers).status_code == 422
+
+
+def test_rebuild_migration_indexes_existing_cards(db_engine):
+    from app.database import _add_card_search
+
+    async def _run():
+        async with db_engine.begin() as conn:
+            await conn.exec_driver_sql("DROP TABLE kanban_cards_fts")
+            await conn.run_sync(_add_card_search)
+            return (await conn.execute(text("SELECT rowid FROM kanban_cards_fts WHERE kanban_cards_fts MATCH 'roadmap'"))).all()
+
+    assert len(asyncio.run(_run())) == 1
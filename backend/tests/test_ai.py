@@ -1,4 +1,7 @@
 """Tests for AI error handling (C2 remediation)."""
+import asyncio
+import httpx
+import openai
 import pytest
 from app.ai import call_ai
 
@@ -16,54 +19,232 @@ class _FakeResponse:
 def test_call_ai_malformed_json_returns_fallback(monkeypatch):
     """call_ai must not raise when the model returns non-JSON content."""
 
-    def _fake_create(**kwargs):
+    async def _fake_create(**kwargs):
         return _FakeResponse("sorry, I cannot help with that")
 
     monkeypatch.setattr("app.ai._client.chat.completions.create", _fake_create)
     # Ensure key appears to be set so we don't hit the empty-key early-return
     monkeypatch.setattr("app.ai.config.OPENROUTER_API_KEY", "sk-fake")
 
-    result = call_ai({}, [])
+    result = asyncio.run(call_ai({}, []))
 
     assert "message" in result
-    assert result["board_update"] is None
+    assert result["operations"] == []
     assert "error" in result["message"].lower() or "encountered" in result["message"].lower()
 
 
 def test_call_ai_partial_json_returns_fallback(monkeypatch):
     """call_ai must not raise when the model returns truncated JSON."""
 
-    def _fake_create(**kwargs):
-        return _FakeResponse('{"message": "hello", "board_update":')
+    async def _fake_create(**kwargs):
+        return _FakeResponse('{"message": "hello", "operations":')
 
     monkeypatch.setattr("app.ai._client.chat.completions.create", _fake_create)
     monkeypatch.setattr("app.ai.config.OPENROUTER_API_KEY", "sk-fake")
 
-    result = call_ai({}, [])
+    result = asyncio.run(call_ai({}, []))
 
-    assert result["board_update"] is None
+    assert result["operations"] == []
 
 
 def test_call_ai_missing_key_returns_error_message(monkeypatch):
     """call_ai must return a clear message when the API key is not configured."""
     monkeypatch.setattr("app.ai.config.OPENROUTER_API_KEY", "")
 
-    result = call_ai({}, [])
+    result = asyncio.run(call_ai({}, []))
 
-    assert result["board_update"] is None
+    assert result["operations"] == []
     assert "OPENROUTER_API_KEY" in result["message"] or "not configured" in result["message"]
 
 
 def test_call_ai_valid_response_passed_through(monkeypatch):
     """call_ai must return parsed JSON unchanged when the model responds correctly."""
 
-    def _fake_create(**kwargs):
-        return _FakeResponse('{"message": "Done", "board_update": null}')
+    async def _fake_create(**kwargs):
+        return _FakeResponse('{"message": "Done", "operations": []}')
 
     monkeypatch.setattr("app.ai._client.chat.completions.create", _fake_create)
     monkeypatch.setattr("app.ai.config.OPENROUTER_API_KEY", "sk-fake")
 
-    result = call_ai({}, [])
+    result = asyncio.run(call_ai({}, []))
 
     assert result["message"] == "Done"
-    assert result["board_update"] is None
+    assert result["operations"] == []
+
+
+def test_call_ai_timeout_returns_fallback(monkeypatch):
+    """call_ai must turn an upstream timeout into a message instead of raising."""
+
+    async def _fake_create(**kwargs):
+        raise openai.APITimeoutError(request=httpx.Request("POST", "http://llm.test/chat/completions"))
+
+    monkeypatch.setattr("app.ai._client.chat.completions.create", _fake_create)
+    monkeypatch.setattr("app.ai.config.OPENROUTER_API_KEY", "sk-fake")
+
+    result = asyncio.run(call_ai({}, []))
+
+    assert result["operations"] == []
+    assert "unavailable" in result["message"]
+
+
+def test_call_ai_runs_concurrently(monkeypatch):
+    """Slow LLM calls must overlap instead of serialising on the event loop."""
+
+    async def _fake_create(**kwargs):
+        await asyncio.sleep(0.2)
+        return _FakeResponse('{"message": "ok", "operations": []}')
+
+    monkeypatch.setattr("app.ai._client.chat.completions.create", _fake_create)
+    monkeypatch.setattr("app.ai.config.OPENROUTER_API_KEY", "sk-fake")
+
+    async def _run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await asyncio.gather(*(call_ai({}, []) for _ in range(5)))
+        return results, loop.time() - start
+
+    results, elapsed = asyncio.run(_run())
+    assert all(r["message"] == "ok" for r in results)
+    assert elapsed < 0.6
+
+
+class _FakeChunk:
+    def __init__(self, text):
+        delta = type("_Delta", (), {"content": text})()
+        self.choices = [type("_Choice", (), {"delta": delta})()]
+
+
+class _FakeStream:
+    def __init__(self, pieces):
+        self._pieces = list(pieces)
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._pieces:
+            raise StopAsyncIteration
+        return _FakeChunk(self._pieces.pop(0))
+
+
+def test_message_stream_parser_handles_split_escapes():
+    """The streamed message must match json.loads even when escapes are split across chunks."""
+    import json
+    from app.ai import MessageStreamParser
+
+    doc = '{"operations": [{"message": "ignored", "x": [1, "a"]}], "message": "Say \\"hi\\"\\n\\u00e9\\ud83d\\ude00!"}'
+    parser = MessageStreamParser()
+    streamed = "".join(parser.feed(ch) for ch in doc)
+    assert streamed == json.loads(doc)["message"]
+
+
+def test_message_stream_parser_ignores_null_message():
+    from app.ai import MessageStreamParser
+
+    parser = MessageStreamParser()
+    assert parser.feed('{"message": null, "operations": [{"message": "nested"}]}') == ""
+
+
+def test_stream_ai_yields_tokens_then_result(monkeypatch):
+    """stream_ai must forward message text as it arrives and finish with the parsed response."""
+    from app.ai import stream_ai
+
+    async def _fake_create(**kwargs):
+        assert kwargs["stream"] is True
+        return _FakeStream(['{"mess', 'age": "Hel', 'lo", "opera', 'tions": []}'])
+
+    monkeypatch.setattr("app.ai._client.chat.completions.create", _fake_create)
+    monkeypatch.setattr("app.ai.config.OPENROUTER_API_KEY", "sk-fake")
+
+    async def _collect():
+        return [item async for item in stream_ai({}, [])]
+
+    events = asyncio.run(_collect())
+    assert events[:-1] == [("token", "Hel"), ("token", "lo")]
+    assert events[-1] == ("result", {"message": "Hello", "operations": []})
+
+
+def test_stream_ai_closes_stream_when_abandoned(monkeypatch):
+    """A client that stops reading mid-stream must not leave the upstream response open."""
+    from app.ai import stream_ai
+
+    stream = _FakeStream(['{"message": "Hel', 'lo", "operations": []}'])
+
+    async def _fake_create(**kwargs):
+        return stream
+
+    monkeypatch.setattr("app.ai._client.chat.completions.create", _fake_create)
+    monkeypatch.setattr("app.ai.config.OPENROUTER_API_KEY", "sk-fake")
+
+    async def _abandon():
+        events = stream_ai({}, [])
+        first = await events.__anext__()
+        await events.aclose()
+        return first
+
+    assert asyncio.run(_abandon()) == ("token", "Hel")
+    assert stream.closed
+
+
+def test_message_stream_parser_tolerates_bad_unicode_escapes():
+    from app.ai import MessageStreamParser
+
+    parser = MessageStreamParser()
+    streamed = parser.feed('{"message": "a\\uZZZZb \\ud83dx \\ude00 c"')
+    assert streamed == "a\ufffdZZZZb \ufffdx \ufffd c"
+
+
+def test_stream_ai_network_error_mid_stream_returns_fallback(monkeypatch):
+    """A transport error while iterating the stream must still end with a result, not raise."""
+    from app.ai import stream_ai
+
+    class _BrokenStream(_FakeStream):
+        async def __anext__(self):
+            if not self._pieces:
+                raise httpx.ReadTimeout("read timed out")
+            return await super().__anext__()
+
+    async def _fake_create(**kwargs):
+        return _BrokenStream(['{"message": "Hal'])
+
+    monkeypatch.setattr("app.ai._client.chat.completions.create", _fake_create)
+    monkeypatch.setattr("app.ai.config.OPENROUTER_API_KEY", "sk-fake")
+
+    async def _collect():
+        return [item async for item in stream_ai({}, [])]
+
+    events = asyncio.run(_collect())
+    assert events[0] == ("token", "Hal")
+    kind, result = events[-1]
+    assert kind == "result"
+    assert "unavailable" in result["message"]
+    assert result["operations"] == []
+
+
+def test_call_ai_maps_operation_aliases(monkeypatch):
+    """Operations written against the compact prompt must come back with real ids."""
+    board = {
+        "columns": [{"id": "col-todo", "title": "To Do", "cardIds": ["card-a"]}, {"id": "col-done", "title": "Done", "cardIds": []}],
+        "cards": {"card-a": {"id": "card-a", "title": "A", "details": ""}},
+    }
+    seen = {}
+
+    async def _fake_create(**kwargs):
+        seen["system"] = kwargs["messages"][0]["content"]
+        return _FakeResponse('{"message": "Moved", "operations": [{"op": "move_card", "card_id": "K1", "column_id": "C2"}]}')
+
+    monkeypatch.setattr("app.ai._client.chat.completions.create", _fake_create)
+    monkeypatch.setattr("app.ai.config.OPENROUTER_API_KEY", "sk-fake")
+
+    result = asyncio.run(call_ai(board, []))
+
+    assert "K1 | A" in seen["system"]
+    assert "card-a" not in seen["system"]
+    assert result["operations"] == [{"op": "move_card", "card_id": "card-a", "column_id": "col-done"}]
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from app import config
 from app.ai import call_ai
@@ -6,6 +7,6 @@ from app.models.board import ChatMessage
 
 @pytest.mark.skipif(not config.OPENROUTER_API_KEY, reason="no API key")
 def test_ai_responds_to_arithmetic():
-    result = call_ai(board={}, messages=[ChatMessage(role="user", content="What is 2+2?")])
+    result = asyncio.run(call_ai(board={}, messages=[ChatMessage(role="user", content="What is 2+2?")]))
     assert "message" in result
     assert "4" in result["message"]
@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.archive import archive_stale_done_cards, hold_lease
+from app.models.board import ArchivedCard, CardSchema, KanbanCard, board_read_query, board_to_db, rows_to_board
+
+
+def _session_maker(db_engine):
+    return async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def test_board_to_db_stamps_changed_cards_only(db_engine):
+    async def _run():
+        async with _session_maker(db_engine)() as session:
+            await session.execute(text("UPDATE kanban_cards SET updated_at = 1"))
+            await session.commit()
+            board = rows_to_board((await session.execute(board_read_query("board-1", "user-1"))).all())
+            board.cards["card-1"].title = "Renamed"
+            board.cards["card-new"] = CardSchema(id="card-new", title="New")
+            board.columns[0].cardIds.append("card-new")
+            await board_to_db(session, "board-1", board)
+            rows = (await session.execute(select(KanbanCard.id, KanbanCard.updated_at))).all()
+        return dict(rows)
+
+    start = time.time()
+    stamps = asyncio.run(_run())
+    assert stamps["card-1"] >= start
+    assert stamps["card-new"] >= start
+    assert stamps["card-2"] == 1
+
+
+def test_archive_stale_done_cards_targets_last_column(db_engine):
+    async def _run():
+        async with _session_maker(db_engine)() as session:
+            await session.execute(text("UPDATE kanban_cards SET updated_at = 1 WHERE id IN ('card-1', 'card-7')"))
+            await session.commit()
+            archived = await archive_stale_done_cards(session, after_days=30)
+            ids = (await session.execute(select(ArchivedCard.id))).scalars().all()
+        return archived, ids
+
+    archived, ids = asyncio.run(_run())
+    assert [(board_id, result.count) for board_id, result in archived] == [("board-1", 1)]
+    assert ids == ["card-7"]  # card-1 is just as old but sits in Backlog
+
+
+def test_hold_lease_admits_one_holder_until_it_lapses(db_engine):
+    async def _run():
+        async with _session_maker(db_engine)() as session:
+            first = await hold_lease(session, "job", "worker-a", ttl=60)
+            blocked = await hold_lease(session, "job", "worker-b", ttl=60)
+            renewed = await hold_lease(session, "job", "worker-a", ttl=-1)  # renewed, but already lapsed
+            taken_over = await hold_lease(session, "job", "worker-b", ttl=60)
+            lost = await hold_lease(session, "job", "worker-a", ttl=60)
+        return first, blocked, renewed, taken_over, lost
+
+    assert asyncio.run(_run()) == (True, False, True, True, False)
@@ -0,0 +1,38 @@
+"""rows_to_board_json must match the BoardData wire format byte for byte."""
+import asyncio
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models import board as board_module
+from app.models.board import board_read_query, rows_to_board, rows_to_board_json
+
+
+@pytest.fixture
+def board_rows(db_engine):
+    async def _run():
+        async with db_engine.begin() as conn:
+            await conn.execute(text(
+                "UPDATE kanban_cards SET title = 'Café “quotes” \\ slash', details = NULL, assigned_to_id = 'user-2' "
+                "WHERE id = 'card-3'"
+            ))
+        maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+        async with maker() as session:
+            return (await session.execute(board_read_query("board-1", "user-1"))).all()
+
+    return asyncio.run(_run())
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_matches_pydantic_serialization(board_rows, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(board_module, "orjson", None)
+    elif board_module.orjson is None:
+        pytest.skip("orjson not installed")
+    assert rows_to_board_json(board_rows) == rows_to_board(board_rows).model_dump_json().encode()
+
+
+def test_get_board_response_is_json(client, auth_headers):
+    resp = client.get("/api/boards/board-1", headers=auth_headers)
+    assert resp.headers["content-type"] == "application/json"
+    assert resp.json()["columns"][0]["cardIds"] == ["card-1", "card-2"]
@@ -0,0 +1,70 @@
+"""Tests for the LRU response cache and the TTL cache."""
+from app.cache import LRUCache, TTLCache
+
+
+def test_get_refreshes_recency():
+    cache = LRUCache(max_entries=2, max_bytes=1000)
+    cache.put(("a", 1), b"a")
+    cache.put(("b", 1), b"b")
+    cache.get(("a", 1))
+    cache.put(("c", 1), b"c")
+    assert cache.get(("a", 1)) == b"a"
+    assert cache.get(("b", 1)) is None
+
+
+def test_evicts_to_stay_under_byte_budget():
+    cache = LRUCache(max_entries=10, max_bytes=10)
+    cache.put(("a", 1), b"123456")
+    cache.put(("b", 1), b"123456")
+    assert cache.get(("a", 1)) is None
+    assert cache.stats()["bytes"] == 6
+
+
+def test_oversized_value_not_cached():
+    cache = LRUCache(max_entries=10, max_bytes=4)
+    cache.put(("a", 1), b"12345")
+    assert cache.stats()["entries"] == 0
+
+
+def test_replacing_key_updates_size():
+    cache = LRUCache(max_entries=10, max_bytes=100)
+    cache.put(("a", 1), b"1234")
+    cache.put(("a", 1), b"12")
+    assert cache.stats() == {"entries": 1, "bytes": 2, "hits": 0, "misses": 0}
+
+
+def test_ttl_entries_expire(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("app.cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(max_entries=10, ttl=5)
+    cache.put(("b", "u"), True)
+    assert cache.get(("b", "u")) is True
+    now[0] += 6
+    assert cache.get(("b", "u")) is None
+    assert cache.stats() == {"entries": 0, "hits": 1, "misses": 1}
+
+
+def test_ttl_cache_caches_falsy_values():
+    cache = TTLCache(max_entries=10, ttl=60)
+    cache.put(("b", "u"), False)
+    assert cache.get(("b", "u"), default="missing") is False
+
+
+def test_ttl_cache_discard_prefix():
+    cache = TTLCache(max_entries=10, ttl=60)
+    cache.put(("b1", "u1"), 1)
+    cache.put(("b1", "u2"), 2)
+    cache.put(("b2", "u1"), 3)
+    cache.discard_prefix("b1")
+    assert cache.get(("b1", "u1")) is None
+    assert cache.get(("b2", "u1")) == 3
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_entries=2, ttl=60)
+    cache.put(("a",), 1)
+    cache.put(("b",), 2)
+    cache.get(("a",))
+    cache.put(("c",), 3)
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == 1
@@ -54,3 +54,197 @@ def test_seed_db_succeeds_on_empty_db(memory_session):
     col_count, card_count = asyncio.run(_run())
     assert col_count == 5
     assert card_count == 8
+
+
+def test_run_migrations_adds_board_version_to_old_schema():
+    """run_migrations must upgrade a database created before boards.version existed."""
+    from sqlalchemy import inspect
+    from app.database import MIGRATIONS, run_migrations
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+
+    async def _run():
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql("CREATE TABLE users (id VARCHAR PRIMARY KEY, username VARCHAR NOT NULL, password VARCHAR NOT NULL)")
+            await conn.exec_driver_sql("CREATE TABLE boards (id VARCHAR PRIMARY KEY, title VARCHAR NOT NULL, owner_id VARCHAR NOT NULL)")
+            await conn.run_sync(run_migrations)
+            columns = await conn.run_sync(lambda c: [col["name"] for col in inspect(c).get_columns("boards")])
+            user_version = (await conn.exec_driver_sql("PRAGMA user_version")).scalar()
+        await engine.dispose()
+        return columns, user_version
+
+    columns, user_version = asyncio.run(_run())
+    assert "version" in columns
+    assert user_version == len(MIGRATIONS)
+
+
+def test_run_migrations_spreads_dense_positions():
+    """Dense 0-based positions from older databases must be spread out to sparse ranks."""
+    from app.database import MIGRATIONS, _spread_positions, run_migrations
+    from app.models.ranking import RANK_GAP
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+
+    async def _run():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.exec_driver_sql("INSERT INTO users VALUES ('u', 'u', 'p')")
+            await conn.exec_driver_sql("INSERT INTO boards (id, title, owner_id, version) VALUES ('b', 'B', 'u', 0)")
+            await conn.exec_driver_sql("INSERT INTO kanban_columns VALUES ('c', 'C', 0, 'b')")
+            await conn.exec_driver_sql(
+                "INSERT INTO kanban_cards (id, title, details, column_id, position) VALUES ('k0', 'K', '', 'c', 0), ('k1', 'K', '', 'c', 1)"
+            )
+            await conn.exec_driver_sql(f"PRAGMA user_version = {MIGRATIONS.index(_spread_positions)}")
+            await conn.run_sync(run_migrations)
+            cards = (await conn.exec_driver_sql("SELECT position FROM kanban_cards ORDER BY position")).scalars().all()
+            cols = (await conn.exec_driver_sql("SELECT position FROM kanban_columns")).scalars().all()
+        await engine.dispose()
+        return cards, cols
+
+    cards, cols = asyncio.run(_run())
+    assert cards == [RANK_GAP, 2 * RANK_GAP]
+    assert cols == [RANK_GAP]
+
+
+
+def test_run_migrations_hashes_plaintext_passwords():
+    """Plaintext passwords from older databases must be replaced with scrypt hashes."""
+    from app.auth.passwords import verify_password
+    from app.database import MIGRATIONS, _hash_passwords, run_migrations
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+
+    async def _run():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.exec_driver_sql("INSERT INTO users VALUES ('u', 'u', 'hunter2')")
+            await conn.exec_driver_sql(f"PRAGMA user_version = {MIGRATIONS.index(_hash_passwords)}")
+            await conn.run_sync(run_migrations)
+            stored = (await conn.exec_driver_sql("SELECT password FROM users")).scalar()
+        await engine.dispose()
+        return stored
+
+    stored = asyncio.run(_run())
+    assert stored.startswith("scrypt$")
+    assert verify_password("hunter2", stored)
+
+
+def test_run_migrations_adds_indexes_to_existing_tables():
+    """Indexes declared on the models must be created on databases that predate them."""
+    from app.database import MIGRATIONS, _add_indexes, run_migrations
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+
+    async def _run():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.exec_driver_sql("DROP INDEX ix_kanban_cards_column_position")
+            await conn.exec_driver_sql("DROP INDEX ix_board_members_user_id")
+            await conn.exec_driver_sql("INSERT INTO users VALUES ('u', 'u', 'scrypt$x')")
+            await conn.exec_driver_sql(f"PRAGMA user_version = {MIGRATIONS.index(_add_indexes)}")
+            await conn.run_sync(run_migrations)
+            names = (await conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")).scalars().all()
+        await engine.dispose()
+        return set(names)
+
+    names = asyncio.run(_run())
+    assert {"ix_kanban_cards_column_position", "ix_board_members_user_id", "ix_kanban_columns_board_position"} <= names
+
+
+def test_run_migrations_adds_card_updated_at():
+    """Cards from databases that predate updated_at are stamped with the migration time."""
+    import time
+    from app.database import MIGRATIONS, _add_card_updated_at, run_migrations
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+
+    async def _run():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.exec_driver_sql("ALTER TABLE kanban_cards DROP COLUMN updated_at")
+            await conn.exec_driver_sql("INSERT INTO users VALUES ('u', 'u', 'scrypt$x')")
+            await conn.exec_driver_sql("INSERT INTO boards (id, title, owner_id, version) VALUES ('b', 'B', 'u', 0)")
+            await conn.exec_driver_sql("INSERT INTO kanban_columns VALUES ('c', 'C', 1024, 'b')")
+            await conn.exec_driver_sql("INSERT INTO kanban_cards (id, title, details, column_id, position) VALUES ('k', 'K', '', 'c', 1024)")
+            await conn.exec_driver_sql(f"PRAGMA user_version = {MIGRATIONS.index(_add_card_updated_at)}")
+            await conn.run_sync(run_migrations)
+            stamp = (await conn.exec_driver_sql("SELECT updated_at FROM kanban_cards")).scalar()
+        await engine.dispose()
+        return stamp
+
+    start = time.time()
+    assert asyncio.run(_run()) >= start
+
+
+def test_run_migrations_rekeys_cards_for_search():
+    """Cards keyed only by their string id are rebuilt around seq, and search still finds them after VACUUM."""
+    from sqlalchemy import inspect, text
+    from app.database import MIGRATIONS, _add_card_search, run_migrations
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    old_ddl = [
+        "CREATE VIRTUAL TABLE kanban_cards_fts USING fts5(title, details, content='kanban_cards', content_rowid='rowid')",
+        "CREATE TRIGGER kanban_cards_fts_insert AFTER INSERT ON kanban_cards BEGIN "
+        "INSERT INTO kanban_cards_fts (rowid, title, details) VALUES (new.rowid, new.title, new.details); END",
+    ]
+
+    async def _run():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.exec_driver_sql("DROP TABLE kanban_cards")
+            await conn.exec_driver_sql("DROP TABLE kanban_cards_fts")
+            await conn.exec_driver_sql(
+                "CREATE TABLE kanban_cards (id VARCHAR PRIMARY KEY, title VARCHAR NOT NULL, details VARCHAR, "
+                "column_id VARCHAR NOT NULL, position INTEGER NOT NULL, created_by_id VARCHAR, assigned_to_id VARCHAR, "
+                "updated_at FLOAT NOT NULL DEFAULT 0)"
+            )
+            await conn.exec_driver_sql("CREATE INDEX ix_kanban_cards_column_position ON kanban_cards (column_id, position)")
+            for statement in old_ddl:
+                await conn.exec_driver_sql(statement)
+            await conn.exec_driver_sql("INSERT INTO users VALUES ('u', 'u', 'scrypt$x')")
+            await conn.exec_driver_sql("INSERT INTO boards (id, title, owner_id, version) VALUES ('b', 'B', 'u', 0)")
+            await conn.exec_driver_sql("INSERT INTO kanban_columns VALUES ('c', 'C', 1024, 'b')")
+            await conn.exec_driver_sql(
+                "INSERT INTO kanban_cards (id, title, details, column_id, position) VALUES "
+                "('k1', 'alpha', '', 'c', 1024), ('k2', 'beta', '', 'c', 2048), ('k3', 'gamma', '', 'c', 3072)"
+            )
+            await conn.exec_driver_sql(f"PRAGMA user_version = {MIGRATIONS.index(_add_card_search)}")
+            await conn.run_sync(run_migrations)
+            pk = await conn.run_sync(lambda c: inspect(c).get_pk_constraint("kanban_cards")["constrained_columns"])
+            await conn.exec_driver_sql("DELETE FROM kanban_cards WHERE id = 'k1'")
+        async with engine.connect() as conn:
+            await (await conn.execution_options(isolation_level="AUTOCOMMIT")).exec_driver_sql("VACUUM")
+        async with engine.connect() as conn:
+            found = (await conn.execute(text(
+                "SELECT kanban_cards.id FROM kanban_cards_fts JOIN kanban_cards ON kanban_cards.seq = kanban_cards_fts.rowid "
+                "WHERE kanban_cards_fts MATCH 'gamma'"
+            ))).scalars().all()
+            ids = (await conn.exec_driver_sql("SELECT id FROM kanban_cards ORDER BY position")).scalars().all()
+        await engine.dispose()
+        return pk, found, ids
+
+    pk, found, ids = asyncio.run(_run())
+    assert pk == ["seq"]
+    assert ids == ["k2", "k3"]
+    assert found == ["k3"]
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    """Connections get the WAL profile from config."""
+    from sqlalchemy import event
+    from app.database import set_sqlite_pragma
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'wal.db'}", echo=False)
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragma)
+
+    async def _run():
+        async with engine.connect() as conn:
+            values = {
+                pragma: (await conn.exec_driver_sql(f"PRAGMA {pragma}")).scalar()
+                for pragma in ("journal_mode", "synchronous", "busy_timeout", "foreign_keys", "temp_store")
+            }
+        await engine.dispose()
+        return values
+
+    values = asyncio.run(_run())
+    assert values == {"journal_mode": "wal", "synchronous": 1, "busy_timeout": 5000, "foreign_keys": 1, "temp_store": 2}
@@ -0,0 +1,34 @@
+"""Tests for scrypt password hashing."""
+import asyncio
+
+from app.auth.passwords import hash_password, needs_rehash, verify_password, verify_password_async
+
+
+def test_hash_round_trip():
+    stored = hash_password("s3cret")
+    assert stored.startswith("scrypt$")
+    assert verify_password("s3cret", stored)
+    assert not verify_password("wrong", stored)
+
+
+def test_hashes_are_salted():
+    assert hash_password("s3cret") != hash_password("s3cret")
+
+
+def test_legacy_plaintext_still_verifies_and_needs_rehash():
+    assert verify_password("password", "password")
+    assert not verify_password("other", "password")
+    assert needs_rehash("password")
+
+
+def test_current_hash_does_not_need_rehash():
+    assert not needs_rehash(hash_password("s3cret"))
+    assert needs_rehash("scrypt$1024$8$1$c2FsdA==$aGFzaA==")
+
+
+def test_malformed_hash_rejected():
+    assert not verify_password("s3cret", "scrypt$broken")
+
+
+def test_verify_runs_in_pool():
+    assert asyncio.run(verify_password_async("s3cret", hash_password("s3cret")))
@@ -1,4 +1,5 @@
 """Tests for token expiry and revocation (C1 remediation)."""
+import asyncio
 import time
 import pytest
 from app.auth.permissions import issue_token, revoke_token, _sessions
@@ -7,21 +8,21 @@ BOARD_ID = "board-1"
 
 
 def test_issued_token_has_future_expiry():
-    token = issue_token("user-1", "user")
+    token = asyncio.run(issue_token("user-1", "user"))
     assert token in _sessions
     assert _sessions[token].expiry > time.time()
-    revoke_token(token)
+    asyncio.run(revoke_token(token))
 
 
 def test_revoke_token_removes_it():
-    token = issue_token("user-1", "user")
-    revoke_token(token)
+    token = asyncio.run(issue_token("user-1", "user"))
+    asyncio.run(revoke_token(token))
     assert token not in _sessions
 
 
 def test_expired_token_rejected(client):
     """An expired token must be rejected with 401."""
-    token = issue_token("user-1", "user")
+    token = asyncio.run(issue_token("user-1", "user"))
     # Back-date the expiry to the past
     _sessions[token].expiry = time.time() - 1
 
@@ -33,8 +34,23 @@ def test_expired_token_rejected(client):
 
 def test_expired_token_cleaned_up_on_check(client):
     """Checking an expired token must remove it from the store."""
-    token = issue_token("user-1", "user")
+    token = asyncio.run(issue_token("user-1", "user"))
     _sessions[token].expiry = time.time() - 1
 
     client.get(f"/api/boards/{BOARD_ID}", headers={"Authorization": f"Bearer {token}"})
     assert token not in _sessions
+
+
+def test_session_sweeper_removes_expired_tokens():
+    from app.auth.permissions import run_session_sweeper
+
+    token = asyncio.run(issue_token("user-1", "user"))
+    _sessions[token].expiry = time.time() - 1
+
+    async def run():
+        sweeper = asyncio.create_task(run_session_sweeper(0.01))
+        await asyncio.sleep(0.05)
+        sweeper.cancel()
+
+    asyncio.run(run())
+    assert token not in _sessions
@@ -0,0 +1,96 @@
+"""Tests for the compact AI prompt encoding."""
+from app.prompt import encode_board, expand_operations
+
+
+def _board(n_cards=3, details="short"):
+    cards = {f"card-{i}": {"id": f"card-{i}", "title": f"Task {i}", "details": details} for i in range(n_cards)}
+    return {
+        "columns": [
+            {"id": "col-todo", "title": "To Do", "cardIds": [f"card-{i}" for i in range(n_cards)]},
+            {"id": "col-done", "title": "Done", "cardIds": []},
+        ],
+        "cards": cards,
+    }
+
+
+def test_encode_board_uses_short_aliases():
+    board = _board()
+    board["cards"]["card-1"]["assigned_to"] = "alice"
+    prompt = encode_board(board, max_cards=100, details_chars=100)
+
+    assert prompt.text.splitlines() == [
+        "## C1 To Do",
+        "K1 | Task 0 | short",
+        "K2 | Task 1 | short | @alice",
+        "K3 | Task 2 | short",
+        "## C2 Done",
+    ]
+    assert prompt.aliases["C1"] == "col-todo"
+    assert prompt.aliases["K3"] == "card-2"
+    assert "card-0" not in prompt.text
+
+
+def test_encode_board_clips_details():
+    prompt = encode_board(_board(details="word " * 100), max_cards=100, details_chars=20)
+    assert all(len(line) < 60 for line in prompt.text.splitlines())
+    assert prompt.clipped_details["card-0"].endswith("…")
+
+
+def test_encode_board_selects_relevant_cards():
+    board = _board(n_cards=10)
+    board["cards"]["card-7"]["title"] = "Fix login bug"
+    prompt = encode_board(board, query="what about the login bug?", max_cards=2)
+
+    shown = set(prompt.aliases.values())
+    assert "card-7" in shown and "card-0" in shown
+    assert len(prompt.hidden_card_ids) == 8
+    assert "(+8 more cards not shown)" in prompt.text
+
+
+def test_expand_operations_maps_aliases():
+    board = _board(details="x" * 300)
+    prompt = encode_board(board, max_cards=100, details_chars=20)
+    ops = [
+        {"op": "move_card", "card_id": "K1", "column_id": "C2"},
+        {"op": "edit_card", "card_id": "K2", "title": "Renamed", "details": prompt.clipped_details["card-1"]},
+        {"op": "edit_card", "card_id": "K3", "details": "rewritten"},
+        {"op": "rename_column", "column_id": "C1", "title": "Backlog"},
+        {"op": "add_card", "column_id": "C2", "title": "New"},
+    ]
+
+    expanded = expand_operations(ops, board, prompt)
+
+    assert expanded == [
+        {"op": "move_card", "card_id": "card-0", "column_id": "col-done"},
+        {"op": "edit_card", "card_id": "card-1", "title": "Renamed"},
+        {"op": "edit_card", "card_id": "card-2", "details": "rewritten"},
+        {"op": "rename_column", "column_id": "col-todo", "title": "Backlog"},
+        {"op": "add_card", "column_id": "col-done", "title": "New"},
+    ]
+
+
+def test_expand_operations_shifts_indexes_past_hidden_cards():
+    board = _board(n_cards=5)
+    board["cards"]["card-3"]["title"] = "Relevant"
+    prompt = encode_board(board, query="relevant", max_cards=2)
+    assert prompt.hidden_card_ids == {"card-1", "card-2", "card-4"}
+
+    # The model sees [K1=card-0, K2=card-3]; index 1 means "before card-3"
+    ops = [{"op": "add_card", "column_id": "C1", "title": "New", "index": 1}]
+
+    assert expand_operations(ops, board, prompt)[0]["index"] == 3
+
+
+def test_expand_operations_clamps_negative_indexes_to_the_top():
+    board = _board(n_cards=5)
+    board["cards"]["card-3"]["title"] = "Relevant"
+    prompt = encode_board(board, query="relevant", max_cards=2)
+
+    ops = [
+        {"op": "add_card", "column_id": "C1", "title": "New", "index": -1},
+        {"op": "add_card", "column_id": "C1", "title": "Last", "index": 2},
+    ]
+    expanded = expand_operations(ops, board, prompt)
+
+    assert expanded[0]["index"] == 0
+    assert expanded[1]["index"] is None  # past the last shown card: append
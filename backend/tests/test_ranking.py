@@ -0,0 +1,49 @@
+"""Tests for sparse rank assignment."""
+from app.models.ranking import RANK_GAP, assign_ranks, rank_between, spaced_ranks
+
+
+def _is_increasing(ranks):
+    return all(a < b for a, b in zip(ranks, ranks[1:]))
+
+
+def test_spaced_ranks():
+    assert spaced_ranks(3) == [RANK_GAP, 2 * RANK_GAP, 3 * RANK_GAP]
+
+
+def test_rank_between():
+    assert rank_between(None, None) == RANK_GAP
+    assert rank_between(RANK_GAP, None) == 2 * RANK_GAP
+    assert rank_between(None, RANK_GAP) == 0
+    assert rank_between(None, 0) == -RANK_GAP
+    assert rank_between(10, 20) == 15
+    assert rank_between(10, 11) is None
+
+
+def test_assign_ranks_unchanged_order_keeps_ranks():
+    ranks = spaced_ranks(5)
+    assert assign_ranks(ranks) == ranks
+
+
+def test_assign_ranks_move_to_top_changes_one_rank():
+    ranks = spaced_ranks(500)
+    moved = [ranks[-1]] + ranks[:-1]
+    result = assign_ranks(moved)
+    assert _is_increasing(result)
+    assert sum(1 for old, new in zip(moved, result) if old != new) == 1
+
+
+def test_assign_ranks_new_items_fill_gaps():
+    result = assign_ranks([None, RANK_GAP, None, None, 2 * RANK_GAP, None])
+    assert _is_increasing(result)
+    assert result[1] == RANK_GAP and result[4] == 2 * RANK_GAP
+
+
+def test_assign_ranks_respaces_when_gap_exhausted():
+    result = assign_ranks([1, None, 2])
+    assert result == spaced_ranks(3)
+
+
+def test_assign_ranks_legacy_dense_positions():
+    result = assign_ranks([None, 0, 1, 2, None])
+    assert _is_increasing(result)
+    assert result[1:4] == [0, 1, 2]
@@ -0,0 +1,42 @@
+"""Tests for the in-process board event hub."""
+import asyncio
+import json
+
+from app.realtime import CLOSE, CLOSE_FORBIDDEN, CLOSE_TRY_AGAIN, BoardHub
+
+
+def _drain(queue: asyncio.Queue) -> list:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def test_publish_reaches_only_that_boards_subscribers():
+    hub = BoardHub()
+    a = hub.subscribe("board-1", "user-1")
+    b = hub.subscribe("board-2", "user-1")
+    assert hub.publish("board-1", {"kind": "ops"}) == 1
+    assert [json.loads(m) for m in _drain(a.queue)] == [{"kind": "ops"}]
+    assert _drain(b.queue) == []
+
+
+def test_full_queue_closes_subscriber():
+    hub = BoardHub()
+    sub = hub.subscribe("board-1", "user-1")
+    for i in range(sub.queue.maxsize + 1):
+        hub.publish("board-1", {"n": i})
+    assert _drain(sub.queue)[-1] is CLOSE
+    assert sub.close_code == CLOSE_TRY_AGAIN
+    assert hub.stats() == {"boards": 0, "connections": 0}
+
+
+def test_disconnect_single_user():
+    hub = BoardHub()
+    alice = hub.subscribe("board-1", "user-2")
+    bob = hub.subscribe("board-1", "user-3")
+    hub.disconnect("board-1", "user-3", code=CLOSE_FORBIDDEN)
+    assert _drain(bob.queue) == [CLOSE]
+    assert bob.close_code == CLOSE_FORBIDDEN
+    assert _drain(alice.queue) == []
+    assert hub.stats()["connections"] == 1
@@ -0,0 +1,140 @@
+"""Round-trip tests for the session store backends."""
+import asyncio
+import time
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.auth.sessions import (
+    FakeRedis,
+    MemorySessionStore,
+    RedisSessionStore,
+    SessionData,
+    SqliteSessionStore,
+    build_session_store,
+)
+
+
+def _session(token: str = "tok-1", ttl: float = 60) -> SessionData:
+    return SessionData(token=token, user_id="user-1", username="user", expiry=time.time() + ttl)
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def store(request, db_engine):
+    if request.param == "memory":
+        return MemorySessionStore()
+    if request.param == "sqlite":
+        return SqliteSessionStore(async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False))
+    return RedisSessionStore(FakeRedis())
+
+
+def test_put_get_delete_round_trip(store):
+    async def run():
+        session = _session()
+        await store.put(session)
+        assert await store.get("tok-1") == session
+        await store.delete("tok-1")
+        assert await store.get("tok-1") is None
+
+    asyncio.run(run())
+
+
+def test_get_unknown_token_returns_none(store):
+    assert asyncio.run(store.get("missing")) is None
+
+
+def test_delete_unknown_token_is_noop(store):
+    asyncio.run(store.delete("missing"))
+
+
+def test_revoke_round_trip(store):
+    async def run():
+        assert not await store.is_revoked("tok-1")
+        await store.revoke("tok-1", time.time() + 60)
+        await store.revoke("tok-1", time.time() + 60)  # logging out twice is harmless
+        return await store.is_revoked("tok-1"), await store.is_revoked("tok-2")
+
+    assert asyncio.run(run()) == (True, False)
+
+
+def test_redis_store_sets_ttl_from_expiry():
+    redis = FakeRedis()
+    store = RedisSessionStore(redis)
+    asyncio.run(store.put(_session(ttl=-5)))
+    # Already-expired sessions still get the minimum 1s TTL and vanish with it
+    assert redis._data["session:tok-1"][1] <= time.time() + 1
+
+
+def test_build_session_store_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        build_session_store("memcached")
+
+
+def test_build_session_store_redis_requires_url():
+    with pytest.raises(ValueError):
+        build_session_store("redis", "")
+
+
+def test_sqlite_sessions_visible_across_store_instances(db_engine):
+    """Two workers sharing one database see each other's tokens."""
+    maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    worker_a, worker_b = SqliteSessionStore(maker), SqliteSessionStore(maker)
+
+    async def run():
+        await worker_a.put(_session("shared"))
+        assert (await worker_b.get("shared")).user_id == "user-1"
+        await worker_b.delete("shared")
+        assert await worker_a.get("shared") is None
+
+    asyncio.run(run())
+
+
+def test_sweep_removes_only_expired_sessions(store):
+    async def run():
+        await store.put(_session("live", ttl=600))
+        await store.put(_session("stale", ttl=60))
+        return await store.sweep(time.time() + 120)
+
+    removed = asyncio.run(run())
+    if isinstance(store, RedisSessionStore):
+        assert removed == 0  # Redis expires keys itself
+        return
+    assert removed == 1
+    assert asyncio.run(store.get("stale")) is None
+    assert asyncio.run(store.get("live")) is not None
+
+
+def test_memory_store_evicts_least_recently_used():
+    store = MemorySessionStore(max_sessions=2)
+
+    async def run():
+        await store.put(_session("a"))
+        await store.put(_session("b"))
+        await store.get("a")  # "b" is now the least recently used
+        await store.put(_session("c"))
+
+    asyncio.run(run())
+    assert list(store.sessions) == ["a", "c"]
+    assert store.evicted == 1
+
+
+def test_memory_store_stats_report_count_and_size():
+    store = MemorySessionStore(max_sessions=10)
+    asyncio.run(store.put(_session("a")))
+    stats = asyncio.run(store.stats())
+    assert stats["backend"] == "memory"
+    assert stats["sessions"] == 1
+    assert stats["bytes"] > 0
+    assert stats["max_sessions"] == 10
+
+
+def test_sqlite_store_stats_count_rows(db_engine):
+    maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    store = SqliteSessionStore(maker)
+    asyncio.run(store.put(_session("a")))
+    assert asyncio.run(store.stats())["sessions"] == 1
+
+
+def test_metrics_endpoint_reports_sessions(client, auth_headers):
+    resp = client.get("/api/metrics")
+    assert resp.status_code == 200
+    assert resp.json()["sessions"]["sessions"] >= 1
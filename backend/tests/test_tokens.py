@@ -0,0 +1,95 @@
+"""Tests for HMAC-signed tokens and the signed AUTH_TOKEN_MODE."""
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.auth import permissions
+from app.auth.sessions import SqliteSessionStore
+from app.auth.tokens import sign_token, verify_token
+
+SECRET = b"test-secret"
+
+
+@pytest.fixture
+def signed_mode(monkeypatch):
+    monkeypatch.setattr("app.auth.permissions.config.AUTH_TOKEN_MODE", "signed")
+    monkeypatch.setattr("app.auth.permissions.config.AUTH_SECRET", "test-secret")
+
+
+def test_signed_token_round_trip():
+    expiry = time.time() + 60
+    session = verify_token(sign_token("user-1", "user", expiry, SECRET), SECRET)
+    assert session.user_id == "user-1"
+    assert session.username == "user"
+    assert session.expiry == int(expiry)
+
+
+def test_signed_tokens_are_unique():
+    expiry = time.time() + 60
+    assert sign_token("user-1", "user", expiry, SECRET) != sign_token("user-1", "user", expiry, SECRET)
+
+
+@pytest.mark.parametrize("mangle", [
+    lambda t: t[:-2] + ("AA" if not t.endswith("AA") else "BB"),  # bad signature
+    lambda t: "e30" + t[t.index("."):],  # payload swapped for "{}"
+    lambda t: t.replace(".", ""),  # no separator
+    lambda t: t + "é",  # non-ascii
+])
+def test_tampered_token_rejected(mangle):
+    token = sign_token("user-1", "user", time.time() + 60, SECRET)
+    assert verify_token(mangle(token), SECRET) is None
+
+
+def test_token_signed_with_other_secret_rejected():
+    token = sign_token("user-1", "user", time.time() + 60, b"other")
+    assert verify_token(token, SECRET) is None
+
+
+def test_signed_mode_login_and_logout(client, signed_mode):
+    token = client.post("/api/auth/login", json={"username": "user", "password": "password"}).json()["token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    assert token not in permissions._sessions
+    assert client.get("/api/boards/board-1", headers=headers).status_code == 200
+
+    assert client.post("/api/auth/logout", headers=headers).status_code == 204
+    assert client.get("/api/boards/board-1", headers=headers).status_code == 401
+
+
+def test_signed_mode_rejects_expired_token(client, signed_mode):
+    token = sign_token("user-1", "user", time.time() - 1, b"test-secret")
+    resp = client.get("/api/boards/board-1", headers={"Authorization": f"Bearer {token}"})
+    assert resp.status_code == 401
+
+
+def test_sweep_prunes_expired_revocations(signed_mode):
+    store = permissions.get_session_store()
+    asyncio.run(store.revoke("old", time.time() - 1))
+    asyncio.run(permissions.sweep_expired_sessions())
+    assert not asyncio.run(store.is_revoked("old"))
+
+
+def test_signed_mode_logout_is_seen_by_other_workers(client, signed_mode, db_engine, monkeypatch):
+    """Two workers sharing a SQLite store: a logout on one is refused on the other."""
+    maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    worker_a, worker_b = SqliteSessionStore(maker), SqliteSessionStore(maker)
+    token = client.post("/api/auth/login", json={"username": "user", "password": "password"}).json()["token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    monkeypatch.setattr(permissions, "_store", worker_a)
+    assert client.post("/api/auth/logout", headers=headers).status_code == 204
+    monkeypatch.setattr(permissions, "_store", worker_b)
+    assert client.get("/api/boards/board-1", headers=headers).status_code == 401
+
+
+def test_signed_mode_refuses_to_start_without_secret():
+    env = {**os.environ, "AUTH_TOKEN_MODE": "signed", "AUTH_SECRET": ""}
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", "import app.main"], cwd=backend, env=env, capture_output=True, text=True,
+    )
+    assert result.returncode != 0
+    assert "AUTH_TOKEN_MODE=signed requires AUTH_SECRET" in result.stderr
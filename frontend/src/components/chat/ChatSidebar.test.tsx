@@ -55,7 +55,7 @@ beforeEach(() => {
   useChatStore.setState({ messages: [] });
   vi.mocked(api.fetchBoard).mockResolvedValue(structuredClone(mockBoard));
   vi.mocked(api.updateBoard).mockImplementation((_boardId, board) => Promise.resolve(board));
-  vi.mocked(api.sendChat).mockResolvedValue({ message: "I can help!", board_update: null });
+  vi.mocked(api.sendChat).mockResolvedValue({ message: "I can help!", changes: null });
 });
 
 describe("ChatSidebar", () => {
@@ -88,7 +88,7 @@ describe("ChatSidebar", () => {
   it("AI response message appears in message list", async () => {
     vi.mocked(api.sendChat).mockResolvedValue({
       message: "Here is the board summary.",
-      board_update: null,
+      changes: null,
     });
 
     render(<ChatSidebar />, { wrapper });
@@ -101,13 +101,17 @@ describe("ChatSidebar", () => {
     expect(await screen.findByText("Here is the board summary.")).toBeInTheDocument();
   });
 
-  it("calls updateBoard when board_update is returned", async () => {
-    const updatedBoard = structuredClone(mockBoard);
-    updatedBoard.columns[0].title = "Updated Backlog";
-
+  it("refetches the board when changes are returned", async () => {
     vi.mocked(api.sendChat).mockResolvedValue({
       message: "Done.",
-      board_update: updatedBoard,
+      changes: {
+        version: 2,
+        columns: [],
+        cards: {},
+        deleted_card_ids: [],
+        deleted_column_ids: [],
+        column_order: null,
+      },
     });
 
     render(<ChatSidebar />, { wrapper });
@@ -117,7 +121,8 @@ describe("ChatSidebar", () => {
     await userEvent.type(input, "Update the board");
     await userEvent.click(screen.getByTestId("chat-send"));
 
-    await waitFor(() => expect(api.updateBoard).toHaveBeenCalledWith(BOARD_ID, updatedBoard));
+    await waitFor(() => expect(api.fetchBoard).toHaveBeenCalledTimes(2));
+    expect(api.updateBoard).not.toHaveBeenCalled();
   });
 
   it("does not add user message to store when sendChat fails", async () => {
@@ -4,7 +4,7 @@ import { useState } from "react";
 import { MessageCircle, SendHorizonal } from "lucide-react";
 import { useQueryClient } from "@tanstack/react-query";
 import { useChatStore } from "@/lib/chat";
-import { sendChat, updateBoard } from "@/lib/api";
+import { sendChat } from "@/lib/api";
 import { useQuery } from "@tanstack/react-query";
 import { fetchBoard } from "@/lib/api";
 import { useAuthStore } from "@/lib/auth";
@@ -52,8 +52,8 @@ export function ChatSidebar() {
       addMessage(userMsg);
       addMessage({ role: "assistant", content: response.message });
 
-      if (response.board_update) {
-        await updateBoard(activeBoardId, response.board_update);
+      if (response.changes) {
+        // The server already applied the AI's changes; just refetch
         queryClient.invalidateQueries({ queryKey: ["board", activeBoardId] });
       }
     } catch {
@@ -1,11 +1,20 @@
 import { useAuthStore } from "@/lib/auth";
 import { queryClient } from "@/lib/queryClient";
-import type { BoardData, BoardSummary, Member, Card } from "@/lib/kanban";
+import type { BoardData, BoardSummary, Member, Card, Column } from "@/lib/kanban";
 import type { ChatMessage } from "@/lib/chat";
 
+export type BoardChanges = {
+  version: number;
+  columns: Column[];
+  cards: Record<string, Card>;
+  deleted_card_ids: string[];
+  deleted_column_ids: string[];
+  column_order: string[] | null;
+};
+
 export type ChatResponse = {
   message: string;
-  board_update: BoardData | null;
+  changes: BoardChanges | null;
 };
 
 function authHeaders(): Record<string, string> {
@@ -53,7 +53,7 @@ test.beforeEach(async ({ page }) => {
     await route.fulfill({
       status: 200,
       contentType: "application/json",
-      body: JSON.stringify({ message: "The board has 5 columns and 8 cards.", board_update: null }),
+      body: JSON.stringify({ message: "The board has 5 columns and 8 cards.", changes: null }),
     });
   });
 });
@@ -81,7 +81,7 @@ test("login → open sidebar → type message → AI responds", async ({ page })
   ).toBeVisible();
 });
 
-test("AI response with board_update refreshes the board without page reload", async ({ page }) => {
+test("AI response with changes refreshes the board without page reload", async ({ page }) => {
   const updatedBoard = JSON.parse(JSON.stringify(INITIAL_BOARD));
   updatedBoard.columns[0].title = "AI Updated Backlog";
   updatedBoard.columns[0].cardIds = ["card-1"];
@@ -94,26 +94,25 @@ test("AI response with board_update refreshes the board without page reload", as
       contentType: "application/json",
       body: JSON.stringify({
         message: "I moved card-2 to In Progress.",
-        board_update: updatedBoard,
+        changes: {
+          version: 1,
+          columns: [updatedBoard.columns[0], updatedBoard.columns[2]],
+          cards: {},
+          deleted_card_ids: [],
+          deleted_column_ids: [],
+          column_order: null,
+        },
       }),
     });
   });
 
   // Also update the board mock so the re-fetch returns the updated board
   await page.route("/api/board", async (route) => {
-    if (route.request().method() === "PATCH") {
-      await route.fulfill({
-        status: 200,
-        contentType: "application/json",
-        body: JSON.stringify(updatedBoard),
-      });
-    } else {
-      await route.fulfill({
-        status: 200,
-        contentType: "application/json",
-        body: JSON.stringify(updatedBoard),
-      });
-    }
+    await route.fulfill({
+      status: 200,
+      contentType: "application/json",
+      body: JSON.stringify(updatedBoard),
+    });
   });
 
   await login(page);
@@ -122,11 +121,11 @@ test("AI response with board_update refreshes the board without page reload", as
   await page.getByTestId("chat-input").fill("Move card-2 to In Progress");
 
   // Register before click to avoid race condition with fast mocks
-  const patchDone = page.waitForResponse(
-    (r) => r.url().includes("/api/board") && r.request().method() === "PATCH"
+  const refetchDone = page.waitForResponse(
+    (r) => r.url().includes("/api/board") && r.request().method() === "GET"
   );
   await page.getByTestId("chat-send").click();
 
   await expect(page.getByText("I moved card-2 to In Progress.")).toBeVisible();
-  await patchDone;
+  await refetchDone;
 });